@@ -0,0 +1,132 @@
+import gc
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+def time_operation(setup, operation, size, shrinks=False, min_time=0.2, max_calls=10**6):
+    """Measures the throughput of ``operation`` on a container of ``size`` elements
+
+    :param callable setup: Called with ``size``; returns a fresh container
+    :param callable operation: Called with ``(container, calls)``; must perform the
+    operation ``calls`` times and be free of any other per-call work
+    :param int size: The number of elements in the container before timing starts
+    :param bool shrinks: If ``True``, each call removes an element, so no more than
+    ``size`` calls will be made against one container
+    :param float min_time: The minimum number of seconds to keep measuring for
+    :param int max_calls: An upper bound on the number of calls per measurement
+    :returns: The number of operations per second
+    :rtype: float
+    """
+    limit = min(max_calls, size) if shrinks else max_calls
+    calls = 1
+    while True:
+        container = setup(size)
+        gc.collect()
+        started = time.perf_counter()
+        operation(container, calls)
+        elapsed = time.perf_counter() - started
+        del container
+
+        if elapsed >= min_time or calls >= limit:
+            return calls / elapsed if elapsed > 0 else float('inf')
+
+        # Aim slightly past ``min_time`` so that the next run is usually the last one
+        estimate = int(calls * (min_time * 1.2) / max(elapsed, 1e-9))
+        calls = max(calls * 2, min(estimate, calls * 100))
+        calls = min(calls, limit)
+
+def measure_memory(build, size):
+    """Measures the memory taken up by a container of ``size`` elements
+
+    The values stored in the container should be shared (e.g. always ``None``) so
+    that only the memory owned by the container itself is accounted for.
+
+    :param callable build: Called with ``size``; returns the container
+    :param int size: The number of elements to build the container with
+    :returns: The peak number of bytes allocated while building and the number
+    of bytes still held by the container
+    :rtype: tuple
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        container = build(size)
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del container
+    return peak, current
+
+def environment():
+    """Returns a description of the environment the benchmarks are run in"""
+    return {
+        'python': sys.version,
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+    }
+
+def save_results(path, results):
+    """Saves the results as JSON, together with a description of the environment"""
+    with open(path, 'w') as handle:
+        json.dump({'environment': environment(), 'results': results},
+                  handle, indent=2, sort_keys=True)
+
+def load_results(path):
+    with open(path) as handle:
+        return json.load(handle)['results']
+
+def _result_key(result):
+    return (result['benchmark'], result['container'], result['operation'], result['size'])
+
+def compare_results(old, new):
+    """Pairs up the results of two runs
+
+    :param list old: The results of the baseline run
+    :param list new: The results of the run to compare against the baseline
+    :returns: ``(key, old_ops_per_sec, new_ops_per_sec, speedup)`` for every
+    measurement present in both runs
+    :rtype: list
+    """
+    old_by_key = dict((_result_key(result), result) for result in old)
+    rows = []
+    for result in new:
+        key = _result_key(result)
+        if key not in old_by_key:
+            continue
+        before = old_by_key[key].get('ops_per_sec')
+        after = result.get('ops_per_sec')
+        if before is None or after is None:
+            continue
+        rows.append((key, before, after, after / before if before else float('inf')))
+    return rows
+
+def format_results(results):
+    """Formats results as a human-readable table"""
+    header = '{:<22} {:<18} {:<26} {:>10} {:>14} {:>12} {:>10}'
+    line = '{:<22} {:<18} {:<26} {:>10} {:>14} {:>12} {:>10}'
+    rows = [header.format('benchmark', 'container', 'operation', 'size',
+                          'ops/sec', 'peak bytes', 'B/elem')]
+    for result in results:
+        ops_per_sec = result.get('ops_per_sec')
+        peak = result.get('peak_bytes')
+        per_element = result.get('bytes_per_element')
+        rows.append(line.format(
+            result['benchmark'], result['container'], result['operation'],
+            result['size'], '-' if ops_per_sec is None else '{:.1f}'.format(ops_per_sec),
+            '-' if peak is None else peak,
+            '-' if per_element is None else '{:.1f}'.format(per_element)))
+    return '\n'.join(rows)
+
+def format_comparison(rows):
+    """Formats the output of ``compare_results()`` as a human-readable table"""
+    header = '{:<22} {:<18} {:<26} {:>10} {:>14} {:>14} {:>9}'
+    line = '{:<22} {:<18} {:<26} {:>10} {:>14.1f} {:>14.1f} {:>8.2f}x'
+    lines = [header.format('benchmark', 'container', 'operation', 'size',
+                           'old ops/sec', 'new ops/sec', 'speedup')]
+    for key, before, after, speedup in rows:
+        lines.append(line.format(*(key + (before, after, speedup))))
+    return '\n'.join(lines)
@@ -0,0 +1,85 @@
+"""Throughput benchmarks for ``AsyncLinkedQueue``
+
+A producer coroutine puts `size` messages into a bounded queue while a consumer
+coroutine gets them, either one at a time or in batches, and the throughput is
+the number of messages moved per second. ``asyncio.Queue`` is measured
+alongside; it has no batched get, so its consumer drains the queue with
+``get_nowait()`` after every ``get()`` instead. Sizes over ``MAX_MESSAGES`` are
+skipped.
+"""
+import asyncio
+import time
+
+from pylinkedlist.asyncqueue import AsyncLinkedQueue
+
+MAX_MESSAGES = 10**6
+
+MAXSIZE = 1024
+
+BATCH = 64
+
+async def _produce(queue, count):
+    put = queue.put
+    for value in range(count):
+        await put(value)
+
+async def _consume(queue, count):
+    get = queue.get
+    for _ in range(count):
+        await get()
+
+async def _consume_batches(queue, count):
+    get_batch = queue.get_batch
+    got = 0
+    while got < count:
+        got += len(await get_batch(BATCH))
+
+async def _consume_drained(queue, count):
+    # The closest asyncio.Queue gets to a batch: drain what is there after a wakeup
+    get, get_nowait = queue.get, queue.get_nowait
+    got = 0
+    while got < count:
+        await get()
+        got += 1
+        while got < count and not queue.empty():
+            get_nowait()
+            got += 1
+
+async def _move(factory, consumer, count):
+    queue = factory(MAXSIZE)
+    await asyncio.gather(_produce(queue, count), consumer(queue, count))
+
+CONTAINERS = [
+    ('AsyncLinkedQueue', AsyncLinkedQueue, [
+        ('put/get', _consume),
+        ('put/get_batch({})'.format(BATCH), _consume_batches)]),
+    ('asyncio.Queue', asyncio.Queue, [
+        ('put/get', _consume),
+        ('put/get+get_nowait', _consume_drained)]),
+]
+
+def run(sizes, min_time=0.2):
+    """Moves `size` messages through every queue for every consumer
+
+    :param list sizes: The number of messages to move
+    :param float min_time: Unused; every measurement moves all the messages once
+    :returns: One result per queue, consumer and size
+    :rtype: list
+    """
+    results = []
+    for size in sizes:
+        if size > MAX_MESSAGES:
+            continue
+        for container_name, factory, consumers in CONTAINERS:
+            for operation, consumer in consumers:
+                started = time.perf_counter()
+                asyncio.run(_move(factory, consumer, size))
+                elapsed = time.perf_counter() - started
+                results.append({
+                    'benchmark': 'asyncqueue',
+                    'container': container_name,
+                    'operation': operation,
+                    'size': size,
+                    'ops_per_sec': size / elapsed,
+                })
+    return results
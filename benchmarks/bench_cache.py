@@ -0,0 +1,105 @@
+"""Benchmarks for ``LRUCache`` and ``LFUCache``
+
+Every cache is used cache-aside: each step looks a key up and caches it on a
+miss. The keys are drawn from a skewed distribution over four times as many keys
+as the cache holds. ``functools.lru_cache``, implemented in C, and an LRU cache
+built on ``collections.OrderedDict`` are measured alongside; the hit ratio of
+every cache is reported with its throughput.
+"""
+import random
+from collections import OrderedDict
+from functools import lru_cache
+
+from pylinkedlist import LFUCache, LRUCache
+from _harness import time_operation
+
+KEYS = 10**5
+
+class OrderedDictLRUCache(object):
+    """The usual LRU cache on top of ``OrderedDict``, for comparison"""
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def get(self, key, default=None):
+        entries = self._entries
+        if key in entries:
+            self.hits += 1
+            entries.move_to_end(key)
+            return entries[key]
+        self.misses += 1
+        return default
+
+    def put(self, key, value):
+        entries = self._entries
+        entries[key] = value
+        entries.move_to_end(key)
+        if len(entries) > self.maxsize:
+            entries.popitem(last=False)
+
+def _keys(size):
+    randomiser = random.Random(size)
+    return [int(randomiser.paretovariate(1.2) * size) % (4 * size) for _ in range(KEYS)]
+
+def _cache_aside(keys):
+    def operation(cache, count):
+        get, put = cache.get, cache.put
+        for i in range(count):
+            key = keys[i % KEYS]
+            if get(key) is None:
+                put(key, key)
+    return operation
+
+def _lru_cache(keys):
+    def operation(function, count):
+        for i in range(count):
+            function(keys[i % KEYS])
+    return operation
+
+def _lru_cache_factory(size):
+    return lru_cache(maxsize=size)(lambda key: key)
+
+def _hit_ratio(cache):
+    if hasattr(cache, 'cache_info'):
+        hits, misses = cache.cache_info()[:2]
+    else:
+        hits, misses = cache.hits, cache.misses
+    return hits / float(hits + misses) if hits + misses else None
+
+CONTAINERS = [
+    ('LRUCache', LRUCache, _cache_aside),
+    ('LFUCache', LFUCache, _cache_aside),
+    ('OrderedDict LRU', OrderedDictLRUCache, _cache_aside),
+    ('functools.lru_cache', _lru_cache_factory, _lru_cache),
+]
+
+def run(sizes, min_time=0.2):
+    """Runs the cache-aside workload for every cache and size
+
+    :param list sizes: The maximum number of entries of the caches
+    :param float min_time: The minimum number of seconds spent on each measurement
+    :returns: One result per cache and size
+    :rtype: list
+    """
+    results = []
+    for size in sizes:
+        keys = _keys(size)
+        for container_name, factory, workload in CONTAINERS:
+            operation = workload(keys)
+            ops_per_sec = time_operation(
+                factory, operation, size, min_time=min_time)
+
+            cache = factory(size)
+            operation(cache, KEYS)
+            results.append({
+                'benchmark': 'cache',
+                'container': container_name,
+                'operation': 'get/put',
+                'size': size,
+                'ops_per_sec': ops_per_sec,
+                'hit_ratio': _hit_ratio(cache),
+            })
+    return results
@@ -0,0 +1,99 @@
+"""Benchmarks for the end operations and iteration of ``DoublyLinkedList``
+
+``SinglyLinkedList`` and ``collections.deque`` are measured alongside; in
+particular ``remove_tail`` is O(1) for the doubly linked list and O(n) for the
+singly linked one.
+"""
+from collections import deque
+from itertools import repeat
+
+from pylinkedlist import DoublyLinkedList, SinglyLinkedList
+from _harness import measure_memory, time_operation
+
+CONTAINERS = [
+    ('DoublyLinkedList', DoublyLinkedList),
+    ('SinglyLinkedList', SinglyLinkedList),
+    ('deque', deque),
+]
+
+def _method_calls(name, *args):
+    def operation(container, count):
+        method = getattr(container, name)
+        for _ in repeat(None, count):
+            method(*args)
+    return operation
+
+def _iter(container, count):
+    for _ in repeat(None, count):
+        for _ in container:
+            pass
+
+def _reversed(container, count):
+    for _ in repeat(None, count):
+        for _ in reversed(container):
+            pass
+
+# Every entry is (operation, shrinks, {container name: operation function})
+OPERATIONS = [
+    ('append', False, {
+        'DoublyLinkedList': _method_calls('append', 0),
+        'SinglyLinkedList': _method_calls('append', 0),
+        'deque': _method_calls('append', 0)}),
+    ('prepend', False, {
+        'DoublyLinkedList': _method_calls('prepend', 0),
+        'SinglyLinkedList': _method_calls('prepend', 0),
+        'deque': _method_calls('appendleft', 0)}),
+    ('remove_head', True, {
+        'DoublyLinkedList': _method_calls('remove_head'),
+        'SinglyLinkedList': _method_calls('remove_head'),
+        'deque': _method_calls('popleft')}),
+    ('remove_tail', True, {
+        'DoublyLinkedList': _method_calls('remove_tail'),
+        'SinglyLinkedList': _method_calls('remove_tail'),
+        'deque': _method_calls('pop')}),
+    ('pop_tail', True, {
+        'DoublyLinkedList': _method_calls('pop_tail'),
+        'deque': _method_calls('pop')}),
+    ('__iter__', False, {
+        'DoublyLinkedList': _iter, 'SinglyLinkedList': _iter, 'deque': _iter}),
+    ('__reversed__', False, {
+        'DoublyLinkedList': _reversed, 'deque': _reversed}),
+]
+
+def run(sizes, min_time=0.2):
+    """Runs every benchmark for every size
+
+    :param list sizes: The number of elements in the container being measured
+    :param float min_time: The minimum number of seconds spent on each measurement
+    :returns: One result per container, operation and size
+    :rtype: list
+    """
+    results = []
+    for size in sizes:
+        for container_name, factory in CONTAINERS:
+            peak, current = measure_memory(
+                lambda size: factory(repeat(None, size)), size)
+            results.append({
+                'benchmark': 'doubly',
+                'container': container_name,
+                'operation': 'memory',
+                'size': size,
+                'ops_per_sec': None,
+                'peak_bytes': peak,
+                'bytes_per_element': current / float(size),
+            })
+
+            for operation, shrinks, functions in OPERATIONS:
+                function = functions.get(container_name)
+                if function is None:
+                    continue
+                results.append({
+                    'benchmark': 'doubly',
+                    'container': container_name,
+                    'operation': operation,
+                    'size': size,
+                    'ops_per_sec': time_operation(
+                        lambda size: factory(range(size)), function, size,
+                        shrinks=shrinks, min_time=min_time),
+                })
+    return results
@@ -0,0 +1,95 @@
+"""Microbenchmark of the per-call cost of length tracking
+
+``append``, ``prepend``, ``remove_head`` and ``remove_tail`` now update ``_length``
+in place. This compares the first three against the same methods wrapped in the
+``mutates_length`` decorator, which is how the length used to be tracked.
+"""
+from itertools import repeat
+
+from pylinkedlist import SinglyLinkedList
+from singly import _SinglyNode
+from _utils import mutates_length
+from _harness import time_operation
+
+class _DecoratedSinglyLinkedList(SinglyLinkedList):
+    """The mutators as they were, with ``_length`` left to ``mutates_length``"""
+
+    @mutates_length(always=True)
+    def append(self, value):
+        node = _SinglyNode(value)
+        if self.head is not None:
+            self.tail.next = node
+            self.tail = self.tail.next
+        else:
+            self.tail = node
+            self.head = self.tail
+
+    @mutates_length(always=True)
+    def prepend(self, value):
+        node = _SinglyNode(value)
+        node.next = self.head
+        if self.head is None:
+            self.tail = node
+        self.head = node
+
+    @mutates_length(decrements=True)
+    def remove_head(self):
+        if self.head is None:
+            return False
+
+        self.head = self.head.next
+        if self.head is None:
+            self.tail = self.head
+
+        return True
+
+CONTAINERS = [
+    ('in-place', SinglyLinkedList),
+    ('mutates_length', _DecoratedSinglyLinkedList),
+]
+
+def _append(container, count):
+    append = container.append
+    for _ in repeat(None, count):
+        append(0)
+
+def _prepend(container, count):
+    prepend = container.prepend
+    for _ in repeat(None, count):
+        prepend(0)
+
+def _remove_head(container, count):
+    remove_head = container.remove_head
+    for _ in repeat(None, count):
+        remove_head()
+
+OPERATIONS = [
+    ('append', False, _append),
+    ('prepend', False, _prepend),
+    ('remove_head', True, _remove_head),
+]
+
+def run(sizes, min_time=0.2):
+    """Measures the per-call latency of each length-tracking scheme
+
+    :param list sizes: The number of elements in the list being measured
+    :param float min_time: The minimum number of seconds spent on each measurement
+    :returns: One result per scheme, operation and size
+    :rtype: list
+    """
+    results = []
+    for size in sizes:
+        for container_name, factory in CONTAINERS:
+            for operation, shrinks, function in OPERATIONS:
+                ops_per_sec = time_operation(
+                    lambda size: factory(range(size)), function, size,
+                    shrinks=shrinks, min_time=min_time)
+                results.append({
+                    'benchmark': 'length_tracking',
+                    'container': container_name,
+                    'operation': operation,
+                    'size': size,
+                    'ops_per_sec': ops_per_sec,
+                    'seconds_per_op': 1.0 / ops_per_sec,
+                })
+    return results
@@ -0,0 +1,86 @@
+"""Multi-threaded throughput benchmarks for ``LinkedQueue``
+
+Producer threads put `size` messages in total while as many consumer threads
+get them, and the throughput is the number of messages moved per second.
+``queue.Queue`` and a bare ``collections.deque``, whose consumers poll rather
+than block, are measured alongside. Sizes over ``MAX_MESSAGES`` are skipped.
+
+Under the GIL the threads never run Python code in parallel, so these numbers
+measure the locking overhead and the contention between threads rather than
+any parallel speedup.
+"""
+import threading
+import time
+from collections import deque
+from queue import Queue
+
+from pylinkedlist.linkedqueue import LinkedQueue
+
+MAX_MESSAGES = 10**6
+
+THREADS = [1, 2, 4]
+
+def _blocking_consumer(queue, count):
+    get = queue.get
+    for _ in range(count):
+        get()
+
+def _polling_consumer(queue, count):
+    popleft = queue.popleft
+    got = 0
+    while got < count:
+        try:
+            popleft()
+        except IndexError:
+            time.sleep(0)
+            continue
+        got += 1
+
+def _producer(put, count):
+    for value in range(count):
+        put(value)
+
+CONTAINERS = [
+    ('LinkedQueue', LinkedQueue, 'put', _blocking_consumer),
+    ('queue.Queue', Queue, 'put', _blocking_consumer),
+    ('deque', deque, 'append', _polling_consumer),
+]
+
+def _measure(factory, put_name, consumer, threads, messages):
+    queue = factory()
+    share = messages // threads
+    workers = [threading.Thread(target=consumer, args=(queue, share))
+               for _ in range(threads)]
+    workers += [threading.Thread(target=_producer, args=(getattr(queue, put_name), share))
+                for _ in range(threads)]
+
+    started = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - started
+    return share * threads / elapsed
+
+def run(sizes, min_time=0.2):
+    """Moves `size` messages through every queue for every number of threads
+
+    :param list sizes: The number of messages to move
+    :param float min_time: Unused; every measurement moves all the messages once
+    :returns: One result per queue, number of threads and size
+    :rtype: list
+    """
+    results = []
+    for size in sizes:
+        if size > MAX_MESSAGES:
+            continue
+        for threads in THREADS:
+            for container_name, factory, put_name, consumer in CONTAINERS:
+                results.append({
+                    'benchmark': 'linkedqueue',
+                    'container': container_name,
+                    'operation': '{0}P/{0}C put+get'.format(threads),
+                    'size': size,
+                    'ops_per_sec': _measure(factory, put_name, consumer, threads, size),
+                })
+    return results
@@ -0,0 +1,91 @@
+"""Scaling benchmarks for ``parallel_map()`` and ``parallel_reduce()``
+
+A CPU-bound function is mapped over a ``SinglyLinkedList`` serially, with
+``map_inplace()``, and then with `parallel_map()` on process pools of one worker
+up to one per core, doubling each time, so the throughput shows how the work
+scales across cores. A thread pool is measured too; it cannot beat the serial
+map with a function that holds the GIL. `parallel_reduce()` is measured on the
+same pools. Every pool is started before it is timed, and sizes over
+``MAX_VALUES`` are skipped.
+"""
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import reduce
+
+from pylinkedlist import SinglyLinkedList
+from pylinkedlist.parallel import parallel_map, parallel_reduce
+
+MAX_VALUES = 10**6
+
+CHUNK_SIZE = 10000
+
+#: The number of loop iterations per value of `_work()`
+WORK = 200
+
+def _work(value):
+    total = value
+    for step in range(WORK):
+        total = (total * 31 + step) % 1000003
+    return total
+
+def _add_work(left, right):
+    return _work(left + right)
+
+def _worker_counts():
+    counts = [1]
+    while counts[-1] * 2 <= (os.cpu_count() or 1):
+        counts.append(counts[-1] * 2)
+    return counts
+
+def _serial_map(ll, executor):
+    ll.map_inplace(_work)
+
+def _parallel_map(ll, executor):
+    parallel_map(_work, ll, chunk_size=CHUNK_SIZE, executor=executor, inplace=True)
+
+def _serial_reduce(ll, executor):
+    reduce(_add_work, ll)
+
+def _parallel_reduce(ll, executor):
+    parallel_reduce(_add_work, ll, chunk_size=CHUNK_SIZE, executor=executor)
+
+def _pools():
+    """Yields ``(container name, executor)`` for every pool measured, started"""
+    yield 'serial', None
+    for count in _worker_counts():
+        with ProcessPoolExecutor(count) as executor:
+            # Start every worker before the clock does
+            list(executor.map(abs, range(count * 4)))
+            yield 'process pool[{}]'.format(count), executor
+    with ThreadPoolExecutor(os.cpu_count()) as executor:
+        yield 'thread pool[{}]'.format(os.cpu_count()), executor
+
+def run(sizes, min_time=0.2):
+    """Maps and reduces `size` values serially and on every pool
+
+    :param list sizes: The number of values in the list
+    :param float min_time: Unused; every measurement goes over the list once
+    :returns: One result per pool, operation and size
+    :rtype: list
+    """
+    results = []
+    for size in sizes:
+        if size > MAX_VALUES:
+            continue
+        for container_name, executor in _pools():
+            for operation, serial, parallel in [('map', _serial_map, _parallel_map),
+                                                ('reduce', _serial_reduce, _parallel_reduce)]:
+                ll = SinglyLinkedList(range(size))
+                function = serial if executor is None else parallel
+                started = time.perf_counter()
+                function(ll, executor)
+                elapsed = time.perf_counter() - started
+                results.append({
+                    'benchmark': 'parallel',
+                    'container': container_name,
+                    'operation': operation,
+                    'size': size,
+                    'ops_per_sec': size / elapsed,
+                })
+    return results
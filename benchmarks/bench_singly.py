@@ -0,0 +1,267 @@
+"""Benchmarks for every public operation of ``SinglyLinkedList``
+
+``list`` and ``collections.deque`` are measured alongside wherever they have an
+equivalent operation, so that the numbers can be put in perspective.
+"""
+from collections import deque
+from itertools import islice, repeat
+
+from pylinkedlist import SinglyLinkedList
+from _harness import measure_memory, time_operation
+
+CHUNK = 1000
+
+INDEX_STRIDE = 64
+
+def _indexed_singly_linked_list(values):
+    return SinglyLinkedList(values, index_stride=INDEX_STRIDE)
+
+CONTAINERS = [
+    ('SinglyLinkedList', SinglyLinkedList),
+    ('SinglyLinkedList[{}]'.format(INDEX_STRIDE), _indexed_singly_linked_list),
+    ('list', list),
+    ('deque', deque),
+]
+
+def _calls(count):
+    return repeat(None, count)
+
+def _append(container, count):
+    append = container.append
+    for _ in _calls(count):
+        append(0)
+
+def _singly_prepend(container, count):
+    prepend = container.prepend
+    for _ in _calls(count):
+        prepend(0)
+
+def _list_prepend(container, count):
+    insert = container.insert
+    for _ in _calls(count):
+        insert(0, 0)
+
+def _deque_prepend(container, count):
+    appendleft = container.appendleft
+    for _ in _calls(count):
+        appendleft(0)
+
+def _singly_remove_head(container, count):
+    remove_head = container.remove_head
+    for _ in _calls(count):
+        remove_head()
+
+def _list_remove_head(container, count):
+    pop = container.pop
+    for _ in _calls(count):
+        pop(0)
+
+def _deque_remove_head(container, count):
+    popleft = container.popleft
+    for _ in _calls(count):
+        popleft()
+
+def _singly_remove_tail(container, count):
+    remove_tail = container.remove_tail
+    for _ in _calls(count):
+        remove_tail()
+
+def _pop(container, count):
+    pop = container.pop
+    for _ in _calls(count):
+        pop()
+
+def _singly_remove_first_occurence(container, count):
+    # The value at the tail is the worst case: the whole list is scanned
+    for _ in _calls(count):
+        container.remove_first_occurence(container.tail.value)
+
+def _sequence_remove_first_occurence(container, count):
+    for _ in _calls(count):
+        container.remove(container[-1])
+
+def _singly_remove_last_occurence(container, count):
+    for _ in _calls(count):
+        container.remove_last_occurence(container.head.value)
+
+def _singly_remove_all_occurences(container, count):
+    # A missing value is the worst case: the whole list is scanned, nothing is removed
+    for _ in _calls(count):
+        container.remove_all_occurences(-1)
+
+def _list_remove_all_occurences(container, count):
+    for _ in _calls(count):
+        container[:] = [value for value in container if value != -1]
+
+def _singly_remove_many(container, count):
+    # Ten missing values: one scan for the whole batch rather than one per value
+    values = range(-10, 0)
+    for _ in _calls(count):
+        container.remove_many(values)
+
+def _list_remove_many(container, count):
+    values = set(range(-10, 0))
+    for _ in _calls(count):
+        container[:] = [value for value in container if value not in values]
+
+def _singly_view_take(container, count):
+    # Only the values up to the 100th odd one are visited
+    for _ in _calls(count):
+        container.view().filter(_odd).map(_double).take(100).tolist()
+
+def _generator_take(container, count):
+    for _ in _calls(count):
+        list(islice((value * 2 for value in container if value % 2), 100))
+
+def _odd(value):
+    return value % 2
+
+def _double(value):
+    return value * 2
+
+def _reverse(container, count):
+    for _ in _calls(count):
+        container.reverse()
+
+def _eq(pair, count):
+    first, second = pair
+    for _ in _calls(count):
+        first == second
+
+def _iter(container, count):
+    for _ in _calls(count):
+        for _ in container:
+            pass
+
+def _len(container, count):
+    for _ in _calls(count):
+        len(container)
+
+def _getitem(container, count):
+    # Positions spread over the whole container, including the far end
+    length = len(container)
+    positions = [(i * 7919) % length for i in range(min(count, 1000))]
+    for i in range(count):
+        container[positions[i % len(positions)]]
+
+def _singly_append_all(container, count):
+    chunk = list(range(CHUNK))
+    for _ in _calls(count):
+        container.append_all(chunk)
+
+def _extend(container, count):
+    chunk = list(range(CHUNK))
+    for _ in _calls(count):
+        container.extend(chunk)
+
+def _add(container, count):
+    chunk = list(range(CHUNK))
+    for _ in _calls(count):
+        container + chunk
+
+def _single(factory):
+    return lambda size: factory(range(size))
+
+def _pair(factory):
+    return lambda size: (factory(range(size)), factory(range(size)))
+
+def _unequal_pair(factory):
+    # Equal but for a value in the middle, so peeking at the ends does not help;
+    # a SinglyLinkedList decides from the fingerprints instead of walking
+    def setup(size):
+        first = factory(range(size))
+        second = factory(-1 if value == size // 2 else value for value in range(size))
+        if hasattr(first, 'fingerprint'):
+            first.fingerprint()
+            second.fingerprint()
+        return first, second
+    return setup
+
+# Every entry is (operation, shrinks, setup, {container name: operation function})
+OPERATIONS = [
+    ('append', False, _single, {
+        'SinglyLinkedList': _append, 'list': _append, 'deque': _append}),
+    ('prepend', False, _single, {
+        'SinglyLinkedList': _singly_prepend, 'list': _list_prepend,
+        'deque': _deque_prepend}),
+    ('remove_head', True, _single, {
+        'SinglyLinkedList': _singly_remove_head, 'list': _list_remove_head,
+        'deque': _deque_remove_head}),
+    ('remove_tail', True, _single, {
+        'SinglyLinkedList': _singly_remove_tail, 'list': _pop, 'deque': _pop}),
+    ('remove_first_occurence', True, _single, {
+        'SinglyLinkedList': _singly_remove_first_occurence,
+        'list': _sequence_remove_first_occurence,
+        'deque': _sequence_remove_first_occurence}),
+    ('remove_last_occurence', True, _single, {
+        'SinglyLinkedList': _singly_remove_last_occurence}),
+    ('remove_all_occurences', False, _single, {
+        'SinglyLinkedList': _singly_remove_all_occurences,
+        'list': _list_remove_all_occurences}),
+    ('remove_many(10)', False, _single, {
+        'SinglyLinkedList': _singly_remove_many, 'list': _list_remove_many}),
+    ('view.filter.map.take(100)', False, _single, {
+        'SinglyLinkedList': _singly_view_take, 'list': _generator_take,
+        'deque': _generator_take}),
+    ('reverse', False, _single, {
+        'SinglyLinkedList': _reverse, 'list': _reverse, 'deque': _reverse}),
+    ('__eq__', False, _pair, {
+        'SinglyLinkedList': _eq, 'list': _eq, 'deque': _eq}),
+    ('__eq__(fingerprinted, unequal)', False, _unequal_pair, {
+        'SinglyLinkedList': _eq, 'list': _eq, 'deque': _eq}),
+    ('__iter__', False, _single, {
+        'SinglyLinkedList': _iter, 'list': _iter, 'deque': _iter}),
+    ('__len__', False, _single, {
+        'SinglyLinkedList': _len, 'list': _len, 'deque': _len}),
+    ('__getitem__', False, _single, {
+        'SinglyLinkedList': _getitem,
+        'SinglyLinkedList[{}]'.format(INDEX_STRIDE): _getitem,
+        'list': _getitem, 'deque': _getitem}),
+    ('append_all({})'.format(CHUNK), False, _single, {
+        'SinglyLinkedList': _singly_append_all, 'list': _extend, 'deque': _extend}),
+    ('__add__({})'.format(CHUNK), False, _single, {
+        'SinglyLinkedList': _add, 'list': _add}),
+]
+
+def run(sizes, min_time=0.2):
+    """Runs every benchmark for every size
+
+    :param list sizes: The number of elements in the container being measured
+    :param float min_time: The minimum number of seconds spent on each measurement
+    :returns: One result per container, operation and size
+    :rtype: list
+    """
+    results = []
+    for size in sizes:
+        for container_name, factory in CONTAINERS:
+            def construct(size, count, factory=factory):
+                for _ in _calls(count):
+                    factory(range(size))
+
+            peak, current = measure_memory(
+                lambda size: factory(repeat(None, size)), size)
+            results.append({
+                'benchmark': 'singly',
+                'container': container_name,
+                'operation': '__init__',
+                'size': size,
+                'ops_per_sec': time_operation(
+                    lambda size: size, construct, size, min_time=min_time),
+                'peak_bytes': peak,
+                'bytes_per_element': current / float(size),
+            })
+
+            for operation, shrinks, setup, functions in OPERATIONS:
+                function = functions.get(container_name)
+                if function is None:
+                    continue
+                results.append({
+                    'benchmark': 'singly',
+                    'container': container_name,
+                    'operation': operation,
+                    'size': size,
+                    'ops_per_sec': time_operation(
+                        setup(factory), function, size,
+                        shrinks=shrinks, min_time=min_time),
+                })
+    return results
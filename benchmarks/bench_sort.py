@@ -0,0 +1,83 @@
+"""Benchmarks for sorting a ``SinglyLinkedList``
+
+The in-place merge sort is compared with the usual workaround of copying the
+values into a ``list``, sorting it and building a new linked list from it. Both
+the throughput and the peak memory allocated while sorting are reported; the
+values are shuffled integers shared by both approaches.
+"""
+import gc
+import random
+import tracemalloc
+
+from pylinkedlist import SinglyLinkedList
+from _harness import time_operation
+
+def _shuffled(size):
+    values = list(range(size))
+    random.Random(size).shuffle(values)
+    return values
+
+def _merge_sort(ll):
+    ll.sort()
+    return ll
+
+def _list_sort_rebuild(ll):
+    values = list(ll)
+    values.sort()
+    return SinglyLinkedList(values)
+
+def _merge_sort_key(ll):
+    ll.sort(key=_negated)
+    return ll
+
+def _list_sort_rebuild_key(ll):
+    values = list(ll)
+    values.sort(key=_negated)
+    return SinglyLinkedList(values)
+
+def _negated(value):
+    return -value
+
+OPERATIONS = [
+    ('sort()', 'merge sort', _merge_sort),
+    ('sort()', 'list.sort+rebuild', _list_sort_rebuild),
+    ('sort(key)', 'merge sort', _merge_sort_key),
+    ('sort(key)', 'list.sort+rebuild', _list_sort_rebuild_key),
+]
+
+def _peak_bytes(function, values):
+    ll = SinglyLinkedList(values)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        function(ll)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def run(sizes, min_time=0.2):
+    """Sorts a shuffled list of every size both ways
+
+    :param list sizes: The number of values in the list being sorted
+    :param float min_time: The minimum number of seconds spent on each measurement
+    :returns: One result per approach, operation and size
+    :rtype: list
+    """
+    results = []
+    for size in sizes:
+        values = _shuffled(size)
+        for operation, container_name, function in OPERATIONS:
+            def sort(ll, count, function=function):
+                for _ in range(count):
+                    function(ll)
+            results.append({
+                'benchmark': 'sort',
+                'container': container_name,
+                'operation': operation,
+                'size': size,
+                'ops_per_sec': time_operation(
+                    lambda size: SinglyLinkedList(values), sort, size,
+                    min_time=min_time, max_calls=1),
+                'peak_bytes': _peak_bytes(function, values),
+            })
+    return results
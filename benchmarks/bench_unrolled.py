@@ -0,0 +1,84 @@
+"""Benchmarks for the memory use and iteration speed of ``UnrolledLinkedList``
+
+``SinglyLinkedList`` and ``list`` are measured alongside, to show the cost per
+element of a node per value against a node per block of values.
+"""
+from itertools import repeat
+
+from pylinkedlist import SinglyLinkedList, UnrolledLinkedList
+from _harness import measure_memory, time_operation
+
+CONTAINERS = [
+    ('UnrolledLinkedList', UnrolledLinkedList),
+    ('SinglyLinkedList', SinglyLinkedList),
+    ('list', list),
+]
+
+def _append(container, count):
+    append = container.append
+    for _ in repeat(None, count):
+        append(0)
+
+def _remove_head(container, count):
+    remove_head = container.remove_head
+    for _ in repeat(None, count):
+        remove_head()
+
+def _iter(container, count):
+    for _ in repeat(None, count):
+        for _ in container:
+            pass
+
+def _sum(container, count):
+    for _ in repeat(None, count):
+        sum(container)
+
+# Every entry is (operation, shrinks, {container name: operation function})
+OPERATIONS = [
+    ('append', False, {
+        'UnrolledLinkedList': _append, 'SinglyLinkedList': _append, 'list': _append}),
+    ('remove_head', True, {
+        'UnrolledLinkedList': _remove_head, 'SinglyLinkedList': _remove_head}),
+    ('__iter__', False, {
+        'UnrolledLinkedList': _iter, 'SinglyLinkedList': _iter, 'list': _iter}),
+    ('sum', False, {
+        'UnrolledLinkedList': _sum, 'SinglyLinkedList': _sum, 'list': _sum}),
+]
+
+def run(sizes, min_time=0.2):
+    """Runs every benchmark for every size
+
+    :param list sizes: The number of elements in the container being measured
+    :param float min_time: The minimum number of seconds spent on each measurement
+    :returns: One result per container, operation and size
+    :rtype: list
+    """
+    results = []
+    for size in sizes:
+        for container_name, factory in CONTAINERS:
+            peak, current = measure_memory(
+                lambda size: factory(repeat(None, size)), size)
+            results.append({
+                'benchmark': 'unrolled',
+                'container': container_name,
+                'operation': 'memory',
+                'size': size,
+                'ops_per_sec': None,
+                'peak_bytes': peak,
+                'bytes_per_element': current / float(size),
+            })
+
+            for operation, shrinks, functions in OPERATIONS:
+                function = functions.get(container_name)
+                if function is None:
+                    continue
+                results.append({
+                    'benchmark': 'unrolled',
+                    'container': container_name,
+                    'operation': operation,
+                    'size': size,
+                    'ops_per_sec': time_operation(
+                        lambda size: factory(range(size)), function, size,
+                        shrinks=shrinks, min_time=min_time),
+                })
+    return results
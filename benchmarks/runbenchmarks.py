@@ -0,0 +1,55 @@
+import argparse
+import os
+import sys
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(current_dir, '..'))
+sys.path.append(os.path.join(current_dir, '..', 'pylinkedlist'))
+
+from _harness import (compare_results, format_comparison, format_results,
+                      load_results, save_results)
+
+DEFAULT_SIZES = [10**exponent for exponent in range(3, 8)]
+QUICK_SIZES = [10**exponent for exponent in range(3, 5)]
+
+def benchmark_modules():
+    """Returns a list of names of the benchmark modules"""
+    return ['bench_singly', 'bench_length_tracking', 'bench_doubly',
+            'bench_unrolled', 'bench_pool', 'bench_cache',
+            'bench_linkedqueue', 'bench_asyncqueue', 'bench_sort',
+            'bench_parallel']
+
+def run_benchmarks(module_names, sizes, min_time):
+    results = []
+    for module_name in module_names:
+        module = __import__(module_name, globals(), locals(), ['run'])
+        results.extend(module.run(sizes, min_time=min_time))
+    return results
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description='Runs the pylinkedlist benchmarks.')
+    parser.add_argument('modules', nargs='*', default=benchmark_modules(),
+                        help='benchmark modules to run (default: all)')
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help='container sizes to benchmark (default: 10^3 to 10^7)')
+    parser.add_argument('--quick', action='store_true',
+                        help='only benchmark sizes 10^3 and 10^4')
+    parser.add_argument('--min-time', type=float, default=0.2,
+                        help='minimum number of seconds per measurement')
+    parser.add_argument('--output', help='save the results as JSON to this path')
+    parser.add_argument('--compare', nargs=2, metavar=('OLD', 'NEW'),
+                        help='compare two saved results files instead of running')
+    return parser.parse_args(argv)
+
+if __name__ == '__main__':
+    args = parse_args(sys.argv[1:])
+    if args.compare:
+        old_path, new_path = args.compare
+        rows = compare_results(load_results(old_path), load_results(new_path))
+        print(format_comparison(rows))
+    else:
+        sizes = QUICK_SIZES if args.quick else args.sizes
+        results = run_benchmarks(args.modules, sizes, args.min_time)
+        print(format_results(results))
+        if args.output:
+            save_results(args.output, results)
@@ -1 +1,11 @@
-from singly import SinglyLinkedList
\ No newline at end of file
+from singly import CycleError, NodePool, SinglyLinkedList
+from doubly import DoublyLinkedList
+from unrolled import UnrolledLinkedList
+from typed import TypedSinglyLinkedList
+from indexed import IndexedSinglyLinkedList
+from frozen import FrozenSinglyLinkedList
+from persistent import PersistentSinglyLinkedList
+from cache import LFUCache, LRUCache
+from mmapped import MappedSinglyLinkedList
+from view import LinkedListView
+from instrumentation import Instrumentation
@@ -1,4 +1,6 @@
 from functools import wraps
+from inspect import isgeneratorfunction, unwrap
+from time import perf_counter
 
 def mutates_length(always=False, decrements=False):
     """Decorator to indicate that execution of a method will change the length
@@ -26,4 +28,50 @@ def mutates_length(always=False, decrements=False):
             return method_output
         return incrementer
     return wrapper
-    
\ No newline at end of file
+
+def checks_cycles(method):
+    """Decorator to check the list for a cycle before running a method, when the
+    list is `checked`
+
+    A method that walks the chain of nodes to its end would never return on a
+    cyclic chain; checked lists raise ``CycleError`` instead.
+    """
+    @wraps(method)
+    def checker(self, *args, **kwargs):
+        if self.checked:
+            self._check_cycles()
+        return method(self, *args, **kwargs)
+    return checker
+
+def instrumented(method, nodes_traversed, record):
+    """Wraps `method` so that every call reports what it cost
+
+    The costs of a call include those of the calls it makes. For a generator
+    method, such as ``__iter__``, the call lasts until the generator is exhausted
+    or closed, and its duration includes the time spent by the consumer.
+
+    :param callable nodes_traversed: Returns the number of nodes traversed so far
+    :param callable record: Called after every call with the name of the method,
+    the number of nodes traversed and the number of seconds taken by the call
+    """
+    name = method.__name__
+
+    if isgeneratorfunction(unwrap(method)):
+        @wraps(method)
+        def generator_recorder(*args, **kwargs):
+            nodes, started = nodes_traversed(), perf_counter()
+            try:
+                for value in method(*args, **kwargs):
+                    yield value
+            finally:
+                record(name, nodes_traversed() - nodes, perf_counter() - started)
+        return generator_recorder
+
+    @wraps(method)
+    def recorder(*args, **kwargs):
+        nodes, started = nodes_traversed(), perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            record(name, nodes_traversed() - nodes, perf_counter() - started)
+    return recorder
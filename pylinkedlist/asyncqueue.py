@@ -0,0 +1,163 @@
+"""An asyncio queue on a singly linked list, with batched gets
+
+``AsyncLinkedQueue`` follows the API of ``asyncio.Queue``. Its values are held in
+a ``SinglyLinkedList``, so putting and getting are O(1) at either end, and the
+coroutines waiting on it are held in ``DoublyLinkedList`` objects, so a waiter
+that is cancelled or times out unlinks itself in O(1).
+
+`get_batch()` lets a consumer take every value available, up to a limit, for a
+single wakeup instead of one wakeup per value.
+
+It needs Python 3.7 or later, so it is not imported by the package; import it
+from ``pylinkedlist.asyncqueue``.
+"""
+import asyncio
+
+from doubly import DoublyLinkedList
+from singly import SinglyLinkedList
+
+class AsyncLinkedQueue(object):
+    """A FIFO queue for coroutines of a single event loop.
+
+    If `maxsize` is 0 or less the queue is unbounded; otherwise `put()` waits
+    for room once `maxsize` values are queued, which pushes back on producers.
+    Like ``asyncio.Queue``, it is not thread-safe.
+    """
+
+    def __init__(self, maxsize=0):
+        """
+        :param int maxsize: The maximum number of values queued, or 0 for no limit
+        """
+        self._maxsize = maxsize
+        self._values = SinglyLinkedList()
+        # Futures of the coroutines waiting for a value and for room, oldest first
+        self._getters = DoublyLinkedList()
+        self._putters = DoublyLinkedList()
+
+    @property
+    def maxsize(self):
+        """The maximum number of values queued, or 0 for no limit"""
+        return self._maxsize
+
+    def qsize(self):
+        """Returns the number of values in the queue"""
+        return len(self._values)
+
+    def empty(self):
+        """Returns ``True`` if the queue is empty"""
+        return self._values.head is None
+
+    def full(self):
+        """Returns ``True`` if there are `maxsize` values in the queue"""
+        return 0 < self._maxsize <= len(self._values)
+
+    async def put(self, value):
+        """Insert value at the end of the queue, waiting for room if it is full
+
+        :Worst-case Time Complexity: O(1), not counting the wait
+        """
+        while 0 < self._maxsize <= len(self._values):
+            await self.__wait(self._putters)
+        self.put_nowait(value)
+
+    def put_nowait(self, value):
+        """Insert value at the end of the queue without waiting
+
+        :raises asyncio.QueueFull: If the queue is full
+        :Worst-case Time Complexity: O(1)
+        """
+        values = self._values
+        if 0 < self._maxsize <= len(values):
+            raise asyncio.QueueFull
+        values.append(value)
+        if self._getters.head is not None:
+            self.__wake_up(self._getters, 1)
+
+    async def get(self):
+        """Removes the first value of the queue and returns it, waiting for one if
+        the queue is empty
+
+        :Worst-case Time Complexity: O(1), not counting the wait
+        """
+        while self._values.head is None:
+            await self.__wait(self._getters)
+        return self.get_nowait()
+
+    def get_nowait(self):
+        """Removes the first value of the queue and returns it without waiting
+
+        :raises asyncio.QueueEmpty: If the queue is empty
+        :Worst-case Time Complexity: O(1)
+        """
+        values = self._values
+        if values.head is None:
+            raise asyncio.QueueEmpty
+        value = values.head.value
+        values.remove_head()
+        if self._putters.head is not None:
+            self.__wake_up(self._putters, 1)
+        return value
+
+    async def get_batch(self, max_n):
+        """Removes up to `max_n` values from the start of the queue and returns
+        them, waiting for at least one if the queue is empty
+
+        The coroutine is woken up once for the whole batch, and as many waiting
+        producers as there is room for are woken up at once.
+
+        :param int max_n: The maximum number of values to return
+        :rtype: list
+        :raises ValueError: If `max_n` is less than 1
+        :Worst-case Time Complexity: O(``max_n``), not counting the wait
+        """
+        if max_n < 1:
+            raise ValueError('max_n must be at least 1, not {}'.format(max_n))
+
+        while self.empty():
+            await self.__wait(self._getters)
+
+        values = self._values
+        batch = []
+        append, remove_head = batch.append, values.remove_head
+        while len(batch) < max_n and values.head is not None:
+            append(values.head.value)
+            remove_head()
+
+        self.__wake_up(self._putters, len(batch))
+        if values.head is not None:
+            # The values left over may be for another consumer
+            self.__wake_up(self._getters, 1)
+        return batch
+
+    async def __wait(self, waiters):
+        """Helper to wait until woken up by `__wake_up()` on `waiters`"""
+        waiter = asyncio.get_running_loop().create_future()
+        node = waiters.append(waiter)
+        try:
+            await waiter
+        except BaseException:
+            waiter.cancel()
+            waiters.remove_node(node)
+            # A wakeup received before being cancelled is passed on
+            if waiter.done() and not waiter.cancelled():
+                self.__wake_up(waiters, 1)
+            raise
+        waiters.remove_node(node)
+
+    @staticmethod
+    def __wake_up(waiters, count):
+        """Helper to wake up the `count` oldest waiters not woken up yet"""
+        current = waiters.head
+        while count and current is not None:
+            waiter = current.value
+            if not waiter.done():
+                waiter.set_result(None)
+                count -= 1
+            current = current.next
+
+    def __len__(self):
+        return len(self._values)
+
+    def __repr__(self):
+        return '{}(maxsize={}, qsize={})'.format(
+            self.__class__.__name__, self._maxsize, len(self._values))
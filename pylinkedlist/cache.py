@@ -0,0 +1,307 @@
+"""Least recently and least frequently used caches built on ``DoublyLinkedList``
+
+Both caches map every key to the node holding its entry, so looking an entry up,
+moving it within the list and evicting it are all O(1). ``LRUCache`` keeps its
+entries in a single list, most recently used first. ``LFUCache`` keeps a list of
+frequency buckets in increasing order of frequency, each bucket being a list of
+the entries used that many times, most recently used first.
+
+Entries are evicted once the cache holds more than `maxsize` entries or, with a
+`weigher`, once their total weight exceeds `maxweight`.
+"""
+from doubly import DoublyLinkedList
+
+class _CacheEntry(object):
+    __slots__ = ['key', 'value', 'weight']
+
+    def __init__(self, key, value, weight):
+        self.key = key
+        self.value = value
+        self.weight = weight
+
+    def __repr__(self):
+        return '_CacheEntry(key={!r}, value={!r})'.format(self.key, self.value)
+
+class _BaseCache(object):
+    """The bookkeeping shared by the caches
+
+    Subclasses decide the eviction order by implementing `_link()`, which adds
+    the node of a new entry, `_unlink()`, `_hit()`, which counts a use of an
+    entry and returns its node, and `_victim()`, which returns the node of the
+    next entry to evict other than that of `exclude`.
+    """
+
+    def __init__(self, maxsize=128, maxweight=None, weigher=None, on_evict=None):
+        """
+        :param int maxsize: The maximum number of entries, or ``None`` for no limit
+        :param maxweight: The maximum total weight of the entries, or ``None``
+        for no limit
+        :param callable weigher: Called with ``(key, value)``; returns the weight
+        of an entry. Every entry weighs 1 by default.
+        :param callable on_evict: Called with ``(key, value)`` for every evicted
+        entry; entries removed or replaced explicitly are not reported
+        """
+        if maxsize is not None and maxsize < 1:
+            raise ValueError('maxsize must be at least 1, not {}'.format(maxsize))
+        if maxweight is not None and maxweight <= 0:
+            raise ValueError('maxweight must be positive, not {}'.format(maxweight))
+
+        self.maxsize = maxsize
+        self.maxweight = maxweight
+        self.weigher = weigher
+        self.on_evict = on_evict
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = {}
+        self._weight = 0
+
+    @property
+    def weight(self):
+        """The total weight of the entries"""
+        return self._weight
+
+    def get(self, key, default=None):
+        """Returns the value of `key`, or `default` if it is not cached
+
+        A hit counts as a use of the entry.
+
+        :Average Time Complexity: O(1)
+        """
+        node = self._entries.get(key)
+        if node is None:
+            self.misses += 1
+            return default
+
+        self.hits += 1
+        self._entries[key] = node = self._hit(node)
+        return node.value.value
+
+    def put(self, key, value):
+        """Caches `value` under `key`, evicting entries to make room for it
+
+        Replacing the value of a cached key counts as a use of the entry.
+
+        :raises ValueError: If the entry alone weighs more than `maxweight`
+        :Average Time Complexity: O(1), plus O(1) per evicted entry
+        """
+        weight = self.weigher(key, value) if self.weigher is not None else 1
+        if self.maxweight is not None and weight > self.maxweight:
+            raise ValueError('an entry of weight {} cannot fit in a cache of '
+                             'maxweight {}'.format(weight, self.maxweight))
+
+        entries = self._entries
+        node = entries.get(key)
+        if node is not None:
+            entry = node.value
+            self._weight += weight - entry.weight
+            entry.value, entry.weight = value, weight
+            entries[key] = node = self._hit(node)
+            while self.__overflows(len(entries), self._weight):
+                self.__evict(self._victim(node))
+            return
+
+        # Room is made first, so that the new entry cannot be the one evicted
+        while entries and self.__overflows(len(entries) + 1, self._weight + weight):
+            self.__evict(self._victim())
+        entries[key] = self._link(self._new_entry(key, value, weight))
+        self._weight += weight
+
+    def touch(self, key):
+        """Counts a use of the entry of `key` without reading it
+
+        :returns: ``True`` if `key` is cached, ``False`` otherwise
+        :rtype: bool
+        :Average Time Complexity: O(1)
+        """
+        node = self._entries.get(key)
+        if node is None:
+            return False
+
+        self._entries[key] = self._hit(node)
+        return True
+
+    def pop(self, key, *default):
+        """Removes the entry of `key` and returns its value
+
+        :raises KeyError: If `key` is not cached and no default is given
+        :Average Time Complexity: O(1)
+        """
+        node = self._entries.pop(key, None)
+        if node is None:
+            if default:
+                return default[0]
+            raise KeyError(key)
+
+        self._unlink(node)
+        self._weight -= node.value.weight
+        return node.value.value
+
+    def clear(self):
+        """Removes every entry; the counters are kept"""
+        for node in list(self._entries.values()):
+            self._unlink(node)
+        self._entries.clear()
+        self._weight = 0
+
+    def stats(self):
+        """Returns the counters of the cache
+
+        :returns: The number of `hits` and `misses` of `get()`, the number of
+        `evictions`, and the current `size` and `weight` of the cache
+        :rtype: dict
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'size': len(self._entries),
+            'weight': self._weight,
+        }
+
+    def _new_entry(self, key, value, weight):
+        """Returns the entry to cache for a key that is not cached yet"""
+        return _CacheEntry(key, value, weight)
+
+    def __overflows(self, size, weight):
+        """Helper to tell whether `size` entries of total `weight` are too many"""
+        return (self.maxsize is not None and size > self.maxsize) or \
+               (self.maxweight is not None and weight > self.maxweight)
+
+    def __evict(self, node):
+        """Helper to evict the entry of `node`"""
+        entry = node.value
+        del self._entries[entry.key]
+        self._unlink(node)
+        self._weight -= entry.weight
+        self.evictions += 1
+        if self.on_evict is not None:
+            self.on_evict(entry.key, entry.value)
+
+    def __contains__(self, key):
+        # Checking for a key is not a use of its entry
+        return key in self._entries
+
+    def __delitem__(self, key):
+        self.pop(key)
+
+    def __getitem__(self, key):
+        node = self._entries.get(key)
+        if node is None:
+            self.misses += 1
+            raise KeyError(key)
+
+        self.hits += 1
+        self._entries[key] = node = self._hit(node)
+        return node.value.value
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __repr__(self):
+        return '{}(maxsize={}, maxweight={}, size={})'.format(
+            self.__class__.__name__, self.maxsize, self.maxweight,
+            len(self._entries))
+
+    def __setitem__(self, key, value):
+        self.put(key, value)
+
+class LRUCache(_BaseCache):
+    """A cache evicting the least recently used entries first
+
+    Iterating over the cache yields its keys from the most to the least
+    recently used.
+    """
+
+    def __init__(self, maxsize=128, maxweight=None, weigher=None, on_evict=None):
+        _BaseCache.__init__(self, maxsize, maxweight, weigher, on_evict)
+        self._recency = DoublyLinkedList()
+
+    def _link(self, entry):
+        return self._recency.prepend(entry)
+
+    def _unlink(self, node):
+        self._recency.remove_node(node)
+
+    def _hit(self, node):
+        self._recency.move_to_head(node)
+        return node
+
+    def _victim(self, exclude=None):
+        node = self._recency.tail
+        return node if node is not exclude else node.previous
+
+    def __iter__(self):
+        return (entry.key for entry in self._recency)
+
+class _FrequencyEntry(_CacheEntry):
+    __slots__ = ['frequency', 'bucket']
+
+    def __init__(self, key, value, weight):
+        _CacheEntry.__init__(self, key, value, weight)
+        self.frequency = 1
+        # The node of the frequency bucket holding the entry
+        self.bucket = None
+
+class LFUCache(_BaseCache):
+    """A cache evicting the least frequently used entries first
+
+    Among entries used equally often, the least recently used one is evicted
+    first. Iterating over the cache yields its keys from the most to the least
+    frequently used.
+    """
+
+    def __init__(self, maxsize=128, maxweight=None, weigher=None, on_evict=None):
+        _BaseCache.__init__(self, maxsize, maxweight, weigher, on_evict)
+        # Holds ``(frequency, entries)`` pairs in increasing order of frequency
+        self._buckets = DoublyLinkedList()
+
+    def frequency(self, key):
+        """Returns the number of uses of the entry of `key`, or 0 if it is not cached"""
+        node = self._entries.get(key)
+        return node.value.frequency if node is not None else 0
+
+    def _new_entry(self, key, value, weight):
+        return _FrequencyEntry(key, value, weight)
+
+    def _link(self, entry):
+        buckets = self._buckets
+        bucket = buckets.head
+        if bucket is None or bucket.value[0] != 1:
+            bucket = buckets.prepend((1, DoublyLinkedList()))
+        entry.bucket = bucket
+        return bucket.value[1].prepend(entry)
+
+    def _unlink(self, node):
+        bucket = node.value.bucket
+        entries = bucket.value[1]
+        entries.remove_node(node)
+        if not entries:
+            self._buckets.remove_node(bucket)
+
+    def _hit(self, node):
+        entry = node.value
+        bucket = entry.bucket
+        entry.frequency += 1
+
+        following = bucket.next
+        if following is None or following.value[0] != entry.frequency:
+            following = self._buckets.insert_after(
+                bucket, (entry.frequency, DoublyLinkedList()))
+        self._unlink(node)
+        entry.bucket = following
+        return following.value[1].prepend(entry)
+
+    def _victim(self, exclude=None):
+        bucket = self._buckets.head
+        node = bucket.value[1].tail
+        if node is not exclude:
+            return node
+        # `exclude` is the most recently used entry of its bucket, so it is alone
+        # in the bucket if it is also the least recently used one
+        return node.previous if node.previous is not None else bucket.next.value[1].tail
+
+    def __iter__(self):
+        for _, entries in reversed(self._buckets):
+            for entry in entries:
+                yield entry.key
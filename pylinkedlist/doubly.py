@@ -0,0 +1,445 @@
+from view import LinkedListView
+
+class _DoublyNode(object):
+    __slots__ = ['value', 'previous', 'next']
+
+    def __init__(self, value=None, previous=None, next=None):
+        self.value = value
+        self.previous = previous
+        self.next = next
+
+    def __bool__(self):
+        return (self.value is not None) or (self.previous is not None) or \
+               (self.next is not None)
+
+    def __nonzero__(self):
+        return self.__bool__()
+
+    def __repr__(self):
+        return '_DoublyNode(value={})'.format(self.value)
+
+class DoublyLinkedList(object):
+    """A doubly linked list implementation.
+
+    It has the same API as ``SinglyLinkedList``; in addition, both ends can be
+    removed from in O(1), it can be iterated backwards with ``reversed()`` and a
+    node returned by `append()` or `prepend()` can be removed in O(1).
+    """
+
+    #: The maximum number of values rendered by ``str()`` and ``repr()``; the
+    #: rest is elided with ``...``. Set it per class or per list; ``None`` renders
+    #: every value.
+    repr_limit = None
+
+    def __init__(self, elements=None):
+        self.head = None
+        self.tail = self.head
+        self._length = 0
+
+        self.append_all(elements)
+
+    def append_all(self, values):
+        """Insert all the values at the end of the list
+
+        The new nodes are chained together locally and linked to the tail in one
+        go. Appending another `DoublyLinkedList` copies its values; use
+        `splice()` to move its nodes over in O(1) instead.
+
+        :param iterable values: The values to append to the list
+        :Worst-case Time Complexity: O(``len(values)``)
+        """
+        if values is None:
+            return
+
+        node_class = _DoublyNode
+        first = last = node_class(None)
+        count = 0
+        for count, value in enumerate(values, 1):
+            last.next = last = node_class(value, last)
+
+        if count == 0:
+            return
+
+        first = first.next
+        if self.head is not None:
+            self.tail.next = first
+            first.previous = self.tail
+        else:
+            first.previous = None
+            self.head = first
+        self.tail = last
+        self._length += count
+
+    extend = append_all
+
+    def splice(self, other):
+        """Move all the nodes of `other` to the end of the list
+
+        The nodes are relinked rather than copied, so `other` is left empty.
+
+        :param DoublyLinkedList other: The list whose nodes to move to this list
+        :raises ValueError: If `other` is this list
+        :Worst-case Time Complexity: O(1)
+        """
+        if not isinstance(other, DoublyLinkedList):
+            raise TypeError('can only splice a DoublyLinkedList (not "{}")'.format(
+                other.__class__.__name__))
+        if other is self:
+            raise ValueError('cannot splice a list into itself')
+
+        if other.head is None:
+            return
+
+        if self.head is not None:
+            self.tail.next = other.head
+            other.head.previous = self.tail
+        else:
+            self.head = other.head
+        self.tail = other.tail
+        self._length += other._length
+
+        other.head = None
+        other.tail = other.head
+        other._length = 0
+
+    def concat(self, other):
+        """Return a new list with the values of this list followed by those of `other`
+
+        :param iterable other: The values to follow the values of this list
+        :rtype: DoublyLinkedList
+        :Worst-case Time Complexity: O(``len(self) + len(other)``)
+        """
+        concatenated = self.__class__(self)
+        concatenated.append_all(other)
+        return concatenated
+
+    def append(self, value):
+        """Insert value at the end of the list
+
+        :param object value: The value to append to the end of the list
+        :returns: The new node, which can be passed to `remove_node()`
+        :rtype: _DoublyNode
+        :Worst-case Time Complexity: O(1)
+        """
+        node = _DoublyNode(value, self.tail)
+        if self.head is not None:
+            self.tail.next = node
+        else:
+            self.head = node
+        self.tail = node
+        self._length += 1
+        return node
+
+    def prepend(self, value):
+        """Insert value at the start of the linked list
+
+        :param object value: The value to prepend to the beginning of the list
+        :returns: The new node, which can be passed to `remove_node()`
+        :rtype: _DoublyNode
+        :Worst-case Time Complexity: O(1)
+        """
+        node = _DoublyNode(value, None, self.head)
+        if self.head is not None:
+            self.head.previous = node
+        else:
+            self.tail = node
+        self.head = node
+        self._length += 1
+        return node
+
+    def remove_first_occurence(self, value):
+        """Removes the first occurence of `value` from the linked list
+
+        :param object value: The value to remove first occurence from the list
+        :returns: ``True`` if value is removed, ``False`` otherwise
+        :rtype: bool
+        :Worst-case Time Complexity: O(``len(self)``)
+        """
+        current = self.head
+        while current is not None:
+            if current.value == value:
+                self.remove_node(current)
+                return True
+            current = current.next
+        return False
+
+    def remove_last_occurence(self, value):
+        """Removes the last occurence of `value` from the linked list
+
+        The list is searched backwards from the tail, so the search stops at the
+        last occurence.
+
+        :param object value: The value to remove last occurence from the list
+        :returns: ``True`` if value is removed, ``False`` otherwise
+        :rtype: bool
+        :Worst-case Time Complexity: O(``len(self)``)
+        """
+        current = self.tail
+        while current is not None:
+            if current.value == value:
+                self.remove_node(current)
+                return True
+            current = current.previous
+        return False
+
+    def remove_all_occurences(self, value):
+        """Removes all occurences of `value` from the linked list
+
+        :param object value: The value to remove all occurences from the list
+        :returns: The number of values removed
+        :rtype: int
+        :Worst-case Time Complexity: O(``len(self)``)
+        """
+        count = 0
+        current = self.head
+        while current is not None:
+            next = current.next
+            if current.value == value:
+                self.remove_node(current)
+                count += 1
+            current = next
+        return count
+
+    def remove_node(self, node):
+        """Removes `node` from the linked list
+
+        :param _DoublyNode node: A node of this list, e.g. as returned by
+        `append()` or `prepend()`. Passing a node of another list corrupts both.
+        :raises ValueError: If `node` has already been removed
+        :Worst-case Time Complexity: O(1)
+        """
+        previous, next = node.previous, node.next
+        if previous is None and node is not self.head:
+            # Only the head has no previous node while in the list
+            raise ValueError('the node is not in the list')
+        if previous is not None:
+            previous.next = next
+        else:
+            self.head = next
+        if next is not None:
+            next.previous = previous
+        else:
+            self.tail = previous
+        node.previous = node.next = None
+        self._length -= 1
+
+    def insert_after(self, node, value):
+        """Insert value right after `node`
+
+        :param _DoublyNode node: A node of this list
+        :param object value: The value to insert after `node`
+        :returns: The new node, which can be passed to `remove_node()`
+        :rtype: _DoublyNode
+        :Worst-case Time Complexity: O(1)
+        """
+        new = _DoublyNode(value, node, node.next)
+        if node.next is not None:
+            node.next.previous = new
+        else:
+            self.tail = new
+        node.next = new
+        self._length += 1
+        return new
+
+    def move_to_head(self, node):
+        """Moves `node` to the start of the list
+
+        :param _DoublyNode node: A node of this list. Passing a node of another
+        list corrupts both.
+        :Worst-case Time Complexity: O(1)
+        """
+        if node is self.head:
+            return
+
+        previous, next = node.previous, node.next
+        previous.next = next
+        if next is not None:
+            next.previous = previous
+        else:
+            self.tail = previous
+        node.previous = None
+        node.next = self.head
+        self.head.previous = node
+        self.head = node
+
+    def remove_head(self):
+        """Removes the first element of the linked list
+
+        :returns: ``True`` if head is removed, ``False`` otherwise
+        :rtype: bool
+        :Worst-case Time Complexity: O(1)
+        """
+        if self.head is None:
+            return False
+
+        self.remove_node(self.head)
+        return True
+
+    def remove_tail(self):
+        """Removes the last element of the linked list
+
+        :returns: ``True`` if tail is removed, ``False`` otherwise
+        :rtype: bool
+        :Worst-case Time Complexity: O(1)
+        """
+        if self.head is None:
+            return False
+
+        self.remove_node(self.tail)
+        return True
+
+    def pop_head(self):
+        """Removes the first element of the linked list and returns its value
+
+        :raises IndexError: If the list is empty
+        :Worst-case Time Complexity: O(1)
+        """
+        if self.head is None:
+            raise IndexError('pop from empty list')
+
+        node = self.head
+        self.remove_node(node)
+        return node.value
+
+    def pop_tail(self):
+        """Removes the last element of the linked list and returns its value
+
+        :raises IndexError: If the list is empty
+        :Worst-case Time Complexity: O(1)
+        """
+        if self.head is None:
+            raise IndexError('pop from empty list')
+
+        node = self.tail
+        self.remove_node(node)
+        return node.value
+
+    def reverse(self):
+        """Reverses the list in-place
+
+        :Worst-case Time Complexity: O(``len(self)``)
+        """
+        current = self.head
+        while current is not None:
+            current.previous, current.next = current.next, current.previous
+            current = current.previous
+
+        self.head, self.tail = self.tail, self.head
+
+    def view(self):
+        """Returns a lazy view of the values; see ``SinglyLinkedList.view()``
+
+        :rtype: LinkedListView
+        """
+        return LinkedListView(self, self.__class__)
+
+    def __add__(self, other):
+        return self.concat(other)
+
+    def __bool__(self):
+        return self.head is not None
+
+    def __eq__(self, other):
+        """
+        Two linked lists are equal if they have equal values in the same order.
+        """
+        if isinstance(other, self.__class__):
+            if self._length != other._length:
+                return False
+
+            current_self = self.head
+            current_other = other.head
+            while current_self is not None:
+                if current_self.value != current_other.value:
+                    return False
+                current_self = current_self.next
+                current_other = current_other.next
+            return True
+
+        return NotImplemented
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    def __format__(self, formatstr):
+        """
+        A format spec of digits only limits the number of values rendered, e.g.
+        ``'{:10}'.format(ll)`` renders like ``str()`` with at most 10 values.
+        """
+        if not formatstr:
+            return str(self)
+        if formatstr.isdigit():
+            return self.__to_str(int(formatstr))
+        raise ValueError('Unknown format code "{}" for object of type "{}"'.format(
+            formatstr, self.__class__.__name__))
+
+    def __iadd__(self, other):
+        """
+        Another `DoublyLinkedList` is spliced in, leaving it empty; the values of
+        any other iterable are appended.
+        """
+        if isinstance(other, DoublyLinkedList) and other is not self:
+            self.splice(other)
+        else:
+            self.append_all(other)
+        return self
+
+    def __iter__(self):
+        current = self.head
+        while current is not None:
+            yield current.value
+            current = current.next
+
+    def __len__(self):
+        return self._length
+
+    def __nonzero__(self):
+        return self.__bool__()
+
+    def __radd__(self, other):
+        concatenated = self.__class__(other)
+        concatenated.append_all(self)
+        return concatenated
+
+    def __reduce__(self):
+        """Pickles the values as a flat list, like ``SinglyLinkedList`` does"""
+        return (self.__class__, (list(self),))
+
+    def __repr__(self):
+        repr_format = '{}({})'
+        class_name = self.__class__.__name__
+        values, truncated = self.__values(self.repr_limit)
+        if not truncated:
+            return repr_format.format(class_name, str(values) if values else '')
+        strings = [repr(value) for value in values]
+        strings.append('...')
+        return repr_format.format(class_name, '[{}]'.format(', '.join(strings)))
+
+    def __reversed__(self):
+        current = self.tail
+        while current is not None:
+            yield current.value
+            current = current.previous
+
+    def __str__(self):
+        return self.__to_str(self.repr_limit)
+
+    def __to_str(self, limit):
+        """Helper to render the list as a str with at most `limit` values"""
+        values, truncated = self.__values(limit)
+        strings = [str(value) for value in values]
+        if truncated:
+            strings.append('...')
+        return '[{}]'.format(' <-> '.join(strings))
+
+    def __values(self, limit):
+        """Helper to collect at most `limit` values, and whether there were more"""
+        values = []
+        current = self.head
+        while current is not None:
+            if len(values) == limit:
+                return values, True
+            values.append(current.value)
+            current = current.next
+        return values, False
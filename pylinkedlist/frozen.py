@@ -0,0 +1,72 @@
+"""An immutable, hashable singly linked list
+
+A frozen list is to ``SinglyLinkedList`` what ``tuple`` is to ``list``: its
+values are set once, by the constructor, so its fingerprint never changes once
+computed and serves as its hash.
+"""
+from itertools import chain
+
+from singly import SinglyLinkedList
+
+#: The methods of ``SinglyLinkedList`` that change the list
+_MUTATORS = (
+    'append', 'append_all', 'extend', 'prepend', 'splice', 'insert',
+    'remove_first_occurence', 'remove_last_occurence', 'remove_all_occurences',
+    'remove_if', 'remove_many', 'remove_head', 'remove_tail',
+    'reverse', 'sort', 'insert_sorted', 'merge_sorted', 'map_inplace',
+    'filter_inplace', '__setitem__', '__delitem__',
+)
+
+class FrozenSinglyLinkedList(SinglyLinkedList):
+    """An immutable singly linked list, usable as a dict key or set member.
+
+    It has the read-only API of ``SinglyLinkedList``; the methods that would
+    change it raise ``TypeError``. Its values must be hashable for it to be
+    hashed. ``+`` and ``+=`` return a new frozen list, and splicing or merging it
+    into another list is refused, since that would move its nodes.
+
+    It is equal to a mutable list with the same values, but only frozen lists
+    have a hash.
+    """
+
+    _frozen = True
+
+    def __init__(self, elements=None, pool=None, index_stride=None):
+        # The list is only thawed while the constructor fills it
+        self._frozen = False
+        SinglyLinkedList.__init__(self, elements, pool, index_stride)
+        del self._frozen
+
+    def concat(self, other):
+        """Return a new frozen list with the values of this list followed by those
+        of `other`
+
+        :param iterable other: The values to follow the values of this list
+        :rtype: FrozenSinglyLinkedList
+        :Worst-case Time Complexity: O(``len(self) + len(other)``)
+        """
+        return self._like(chain(self, other))
+
+    def __hash__(self):
+        return self.fingerprint()
+
+    def __iadd__(self, other):
+        return self.concat(other)
+
+    def __radd__(self, other):
+        return self._like(chain(other, self))
+
+def _immutable(name):
+    """Helper to make a method that refuses to change a frozen list"""
+    mutator = getattr(SinglyLinkedList, name)
+
+    def method(self, *args, **kwargs):
+        if self._frozen:
+            raise TypeError("'{}' object does not support {}()".format(
+                self.__class__.__name__, name))
+        return mutator(self, *args, **kwargs)
+    method.__name__ = name
+    return method
+
+for _name in _MUTATORS:
+    setattr(FrozenSinglyLinkedList, _name, _immutable(_name))
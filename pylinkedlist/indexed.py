@@ -0,0 +1,299 @@
+"""A singly linked list with a hash index from values to their nodes
+
+Every node is indexed twice: under its value, in list order, and by its
+predecessor. Together they give, for any value, the predecessors of its
+occurences, which is all a singly linked list needs to unlink a node in O(1).
+"""
+import sys
+from collections import OrderedDict
+
+from singly import SinglyLinkedList
+
+#: The size of a node id, the key of every node in the index
+_ID_SIZE = sys.getsizeof(id(SinglyLinkedList))
+
+class IndexedSinglyLinkedList(SinglyLinkedList):
+    """A singly linked list with O(1) average membership, count and removal by value.
+
+    It has the same API as ``SinglyLinkedList``, but its values must be
+    hashable. ``in``, `count()`, `remove_first_occurence()`,
+    `remove_last_occurence()` and `remove_tail()` are O(1) on average and
+    `remove_all_occurences()` is O(number of occurences). The index costs two
+    dict entries per value and an ordered dict per distinct value; both
+    ``sys.getsizeof()`` and `memory_usage()` include it.
+
+    Mutations by position (`insert()`, item assignment and deletion) and
+    `reverse()` rebuild the index in O(``len(self)``); removals by value reset
+    the sparse positional index, if there is one.
+    """
+
+    def __init__(self, elements=None, pool=None, index_stride=None):
+        # Maps every value to an ordered dict of ``id(node): node`` in list order
+        self._occurences = {}
+        # Maps the id of every node to the node before it, or ``None`` for the head
+        self._previous = {}
+        SinglyLinkedList.__init__(self, elements, pool, index_stride)
+
+    def append_all(self, values):
+        if values is None:
+            return
+
+        values = list(values)
+        for value in values:
+            hash(value)
+
+        tail = self.tail
+        SinglyLinkedList.append_all(self, values)
+        self.__index_from(tail)
+
+    extend = append_all
+
+    def splice(self, other):
+        self.__check_hashable(other)
+        tail = self.tail
+        SinglyLinkedList.splice(self, other)
+        self.__index_from(tail)
+
+    def append(self, value):
+        occurences = self._occurences.get(value)
+        if occurences is None:
+            occurences = self._occurences[value] = OrderedDict()
+
+        previous = self.tail
+        SinglyLinkedList.append(self, value)
+        node = self.tail
+        occurences[id(node)] = node
+        self._previous[id(node)] = previous
+
+    def prepend(self, value):
+        occurences = self._occurences.get(value)
+        if occurences is None:
+            occurences = self._occurences[value] = OrderedDict()
+
+        following = self.head
+        SinglyLinkedList.prepend(self, value)
+        node = self.head
+        occurences[id(node)] = node
+        occurences.move_to_end(id(node), last=False)
+        self._previous[id(node)] = None
+        if following is not None:
+            self._previous[id(following)] = node
+
+    def count(self, value):
+        """Return the number of occurences of `value` in the list
+
+        :Average Time Complexity: O(1)
+        """
+        return len(self._occurences.get(value, ()))
+
+    def remove_first_occurence(self, value):
+        """Removes the first occurence of `value` from the linked list
+
+        :returns: ``True`` if value is removed, ``False`` otherwise
+        :rtype: bool
+        :Average Time Complexity: O(1)
+        """
+        occurences = self._occurences.get(value)
+        if not occurences:
+            return False
+
+        node = occurences[next(iter(occurences))]
+        self.__unlink(node)
+        return True
+
+    def remove_last_occurence(self, value):
+        """Removes the last occurence of `value` from the linked list
+
+        :returns: ``True`` if value is removed, ``False`` otherwise
+        :rtype: bool
+        :Average Time Complexity: O(1)
+        """
+        occurences = self._occurences.get(value)
+        if not occurences:
+            return False
+
+        node = occurences[next(reversed(occurences))]
+        self.__unlink(node)
+        return True
+
+    def remove_all_occurences(self, value):
+        """Removes all occurences of `value` from the linked list
+
+        :returns: The number of values removed
+        :rtype: int
+        :Average Time Complexity: O(number of occurences of `value`)
+        """
+        occurences = self._occurences.get(value)
+        if not occurences:
+            return 0
+
+        nodes = list(occurences.values())
+        for node in nodes:
+            self.__unlink(node)
+        return len(nodes)
+
+    def map_inplace(self, function):
+        # Every new value is hashed before any is written into a node
+        values = [function(value) for value in self]
+        for value in values:
+            hash(value)
+
+        values = iter(values)
+        SinglyLinkedList.map_inplace(self, lambda value: next(values))
+        self.__reindex()
+
+    def remove_if(self, predicate):
+        try:
+            count = SinglyLinkedList.remove_if(self, predicate)
+        except BaseException:
+            self.__reindex()
+            raise
+        if count:
+            self.__reindex()
+        return count
+
+    def remove_many(self, values):
+        """Removes all occurences of each of `values`
+
+        :returns: The number of occurences removed for each of `values`
+        :rtype: dict
+        :Average Time Complexity: O(number of occurences removed)
+        """
+        counts = dict.fromkeys(values, 0)
+        for value in counts:
+            counts[value] = self.remove_all_occurences(value)
+        return counts
+
+    def remove_head(self):
+        if self.head is None:
+            return False
+
+        self.__unlink(self.head)
+        return True
+
+    def remove_tail(self):
+        """Removes the last element of the linked list
+
+        :returns: ``True`` if tail is removed, ``False`` otherwise
+        :rtype: bool
+        :Average Time Complexity: O(1)
+        """
+        if self.head is None:
+            return False
+
+        self.__unlink(self.tail)
+        return True
+
+    def reverse(self):
+        SinglyLinkedList.reverse(self)
+        self.__reindex()
+
+    def sort(self, key=None, reverse=False):
+        try:
+            SinglyLinkedList.sort(self, key, reverse)
+        finally:
+            # Even a failed sort may have reordered the nodes
+            self.__reindex()
+
+    def insert_sorted(self, value, key=None, reverse=False):
+        hash(value)
+        position = SinglyLinkedList.insert_sorted(self, value, key, reverse)
+        self.__reindex()
+        return position
+
+    def merge_sorted(self, other, key=None, reverse=False):
+        self.__check_hashable(other)
+        try:
+            SinglyLinkedList.merge_sorted(self, other, key, reverse)
+        finally:
+            self.__reindex()
+
+    def insert(self, index, value):
+        hash(value)
+        SinglyLinkedList.insert(self, index, value)
+        self.__reindex()
+
+    def __setitem__(self, key, value):
+        if isinstance(key, slice):
+            value = list(value)
+            for element in value:
+                hash(element)
+        else:
+            hash(value)
+        SinglyLinkedList.__setitem__(self, key, value)
+        self.__reindex()
+
+    def __delitem__(self, key):
+        SinglyLinkedList.__delitem__(self, key)
+        self.__reindex()
+
+    def _detach_nodes(self):
+        SinglyLinkedList._detach_nodes(self)
+        self._occurences.clear()
+        self._previous.clear()
+
+    def __contains__(self, value):
+        return bool(self._occurences.get(value))
+
+    def __sizeof__(self):
+        """
+        The list object, its nodes and its index: both dicts, the ordered dict of
+        every distinct value and the node ids they are keyed by.
+        """
+        index_size = sys.getsizeof(self._occurences) + sys.getsizeof(self._previous) + \
+                     sum(sys.getsizeof(nodes) for nodes in self._occurences.values())
+        # Every node id is a separate int in each of the two dicts
+        return SinglyLinkedList.__sizeof__(self) + index_size + \
+               2 * self._length * _ID_SIZE
+
+    @staticmethod
+    def __check_hashable(other):
+        """Helper to hash the values of a list before its nodes are moved in"""
+        if isinstance(other, SinglyLinkedList) and \
+           not isinstance(other, IndexedSinglyLinkedList):
+            for value in other:
+                hash(value)
+
+    def __index_from(self, previous):
+        """Helper to index every node after `previous`, or every node if ``None``"""
+        occurences, previous_nodes = self._occurences, self._previous
+        current = previous.next if previous is not None else self.head
+        while current is not None:
+            value_occurences = occurences.get(current.value)
+            if value_occurences is None:
+                value_occurences = occurences[current.value] = OrderedDict()
+            value_occurences[id(current)] = current
+            previous_nodes[id(current)] = previous
+            previous, current = current, current.next
+
+    def __reindex(self):
+        """Helper to rebuild the whole index after a mutation by position"""
+        self._occurences.clear()
+        self._previous.clear()
+        self.__index_from(None)
+
+    def __unlink(self, node):
+        """Helper to unlink an indexed node and drop it from the index"""
+        previous = self._previous.pop(id(node))
+        following = node.next
+
+        # Positions after `node` shift; finding its position would cost O(n)
+        self._invalidate_index(0)
+
+        if previous is not None:
+            previous.next = following
+        else:
+            self.head = following
+        if following is not None:
+            self._previous[id(following)] = previous
+        else:
+            self.tail = previous
+        self._length -= 1
+
+        occurences = self._occurences[node.value]
+        del occurences[id(node)]
+        if not occurences:
+            del self._occurences[node.value]
+
+        if self._pool is not None:
+            self._pool.release(node)
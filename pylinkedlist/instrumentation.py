@@ -0,0 +1,202 @@
+"""Opt-in counters of the calls, nodes traversed and time spent per list method
+
+While an ``Instrumentation`` is enabled, the methods it instruments are
+replaced on their class by wrappers that record every call, and the `next`
+attribute of every node class (``_SinglyNode``, ``_DoublyNode`` and
+``_UnrolledNode``) is replaced by a descriptor that counts how many times it is
+read, i.e. how many nodes are traversed. Disabling it puts the original methods
+and attributes back, so a disabled instrumentation costs nothing at all.
+
+Only reads of `next` are counted, so walking a ``DoublyLinkedList`` backwards
+through `previous` traverses no nodes as far as the counters go, and the nodes
+of an ``UnrolledLinkedList`` are whole blocks of values. The counters are not
+thread-safe, and while enabled every read of `next`, by any list, is a little
+slower.
+"""
+from singly import SinglyLinkedList, _SinglyNode
+from doubly import _DoublyNode
+from unrolled import _UnrolledNode
+from _utils import instrumented
+
+#: The node classes whose `next` reads are counted
+_NODE_CLASSES = (_SinglyNode, _DoublyNode, _UnrolledNode)
+
+#: The methods instrumented by default
+DEFAULT_METHODS = (
+    'append', 'append_all', 'prepend', 'insert', 'splice', 'concat',
+    'remove_first_occurence', 'remove_last_occurence', 'remove_all_occurences',
+    'remove_if', 'remove_many', 'remove_head', 'remove_tail',
+    'reverse', 'sort', 'insert_sorted', 'merge_sorted', 'count',
+    '__contains__', '__eq__', '__getitem__', '__setitem__', '__delitem__',
+    '__iter__',
+)
+
+class _CountingNext(object):
+    """A stand-in for the `next` slot of a node class that counts its reads"""
+
+    def __init__(self, slot):
+        self.slot = slot
+        self.reads = 0
+
+    def __get__(self, node, owner=None):
+        if node is None:
+            return self
+        self.reads += 1
+        return self.slot.__get__(node, owner)
+
+    def __set__(self, node, value):
+        self.slot.__set__(node, value)
+
+    def __delete__(self, node):
+        self.slot.__delete__(node)
+
+# The counting descriptor of each node class, while any instrumentation is
+# enabled, and how many are
+_counting_nexts = None
+_enabled_count = 0
+
+def _nodes_traversed():
+    return sum(counting_next.reads for counting_next in _counting_nexts)
+
+def _install_counting_next():
+    global _counting_nexts, _enabled_count
+    if _enabled_count == 0:
+        _counting_nexts = [_CountingNext(node_class.__dict__['next'])
+                           for node_class in _NODE_CLASSES]
+        for node_class, counting_next in zip(_NODE_CLASSES, _counting_nexts):
+            node_class.next = counting_next
+    _enabled_count += 1
+
+def _uninstall_counting_next():
+    global _counting_nexts, _enabled_count
+    _enabled_count -= 1
+    if _enabled_count == 0:
+        for node_class, counting_next in zip(_NODE_CLASSES, _counting_nexts):
+            node_class.next = counting_next.slot
+        _counting_nexts = None
+
+class Instrumentation(object):
+    """Records the calls to the methods of a list class while enabled.
+
+    For example::
+
+        with Instrumentation() as instrumentation:
+            run_workload()
+        print(instrumentation.prometheus())
+
+    The costs of a call include those of the calls it makes, so a method called
+    by another instrumented method is accounted for in both.
+    """
+
+    def __init__(self, cls=SinglyLinkedList, methods=DEFAULT_METHODS):
+        """
+        :param type cls: The list class whose methods to instrument; subclasses
+        are affected too, unless they override the methods
+        :param iterable methods: The names of the methods to instrument; those
+        the class does not have are skipped
+        """
+        self.cls = cls
+        self.methods = tuple(methods)
+        self._stats = {}
+        # The original methods of `cls` while enabled, None for inherited ones
+        self._originals = None
+
+    @property
+    def enabled(self):
+        """``True`` while the methods of the class are instrumented"""
+        return self._originals is not None
+
+    def enable(self):
+        """Replaces the methods of the class with recording wrappers
+
+        :raises RuntimeError: If this or another instrumentation of the class is
+        already enabled
+        """
+        if self.enabled:
+            raise RuntimeError('the instrumentation is already enabled')
+        if self.cls.__dict__.get('_instrumentation') is not None:
+            raise RuntimeError('{} is already instrumented'.format(self.cls.__name__))
+
+        # Every wrapper is made before anything is replaced, so a failure leaves
+        # the class and the nodes untouched
+        wrappers = {}
+        for name in self.methods:
+            method = getattr(self.cls, name, None)
+            if method is not None:
+                wrappers[name] = instrumented(method, _nodes_traversed, self.__record)
+
+        _install_counting_next()
+        self._originals = {}
+        for name, wrapper in wrappers.items():
+            self._originals[name] = self.cls.__dict__.get(name)
+            setattr(self.cls, name, wrapper)
+        self.cls._instrumentation = self
+
+    def disable(self):
+        """Puts the original methods of the class back; the counters are kept"""
+        if not self.enabled:
+            return
+
+        for name, original in self._originals.items():
+            if original is None:
+                delattr(self.cls, name)
+            else:
+                setattr(self.cls, name, original)
+        del self.cls._instrumentation
+        self._originals = None
+        _uninstall_counting_next()
+
+    def reset(self):
+        """Sets every counter back to zero"""
+        self._stats.clear()
+
+    def snapshot(self):
+        """Returns the counters of every method called so far
+
+        :returns: ``{method name: {'calls': ..., 'nodes': ..., 'seconds': ...}}``
+        :rtype: dict
+        """
+        return dict((name, {'calls': calls, 'nodes': nodes, 'seconds': seconds})
+                    for name, (calls, nodes, seconds) in self._stats.items())
+
+    def prometheus(self, prefix='pylinkedlist'):
+        """Returns the counters in the Prometheus text exposition format
+
+        :param str prefix: The prefix of the metric names
+        :rtype: str
+        """
+        metrics = [
+            ('calls_total', 'Number of calls of each list method', 0),
+            ('nodes_traversed_total', 'Number of nodes traversed by each list method', 1),
+            ('seconds_total', 'Time spent in each list method, in seconds', 2),
+        ]
+        lines = []
+        for suffix, description, field in metrics:
+            name = '{}_{}'.format(prefix, suffix)
+            lines.append('# HELP {} {}'.format(name, description))
+            lines.append('# TYPE {} counter'.format(name))
+            for method in sorted(self._stats):
+                lines.append('{}{{class="{}",method="{}"}} {!r}'.format(
+                    name, self.cls.__name__, method, self._stats[method][field]))
+        return '\n'.join(lines) + '\n'
+
+    def __record(self, name, nodes, seconds):
+        """Helper to add the costs of a call to the counters of its method"""
+        stats = self._stats.get(name)
+        if stats is None:
+            self._stats[name] = [1, nodes, seconds]
+        else:
+            stats[0] += 1
+            stats[1] += nodes
+            stats[2] += seconds
+
+    def __enter__(self):
+        self.enable()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.disable()
+
+    def __repr__(self):
+        return '{}({}, enabled={})'.format(
+            self.__class__.__name__, self.cls.__name__, self.enabled)
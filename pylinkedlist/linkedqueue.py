@@ -0,0 +1,136 @@
+"""A thread-safe FIFO queue on a singly linked list, with separate head and tail locks
+
+This is the two-lock queue of Michael and Scott: the list always starts with a
+dummy node, so producers only ever touch the tail and consumers only ever touch
+the head, and each end is guarded by its own lock. A producer and a consumer
+therefore never wait for each other, only for other producers or consumers
+respectively.
+
+Like the other concurrency modules, it is not imported by the package; import
+it from ``pylinkedlist.linkedqueue``.
+"""
+import threading
+from queue import Empty
+from time import monotonic
+
+from singly import _SinglyNode
+
+class LinkedQueue(object):
+    """An unbounded thread-safe FIFO queue.
+
+    Its API follows ``queue.Queue``: `put()` never blocks, and `get()` can block,
+    with an optional timeout, until a value is available.
+    """
+
+    def __init__(self, elements=None):
+        """
+        :param iterable elements: The initial values of the queue
+        """
+        # `_head` is the dummy node; the first value is in ``_head.next``
+        self._head = self._tail = _SinglyNode()
+        self._head_lock = threading.Lock()
+        self._tail_lock = threading.Lock()
+        self._not_empty = threading.Condition(self._head_lock)
+        # The number of consumers blocked, or about to block, in `get()`
+        self._waiters = 0
+        # Each count is only changed under the lock of its own end
+        self._puts = 0
+        self._gets = 0
+
+        if elements is not None:
+            for value in elements:
+                self.put(value)
+
+    def put(self, value):
+        """Insert value at the end of the queue, waking up a blocked consumer
+
+        :param object value: The value to append to the end of the queue
+        :Worst-case Time Complexity: O(1)
+        """
+        node = _SinglyNode(value)
+        with self._tail_lock:
+            self._tail.next = node
+            self._tail = node
+            self._puts += 1
+
+        # A consumer counts itself as a waiter before it checks for a value, so
+        # either it sees `node` or this sees it waiting
+        if self._waiters:
+            with self._head_lock:
+                self._not_empty.notify()
+
+    put_nowait = put
+
+    def get(self, block=True, timeout=None):
+        """Removes the first value of the queue and returns it
+
+        :param bool block: If ``False``, do not wait for a value
+        :param float timeout: The maximum number of seconds to wait for a
+        value, or ``None`` to wait for as long as it takes
+        :raises queue.Empty: If no value is available in time
+        :raises ValueError: If `timeout` is negative
+        :Worst-case Time Complexity: O(1), not counting the wait
+        """
+        if timeout is not None and timeout < 0:
+            raise ValueError("'timeout' must be a non-negative number")
+
+        with self._head_lock:
+            head = self._head
+            if head.next is None:
+                if not block:
+                    raise Empty
+                self.__wait(timeout)
+                head = self._head
+
+            first = head.next
+            value = first.value
+            # `first` becomes the dummy node; its value must not be kept alive
+            first.value = None
+            self._head = first
+            self._gets += 1
+
+        return value
+
+    def get_nowait(self):
+        """Removes the first value of the queue and returns it, without waiting
+
+        :raises queue.Empty: If the queue is empty
+        """
+        return self.get(block=False)
+
+    def qsize(self):
+        """Returns the approximate number of values in the queue
+
+        Values put or got concurrently may or may not be counted.
+        """
+        return max(self._puts - self._gets, 0)
+
+    def empty(self):
+        """Returns ``True`` if the queue is empty at the time of the call"""
+        return self._head.next is None
+
+    def __wait(self, timeout):
+        """Helper to wait until the queue has a value; the head lock must be held
+
+        :raises queue.Empty: If `timeout` runs out first
+        """
+        self._waiters += 1
+        try:
+            if timeout is None:
+                while self._head.next is None:
+                    self._not_empty.wait()
+            else:
+                deadline = monotonic() + timeout
+                while self._head.next is None:
+                    remaining = deadline - monotonic()
+                    if remaining <= 0.0:
+                        raise Empty
+                    self._not_empty.wait(remaining)
+        finally:
+            self._waiters -= 1
+
+    def __len__(self):
+        return self.qsize()
+
+    def __repr__(self):
+        return '{}(qsize={})'.format(self.__class__.__name__, self.qsize())
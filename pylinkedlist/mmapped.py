@@ -0,0 +1,321 @@
+"""A singly linked list whose nodes live in a memory-mapped file
+
+Every node is a fixed-size record: the file offset of the next record, 0 for
+none, followed by the value packed with a ``struct`` format. The file starts with
+a header holding the offsets of the head, the tail and the first free record,
+the number of values and the end of the used records, so opening an existing
+list only reads the header, whatever its length. The operating system pages the
+records in and out as they are walked over, so a list can be much larger than
+the available memory as long as it is mostly used sequentially.
+
+Removed records are put on a free list, threaded through their next offsets,
+and reused before the file grows. The file grows a whole number of pages at a
+time, by half its size at least, so appending stays amortised O(1).
+"""
+import mmap
+import os
+import struct
+
+#: The header: a magic string, the format version, the value format, and the
+#: offsets of the head, the tail and the first free record, the number of values
+#: and the offset of the end of the used records
+_HEADER = struct.Struct('<4sB15sQQQQQ')
+_MAGIC = b'PLLM'
+_VERSION = 1
+
+#: The offset of the first record; records never start at 0, which means none
+_RECORDS_START = 64
+
+_OFFSET = struct.Struct('<Q')
+
+class MappedSinglyLinkedList(object):
+    """A disk-backed singly linked list of values of a fixed ``struct`` format.
+
+    It supports the end operations, iteration and `reverse()` of
+    ``SinglyLinkedList``. Values are what ``struct`` packs and unpacks: numbers
+    for a format such as ``'q'`` or ``'d'``, bytes for ``'16s'``, and tuples for
+    formats of several fields such as ``'qd'``.
+
+    Changes are written to the mapped file as they are made; `flush()` forces
+    them to disk. The list must be closed, with `close()` or by using it as a
+    context manager, before the file is used by anything else.
+    """
+
+    def __init__(self, path, record_format=None):
+        """
+        :param str path: The file holding the list; it is created if it does not
+        exist or is empty
+        :param str record_format: The ``struct`` format of the values, without a
+        byte order character. Defaults to ``'q'`` for a new file and to the format
+        of an existing file.
+        :raises ValueError: If `path` does not hold a list, or holds a list of
+        another format
+        """
+        exists = os.path.exists(path) and os.path.getsize(path) > 0
+        self._path = path
+        self._file = open(path, 'r+b' if exists else 'w+b')
+        try:
+            if exists:
+                self._map = mmap.mmap(self._file.fileno(), 0)
+                self.__load_header(record_format)
+            else:
+                self.__create(record_format or 'q')
+        except Exception:
+            self._file.close()
+            raise
+
+    @property
+    def path(self):
+        """The path of the file holding the list"""
+        return self._path
+
+    @property
+    def record_format(self):
+        """The ``struct`` format of the values"""
+        return self._format
+
+    @property
+    def closed(self):
+        """``True`` once the list is closed"""
+        return self._map is None
+
+    def append(self, value):
+        """Insert value at the end of the list
+
+        :param value: The value to append, packed with `record_format`
+        :Worst-case Time Complexity: O(1) amortised
+        """
+        offset = self.__allocate(value, 0)
+        if self._head:
+            _OFFSET.pack_into(self._map, self._tail, offset)
+        else:
+            self._head = offset
+        self._tail = offset
+        self._length += 1
+        self.__store_header()
+
+    def append_all(self, values):
+        """Insert all the values at the end of the list
+
+        :param iterable values: The values to append, packed with `record_format`
+        :Worst-case Time Complexity: O(``len(values)``) amortised
+        """
+        if values is None:
+            return
+
+        for value in values:
+            self.append(value)
+
+    extend = append_all
+
+    def prepend(self, value):
+        """Insert value at the start of the list
+
+        :param value: The value to prepend, packed with `record_format`
+        :Worst-case Time Complexity: O(1) amortised
+        """
+        offset = self.__allocate(value, self._head)
+        if not self._head:
+            self._tail = offset
+        self._head = offset
+        self._length += 1
+        self.__store_header()
+
+    def remove_head(self):
+        """Removes the first element of the list and frees its record
+
+        :returns: ``True`` if head is removed, ``False`` otherwise
+        :rtype: bool
+        :Worst-case Time Complexity: O(1)
+        """
+        self.__check_open()
+        if not self._head:
+            return False
+
+        removed = self._head
+        self._head = self.__next(removed)
+        if not self._head:
+            self._tail = 0
+        self.__free(removed)
+        self._length -= 1
+        self.__store_header()
+        return True
+
+    def remove_tail(self):
+        """Removes the last element of the list and frees its record
+
+        :returns: ``True`` if tail is removed, ``False`` otherwise
+        :rtype: bool
+        :Worst-case Time Complexity: O(``len(self)``)
+        """
+        self.__check_open()
+        if not self._head:
+            return False
+
+        removed = self._tail
+        if self._head == removed:
+            self._head = self._tail = 0
+        else:
+            previous = self._head
+            while self.__next(previous) != removed:
+                previous = self.__next(previous)
+            _OFFSET.pack_into(self._map, previous, 0)
+            self._tail = previous
+        self.__free(removed)
+        self._length -= 1
+        self.__store_header()
+        return True
+
+    def reverse(self):
+        """Reverses the list in-place by rewriting the next offsets
+
+        :Worst-case Time Complexity: O(``len(self)``)
+        """
+        self.__check_open()
+        mapped = self._map
+        previous, current = 0, self._head
+        while current:
+            next = self.__next(current)
+            _OFFSET.pack_into(mapped, current, previous)
+            previous, current = current, next
+
+        self._head, self._tail = self._tail, self._head
+        self.__store_header()
+
+    def flush(self):
+        """Writes the changes made so far to disk"""
+        self.__check_open()
+        self._map.flush()
+
+    def close(self):
+        """Flushes and closes the list; closing it again does nothing"""
+        if self._map is None:
+            return
+        self._map.flush()
+        self._map.close()
+        self._map = None
+        self._file.close()
+
+    def __create(self, record_format):
+        """Helper to set up a new list in the empty file"""
+        self.__set_format(record_format)
+        self._head = self._tail = self._free = 0
+        self._length = 0
+        self._end = _RECORDS_START
+        size = mmap.ALLOCATIONGRANULARITY
+        self._file.truncate(size)
+        self._map = mmap.mmap(self._file.fileno(), size)
+        self.__store_header()
+
+    def __load_header(self, record_format):
+        """Helper to read the state of the list from the header of its file"""
+        if len(self._map) < _HEADER.size:
+            raise ValueError('{} does not hold a MappedSinglyLinkedList'.format(self._path))
+        magic, version, stored_format, head, tail, free, length, end = \
+            _HEADER.unpack_from(self._map)
+        if magic != _MAGIC:
+            raise ValueError('{} does not hold a MappedSinglyLinkedList'.format(self._path))
+        if version != _VERSION:
+            raise ValueError('{} holds a list of unsupported version {}'.format(
+                self._path, version))
+
+        stored_format = stored_format.rstrip(b'\0').decode('ascii')
+        if record_format is not None and record_format != stored_format:
+            raise ValueError('{} holds values of format "{}", not "{}"'.format(
+                self._path, stored_format, record_format))
+
+        self.__set_format(stored_format)
+        self._head, self._tail, self._free = head, tail, free
+        self._length, self._end = length, end
+
+    def __set_format(self, record_format):
+        """Helper to set up the structs used to read and write the records"""
+        if len(record_format.encode('ascii')) > 15:
+            raise ValueError('record_format must be at most 15 characters long')
+        self._format = record_format
+        self._value = struct.Struct('<' + record_format)
+        self._single = len(self._value.unpack(bytes(self._value.size))) == 1
+        self._record_size = _OFFSET.size + self._value.size
+
+    def __store_header(self):
+        """Helper to write the state of the list to the header of its file"""
+        _HEADER.pack_into(self._map, 0, _MAGIC, _VERSION, self._format.encode('ascii'),
+                          self._head, self._tail, self._free, self._length, self._end)
+
+    def __next(self, offset):
+        """Helper to read the offset of the record after that at `offset`"""
+        return _OFFSET.unpack_from(self._map, offset)[0]
+
+    def __allocate(self, value, next):
+        """Helper to write a new record, reusing a free one if there is one
+
+        :returns: The offset of the record
+        :rtype: int
+        """
+        self.__check_open()
+        # Packed before a record is taken, so a value that does not fit the
+        # format leaves the file as it was
+        packed = self._value.pack(value) if self._single else self._value.pack(*value)
+
+        record = self._free
+        if record:
+            self._free = self.__next(record)
+        else:
+            record = self._end
+            if record + self._record_size > len(self._map):
+                self.__grow(record + self._record_size)
+            self._end = record + self._record_size
+
+        _OFFSET.pack_into(self._map, record, next)
+        self._map[record + _OFFSET.size:record + self._record_size] = packed
+        return record
+
+    def __free(self, offset):
+        """Helper to put the record at `offset` on the free list"""
+        _OFFSET.pack_into(self._map, offset, self._free)
+        self._free = offset
+
+    def __grow(self, minimum):
+        """Helper to grow the file, and remap it, to at least `minimum` bytes"""
+        granularity = mmap.ALLOCATIONGRANULARITY
+        size = max(minimum, len(self._map) * 3 // 2)
+        size = (size + granularity - 1) // granularity * granularity
+        self._map.close()
+        self._file.truncate(size)
+        self._map = mmap.mmap(self._file.fileno(), size)
+
+    def __check_open(self):
+        """Helper to refuse operations on a closed list"""
+        if self._map is None:
+            raise ValueError('I/O operation on a closed list')
+
+    def __bool__(self):
+        return self._length > 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __iter__(self):
+        self.__check_open()
+        unpack_value = self._value.unpack_from
+        unpack_offset = _OFFSET.unpack_from
+        single = self._single
+        current = self._head
+        while current:
+            mapped = self._map
+            value = unpack_value(mapped, current + _OFFSET.size)
+            yield value[0] if single else value
+            current = unpack_offset(mapped, current)[0]
+
+    def __len__(self):
+        return self._length
+
+    def __nonzero__(self):
+        return self.__bool__()
+
+    def __repr__(self):
+        return '{}({!r}, record_format={!r}, length={})'.format(
+            self.__class__.__name__, self._path, self._format, self._length)
@@ -0,0 +1,142 @@
+"""Map and reduce over the values of a linked list on a pool of workers
+
+A linked list can only be walked from its head, one node at a time, so it cannot
+be split up front like a ``list``. `parallel_map()` and `parallel_reduce()` cut
+it into contiguous chunks of values in a single walk instead, handing every
+chunk to a ``concurrent.futures`` executor as soon as it is cut, so the workers
+start while the rest of the list is being walked. The results of the chunks are
+put back together in list order.
+
+Processes are what make CPU-bound work on many cores pay off, but every chunk,
+the function and the results are then pickled on their way to and from the
+workers, so the function must be defined at the top level of a module and the
+work per value should outweigh the cost of pickling it. Threads avoid pickling
+and suit functions that release the GIL.
+
+Like the other concurrency modules, it is not imported by the package; import
+it from ``pylinkedlist.parallel``.
+"""
+import os
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import reduce
+from itertools import chain, islice
+
+#: The default number of values per chunk
+DEFAULT_CHUNK_SIZE = 10000
+
+_EXECUTORS = {'process': ProcessPoolExecutor, 'thread': ThreadPoolExecutor}
+
+# Tells parallel_reduce() that no initial value was given, since it may be None
+_MISSING = object()
+
+def _map_chunk(function, values):
+    return [function(value) for value in values]
+
+def _reduce_chunk(function, values):
+    return reduce(function, values)
+
+def _run_chunks(worker, function, values, chunk_size, executor, max_workers):
+    """Helper to run `worker` on consecutive chunks of `values` on an executor
+
+    At most a few chunks per worker are waiting to be run at any time, so the
+    values of a long list are not all copied into chunks at once.
+
+    :returns: The results of the chunks, in order
+    :rtype: generator
+    """
+    if chunk_size < 1:
+        raise ValueError('chunk_size must be at least 1, not {}'.format(chunk_size))
+
+    if isinstance(executor, Executor):
+        owned = False
+    else:
+        if executor not in _EXECUTORS:
+            raise ValueError('executor must be "process", "thread" or an Executor, '
+                             'not {!r}'.format(executor))
+        executor = _EXECUTORS[executor](max_workers)
+        owned = True
+
+    max_pending = 4 * (max_workers or os.cpu_count() or 1)
+    pending = deque()
+    try:
+        values = iter(values)
+        chunk = list(islice(values, chunk_size))
+        while chunk:
+            pending.append(executor.submit(worker, function, chunk))
+            if len(pending) >= max_pending:
+                yield pending.popleft().result()
+            chunk = list(islice(values, chunk_size))
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+        if owned:
+            executor.shutdown()
+
+def parallel_map(function, ll, chunk_size=DEFAULT_CHUNK_SIZE, executor='process',
+                 max_workers=None, inplace=False):
+    """Calls `function` on every value of the list on a pool of workers
+
+    :param callable function: Called with each value; it must be picklable, i.e.
+    defined at the top level of a module, to run on processes
+    :param ll: The list whose values to map: any of the lists of this package
+    :param int chunk_size: The number of consecutive values sent to a worker at
+    a time
+    :param executor: ``'process'`` or ``'thread'`` for a pool created for the
+    call and shut down after it, or a ``concurrent.futures.Executor`` to use
+    :param int max_workers: The number of workers of a pool created for the
+    call; defaults to that of ``concurrent.futures``
+    :param bool inplace: If ``True``, the values of `ll` are replaced with the
+    results, with `map_inplace()`, once they are all in; only lists with a
+    `map_inplace()` method, such as ``SinglyLinkedList``, can be mapped in place
+    :returns: A new list configured like `ll`, e.g. with the same type code and
+    capacity, holding the results in order, or ``None`` if `inplace` is ``True``
+    :raises TypeError: If `inplace` is ``True`` and `ll` has no `map_inplace()`
+    :raises ValueError: If `chunk_size` is less than 1 or `executor` is unknown
+    :Worst-case Time Complexity: O(``len(ll)``) work, spread over the workers
+    """
+    if inplace and not hasattr(ll, 'map_inplace'):
+        raise TypeError('cannot map a {} in place'.format(ll.__class__.__name__))
+
+    results = chain.from_iterable(_run_chunks(
+        _map_chunk, function, ll, chunk_size, executor, max_workers))
+    if not inplace:
+        # Lists configured at construction, with a pool or a type code for
+        # instance, make new lists like themselves with `_like()`
+        like = getattr(ll, '_like', ll.__class__)
+        return like(results)
+
+    # The list is walked again only once every result is in, so a failing call
+    # leaves it untouched
+    results = iter(list(results))
+    ll.map_inplace(lambda value: next(results))
+
+def parallel_reduce(function, ll, initial=_MISSING, chunk_size=DEFAULT_CHUNK_SIZE,
+                    executor='process', max_workers=None):
+    """Reduces the values of the list with `function` on a pool of workers
+
+    Every chunk is reduced on its own by a worker, and the results of the chunks
+    are then reduced in order, so `function` must be associative, such as
+    ``operator.add`` or ``max``, for the result to be that of ``reduce()``.
+
+    :param callable function: Called with two values and returning one; it must
+    be picklable, i.e. defined at the top level of a module, to run on processes
+    :param SinglyLinkedList ll: The list whose values to reduce
+    :param initial: If given, placed before the values, as for ``reduce()``; it
+    is only used once, when the results of the chunks are reduced
+    :param int chunk_size: The number of consecutive values sent to a worker at
+    a time
+    :param executor: ``'process'`` or ``'thread'`` for a pool created for the
+    call and shut down after it, or a ``concurrent.futures.Executor`` to use
+    :param int max_workers: The number of workers of a pool created for the
+    call; defaults to that of ``concurrent.futures``
+    :raises TypeError: If the list is empty and no `initial` value is given
+    :raises ValueError: If `chunk_size` is less than 1 or `executor` is unknown
+    :Worst-case Time Complexity: O(``len(ll)``) work, spread over the workers
+    """
+    partials = _run_chunks(_reduce_chunk, function, ll, chunk_size, executor, max_workers)
+    if initial is _MISSING:
+        return reduce(function, partials)
+    return reduce(function, partials, initial)
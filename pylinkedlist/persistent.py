@@ -0,0 +1,179 @@
+"""An immutable singly linked list whose versions share their nodes
+
+A ``PersistentSinglyLinkedList`` is never modified: `prepend()`, `rest()` and
+`concat()` return a new version of the list instead, which reuses the nodes of
+the old one rather than copying them. Since no node ever changes, any number of
+versions can share nodes safely, from any number of threads and without locks,
+and keeping every version of a long history costs one node per value prepended.
+"""
+from itertools import chain
+
+# Nodes and lists refuse attribute assignment, so their slots are set with this
+_set = object.__setattr__
+
+class _PersistentNode(object):
+    """An immutable node, which also records the length of the chain it starts"""
+
+    __slots__ = ('value', 'next', 'length')
+
+    def __init__(self, value, next=None):
+        _set(self, 'value', value)
+        _set(self, 'next', next)
+        _set(self, 'length', 1 if next is None else next.length + 1)
+
+    def __delattr__(self, name):
+        raise AttributeError("'{}' object is immutable".format(self.__class__.__name__))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("'{}' object is immutable".format(self.__class__.__name__))
+
+def _prepend_all(values, head):
+    """Helper to chain new nodes holding `values`, in order, before `head`
+
+    :returns: The first node of the chain
+    :rtype: _PersistentNode
+    """
+    if not isinstance(values, (list, tuple)):
+        values = list(values)
+    for value in reversed(values):
+        head = _PersistentNode(value, head)
+    return head
+
+class PersistentSinglyLinkedList(object):
+    """An immutable singly linked list with O(1) `prepend()` and `rest()`.
+
+    Every operation that would change a ``SinglyLinkedList`` returns a new
+    version of the list here and leaves this one untouched. The versions share
+    their nodes, so forking a list costs nothing and a version is safe to keep,
+    or to hand to another thread, whatever is done with the others.
+
+    The list is hashable if its values are.
+    """
+
+    __slots__ = ('_head',)
+
+    def __init__(self, elements=None):
+        """
+        :param iterable elements: The values of the list
+        """
+        _set(self, '_head', _prepend_all(elements, None) if elements is not None else None)
+
+    @property
+    def head(self):
+        """The first node of the list, or ``None``; nodes cannot be modified"""
+        return self._head
+
+    def prepend(self, value):
+        """Return a new version of the list with `value` inserted at the start
+
+        The new version shares every node of this one.
+
+        :param object value: The value to insert
+        :rtype: PersistentSinglyLinkedList
+        :Worst-case Time Complexity: O(1)
+        """
+        return self.__from_head(_PersistentNode(value, self._head))
+
+    def rest(self):
+        """Return a new version of the list without its first value
+
+        The new version is made of the nodes of this one after the first.
+
+        :rtype: PersistentSinglyLinkedList
+        :raises IndexError: If the list is empty
+        :Worst-case Time Complexity: O(1)
+        """
+        if self._head is None:
+            raise IndexError('rest of an empty list')
+        return self.__from_head(self._head.next)
+
+    def concat(self, other):
+        """Return a new list with the values of this list followed by those of `other`
+
+        A node can only have one successor, so the values of this list are copied
+        into new nodes; the nodes of `other`, if it is a persistent list, are
+        shared rather than copied.
+
+        :param iterable other: The values to follow the values of this list
+        :rtype: PersistentSinglyLinkedList
+        :Worst-case Time Complexity: O(``len(self)``) if `other` is a persistent
+        list, O(``len(self) + len(other)``) otherwise
+        """
+        if isinstance(other, PersistentSinglyLinkedList):
+            following = other._head
+        else:
+            following = _prepend_all(other, None)
+        if self._head is None:
+            return self.__from_head(following)
+        return self.__from_head(_prepend_all(self, following))
+
+    def __from_head(self, head):
+        """Helper to make a list of the same type starting at node `head`"""
+        ll = self.__class__.__new__(self.__class__)
+        _set(ll, '_head', head)
+        return ll
+
+    def __add__(self, other):
+        return self.concat(other)
+
+    def __bool__(self):
+        return self._head is not None
+
+    def __delattr__(self, name):
+        raise AttributeError("'{}' object is immutable".format(self.__class__.__name__))
+
+    def __eq__(self, other):
+        """
+        Two persistent lists are equal if they have equal values in the same
+        order; the comparison stops at the first node they share.
+        """
+        if isinstance(other, PersistentSinglyLinkedList):
+            if len(self) != len(other):
+                return False
+
+            current, other_current = self._head, other._head
+            while current is not other_current:
+                if current.value != other_current.value:
+                    return False
+                current, other_current = current.next, other_current.next
+            return True
+
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(tuple(self))
+
+    def __iter__(self):
+        current = self._head
+        while current is not None:
+            yield current.value
+            current = current.next
+
+    def __len__(self):
+        return self._head.length if self._head is not None else 0
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    def __nonzero__(self):
+        return self.__bool__()
+
+    def __radd__(self, other):
+        return self.__from_head(_prepend_all(other, self._head))
+
+    def __reduce__(self):
+        """
+        A list is pickled as a flat list of its values, so versions that shared
+        nodes no longer do once unpickled.
+        """
+        return (self.__class__, (list(self),))
+
+    def __repr__(self):
+        return '{}({})'.format(self.__class__.__name__, list(self) if self else '')
+
+    def __setattr__(self, name, value):
+        raise AttributeError("'{}' object is immutable".format(self.__class__.__name__))
+
+    def __str__(self):
+        return '[{}]'.format(' -> '.join(str(value) for value in chain(self, [None])))
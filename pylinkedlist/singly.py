@@ -1,4 +1,12 @@
-from _utils import mutates_length
+import sys
+from itertools import repeat
+from operator import itemgetter
+
+from _utils import checks_cycles, mutates_length
+from view import LinkedListView
+
+class CycleError(ValueError):
+    """Raised when a chain of nodes that should end loops back on itself"""
 
 class _SinglyNode(object):
     __slots__ = ['value', 'next']
@@ -13,88 +21,371 @@ class _SinglyNode(object):
     def __bytes__(self):
         raise NotImplementedError()
 
+    def _values(self, limit=None):
+        """Collects the values of this node and of the nodes following it
+
+        :param int limit: The maximum number of values to collect, or ``None``
+        :returns: The values, and whether there were more than `limit` of them
+        :rtype: tuple
+        :raises CycleError: If the chain is cyclic and `limit` is ``None``
+        """
+        values = []
+        # `slow` follows at half the speed, so the two only meet on a cycle
+        current = slow = self
+        while current is not None:
+            if len(values) == limit:
+                return values, True
+            values.append(current.value)
+            current = current.next
+            if limit is None and not len(values) & 1:
+                slow = slow.next
+                if current is slow:
+                    raise CycleError('the chain of nodes is cyclic')
+        return values, False
+
     def __eq__(self, other):
+        """
+        :raises CycleError: If both chains are cyclic and have equal values as far
+        as both cycles go
+        """
         if isinstance(other, _SinglyNode):
-            return (self.value == other.value) and (self.next == other.next)
+            current, other_current = self, other
+            # As in `_values()`, each chain has a pointer following at half speed;
+            # a cyclic chain alone still ends when the other one does
+            slow, other_slow = self, other
+            cyclic = other_cyclic = False
+            steps = 0
+            while (current is not None) and (other_current is not None):
+                if current is other_current:
+                    # The rest of the chain is shared
+                    return True
+                if current.value != other_current.value:
+                    return False
+                current, other_current = current.next, other_current.next
+                steps += 1
+                if not steps & 1:
+                    slow, other_slow = slow.next, other_slow.next
+                    cyclic = cyclic or current is slow
+                    other_cyclic = other_cyclic or other_current is other_slow
+                    if cyclic and other_cyclic:
+                        raise CycleError('both chains of nodes are cyclic')
+            return (current is None) and (other_current is None)
         return NotImplemented
 
     def __format__(self, format_spec):
         if format_spec == 'l':
-            as_list = []
-            current = self
-            while current is not None:
-                as_list.append(current.value)
-                current = current.next
-            return str(as_list)
+            return str(self._values()[0])
         return str(self)
 
     def __nonzero__(self):
         return self.__bool__()
 
     def __repr__(self):
-        string = '_SinglyNode(value={}, next={})'
-        return string.format(self.value, repr(self.next))
+        values = self._values()[0]
+        opening = ''.join('_SinglyNode(value={}, next='.format(value) for value in values)
+        return '{}None{}'.format(opening, ')' * len(values))
 
     def __str__(self):
-        return '{} -> {}'.format(str(self.value), str(self.next))
+        strings = [str(value) for value in self._values()[0]]
+        strings.append(str(None))
+        return ' -> '.join(strings)
+
+def _find_cycle(node):
+    """Finds the cycle the chain of nodes starting at `node` ends in, if any
+
+    This is Brent's algorithm: it walks the chain with two pointers and takes
+    O(1) memory.
+
+    :returns: The position of the first node of the cycle and the number of
+    nodes in the cycle, or ``None`` if the chain ends
+    :rtype: tuple
+    """
+    if node is None:
+        return None
+
+    # Find the length of the cycle: the hare looks for the tortoise, which is
+    # teleported to the hare at every power of two steps
+    power = length = 1
+    tortoise, hare = node, node.next
+    while hare is not tortoise:
+        if hare is None:
+            return None
+        if power == length:
+            tortoise = hare
+            power *= 2
+            length = 0
+        hare = hare.next
+        length += 1
+
+    # Two pointers `length` nodes apart meet at the first node of the cycle
+    tortoise = hare = node
+    for _ in repeat(None, length):
+        hare = hare.next
+    position = 0
+    while tortoise is not hare:
+        tortoise, hare = tortoise.next, hare.next
+        position += 1
+    return position, length
+
+#: The number of bytes taken up by a node, including the garbage collector header
+_NODE_SIZE = sys.getsizeof(_SinglyNode())
+
+#: The fingerprint of the values ``v0, ..., vn-1`` is the polynomial
+#: ``hash(v0) * B**(n-1) + ... + hash(vn-1)`` modulo a Mersenne prime, so appending
+#: or prepending a value updates it in O(1)
+_FINGERPRINT_BASE = 1000003
+_FINGERPRINT_MODULUS = 2**61 - 1
+
+class NodePool(object):
+    """A bounded free list of detached ``_SinglyNode`` objects
+
+    A list given a pool takes its nodes from the pool and gives removed nodes
+    back to it, so append/remove-heavy workloads such as queues allocate far
+    fewer nodes. On CPython this does not make them faster: allocating a node is
+    cheap, and a queue at a steady size frees as many nodes as it allocates, so
+    it triggers no garbage collections either way. ``benchmarks/bench_pool.py``
+    measures pooled queues at anywhere from about 20% slower to slightly faster
+    than plain ones. A pool can be shared by several lists.
+
+    Removed nodes are reset and reused, so references to the nodes of a list
+    using a pool (e.g. an old `head`) must not be held on to.
+    """
+
+    def __init__(self, max_size=1024):
+        """
+        :param int max_size: The maximum number of free nodes kept for reuse
+        """
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.discarded = 0
+        self._free = []
+
+    def acquire(self, value=None):
+        """Returns a node holding `value`, reusing a free node if there is one"""
+        free = self._free
+        if free:
+            self.hits += 1
+            node = free.pop()
+            node.value = value
+            return node
+        self.misses += 1
+        return _SinglyNode(value)
+
+    def release(self, node):
+        """Takes back a node that is no longer linked into any list"""
+        node.value = None
+        node.next = None
+        if len(self._free) < self.max_size:
+            self._free.append(node)
+        else:
+            self.discarded += 1
+
+    def clear(self):
+        """Drops all the free nodes"""
+        del self._free[:]
+
+    def stats(self):
+        """Returns the counters of the pool
+
+        :returns: The number of `hits` and `misses` of `acquire()`, the number of
+        released nodes `discarded` because the pool was full, and the current
+        `size` and `max_size` of the pool
+        :rtype: dict
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'discarded': self.discarded,
+            'size': len(self._free),
+            'max_size': self.max_size,
+        }
+
+    def __len__(self):
+        return len(self._free)
 
 class SinglyLinkedList(object):
     """A singly linked list implementation."""
-    def __init__(self, elements=None):
+
+    #: The maximum number of values rendered by ``str()`` and ``repr()``; the
+    #: rest is elided with ``...``. Set it per class or per list; ``None`` renders
+    #: every value.
+    repr_limit = None
+
+    #: If ``True``, the methods that walk the whole chain of nodes first check it
+    #: for a cycle, in O(``len(self)``) time and O(1) memory, and raise
+    #: ``CycleError`` rather than loop forever. Set it per class or per list.
+    checked = False
+
+    # ``True`` for lists whose values and nodes must never change
+    _frozen = False
+
+    def __init__(self, elements=None, pool=None, index_stride=None):
+        """
+        :param iterable elements: The initial values of the list
+        :param NodePool pool: If given, nodes are taken from and returned to it
+        :param int index_stride: If given, positional access goes through a sparse
+        index of every `index_stride`-th node, which brings it down to
+        O(``len(self) / index_stride + index_stride``). The index is built lazily
+        by positional access and costs one pointer per `index_stride` nodes.
+        """
+        if (index_stride is not None) and (index_stride < 1):
+            raise ValueError('index_stride must be at least 1, not {}'.format(index_stride))
+
         # TODO: Make head and tail properties. Restrict modification using a descriptor?
         self.head = None
         self.tail = self.head
         self._length = 0
+        self._pool = pool
+
+        # The sparse index: ``_skip[j]`` is the node at position
+        # ``_skip_base + j * _index_stride``. It always covers a prefix of the list
+        # and is empty (with a base of 0) whenever it has been invalidated.
+        self._index_stride = index_stride
+        self._skip = []
+        self._skip_base = 0
+
+        # The fingerprint of the values and ``_FINGERPRINT_BASE ** len(self)``, kept
+        # up to date by append() and prepend() once computed; ``None`` when unknown
+        self._fingerprint = None
+        self._fingerprint_power = 1
 
         self.append_all(elements)
 
+    @property
+    def index_stride(self):
+        """The distance between the nodes of the sparse index, or ``None``"""
+        return self._index_stride
+
+    @property
+    def pool(self):
+        """The `NodePool` nodes are recycled through, or ``None``"""
+        return self._pool
+
+    def _like(self, elements=None):
+        """Returns a new list configured like this one; used by the copying methods"""
+        return self.__class__(elements, self._pool, self._index_stride)
+
     def append_all(self, values):
-        """Insert all the values, one by one, at the end of the list
+        """Insert all the values at the end of the list
+
+        The new nodes are chained together locally and linked to the tail in one
+        go, so the list is only touched once however many values there are.
 
-        :param iterable values: The values to append to the list
-        :Worst-case Time Complexity: If `vaues` is a `SinglyLinkedList`, then
-        O(1). If `values` is any other `Iterable`, then O(``len(values)``).
+        Appending another `SinglyLinkedList` copies its values; use `splice()`
+        to move its nodes over in O(1) instead.
+
+        :param iterable values: The values to append to the list; any iterable,
+        including generators and iterators that only provide ``__length_hint__``
+        :Worst-case Time Complexity: O(``len(values)``)
         """
-        if isinstance(values, SinglyLinkedList):
-            if self.head is not None:
-                self.tail.next = values.head
-            else:
-                self.head = values.head
-            self.tail = values.tail
+        if values is None:
             return
 
-        values = values or []
-        for value in values:
-            self.append(value)
+        node_class = _SinglyNode if self._pool is None else self._pool.acquire
+        first = last = _SinglyNode(None)
+        count = 0
+        for count, value in enumerate(values, 1):
+            last.next = last = node_class(value)
+
+        if count == 0:
+            return
+
+        self._fingerprint = None
+        if self.head is not None:
+            self.tail.next = first.next
+        else:
+            self.head = first.next
+        self.tail = last
+        self._length += count
+
+    extend = append_all
+
+    def splice(self, other):
+        """Move all the nodes of `other` to the end of the list
+
+        The nodes are relinked rather than copied, so `other` is left empty.
+
+        :param SinglyLinkedList other: The list whose nodes to move to this list
+        :raises ValueError: If `other` is this list
+        :Worst-case Time Complexity: O(1)
+        """
+        if not isinstance(other, SinglyLinkedList):
+            raise TypeError('can only splice a SinglyLinkedList (not "{}")'.format(
+                other.__class__.__name__))
+        if other is self:
+            raise ValueError('cannot splice a list into itself')
+        if other._frozen:
+            raise TypeError('cannot move the nodes of an immutable list')
+
+        if other.head is None:
+            return
+
+        self._fingerprint = None
+        if self.head is not None:
+            self.tail.next = other.head
+        else:
+            self.head = other.head
+        self.tail = other.tail
+        self._length += other._length
+
+        other._detach_nodes()
+
+    def concat(self, other):
+        """Return a new list with the values of this list followed by those of `other`
+
+        Neither list is modified and the new list shares no nodes with either.
+
+        :param iterable other: The values to follow the values of this list
+        :rtype: SinglyLinkedList
+        :Worst-case Time Complexity: O(``len(self) + len(other)``)
+        """
+        concatenated = self._like(self)
+        concatenated.append_all(other)
+        return concatenated
 
-    @mutates_length(always=True)
     def append(self, value):
         """Insert value at the end of the list
 
         :param object value: The value to append to the end of the list
         :Worst-case Time Complexity: O(1)
         """
-        node = _SinglyNode(value)
+        node = _SinglyNode(value) if self._pool is None else self._pool.acquire(value)
         if self.head is not None:
             self.tail.next = node
             self.tail = self.tail.next
         else:
             self.tail = node
             self.head = self.tail
+        self._length += 1
+
+        if self._fingerprint is not None:
+            self.__add_to_fingerprint(value, False)
 
-    @mutates_length(always=True)
     def prepend(self, value):
         """Insert value at the start of the linked list
 
         :param object value: The value to prepend to the beginning of the list
         :Worst-case Time Complexity: O(1)
         """
-        node = _SinglyNode(value)
+        node = _SinglyNode(value) if self._pool is None else self._pool.acquire(value)
         node.next = self.head
         if self.head is None:
             self.tail = node
         self.head = node
+        self._length += 1
+
+        if self._fingerprint is not None:
+            self.__add_to_fingerprint(value, True)
+
+        if self._skip:
+            # Every indexed node moves one position further from the head
+            self._skip_base += 1
+            if self._skip_base == self._index_stride:
+                self._skip.insert(0, node)
+                self._skip_base = 0
 
+    @checks_cycles
     @mutates_length(decrements=True)
     def remove_first_occurence(self, value):
         """Removes the first occurence of `value` from the linked list
@@ -106,6 +397,7 @@ class SinglyLinkedList(object):
         """
         return self.__remove(value, only_first=True)
 
+    @checks_cycles
     @mutates_length(decrements=True)
     def remove_last_occurence(self, value):
         """Removes the last occurence of `value` from the linked list
@@ -115,16 +407,19 @@ class SinglyLinkedList(object):
         :rtype: bool
         :Worst-case Time Complexity: O(``len(self)``)
         """
-        # Keep track of the last found node and its previous node
-        found_previous, found_node = None, None
+        # Keep track of the last found node, its previous node and its position
+        found_previous, found_node, found_position = None, None, None
         
+        position = 0
         previous, current = None, self.head
         while current is not None:
             if current.value == value:
                 found_node = current
                 found_previous = previous
+                found_position = position
             previous = current
             current = current.next
+            position += 1
 
         if (found_previous is None) and (found_node is None):
             return False
@@ -138,8 +433,12 @@ class SinglyLinkedList(object):
                 self.tail = found_previous
             found_previous.next = found_node.next
 
+        self._invalidate_index(found_position)
+        if self._pool is not None:
+            self._pool.release(found_node)
         return True
 
+    @checks_cycles
     @mutates_length(decrements=True)
     def remove_all_occurences(self, value):
         """Removes all occurences of `value` from the linked list
@@ -161,26 +460,97 @@ class SinglyLinkedList(object):
         :rtype: int
         """
         count = 0 # number of values removed
+        pool = self._pool
 
+        position = 0
         previous, current = None, self.head
         while current is not None:
+            next = current.next
             if current.value == value:
+                if count == 0:
+                    self._invalidate_index(position)
                 count += 1
                 if previous is not None:
-                    previous.next = current.next
+                    previous.next = next
                 else:
-                    self.head = self.head.next
-                if current.next is None:
+                    self.head = next
+                if next is None:
                     self.tail = previous
+                if pool is not None:
+                    pool.release(current)
                 if only_first:
                     break
             else:
                 previous = current
-            current = current.next
+            current = next
+            position += 1
 
         return count
 
-    @mutates_length(decrements=True)
+    @checks_cycles
+    def remove_if(self, predicate):
+        """Removes every value for which `predicate` returns a true value
+
+        All the matching nodes are unlinked in a single traversal.
+
+        :param callable predicate: Called with each value of the list
+        :returns: The number of values removed
+        :rtype: int
+        :Worst-case Time Complexity: O(``len(self)``)
+        """
+        count = 0 # number of values removed
+        pool = self._pool
+
+        position = 0
+        previous, current = None, self.head
+        try:
+            while current is not None:
+                next = current.next
+                if predicate(current.value):
+                    if count == 0:
+                        self._invalidate_index(position)
+                    count += 1
+                    if previous is not None:
+                        previous.next = next
+                    else:
+                        self.head = next
+                    if next is None:
+                        self.tail = previous
+                    if pool is not None:
+                        pool.release(current)
+                else:
+                    previous = current
+                current = next
+                position += 1
+        finally:
+            # The values removed before `predicate` raised, if it did, stay removed
+            self._length -= count
+        return count
+
+    def remove_many(self, values):
+        """Removes all occurences of each of `values` in a single traversal
+
+        :param iterable values: The hashable values to remove all occurences of
+        :returns: The number of occurences removed for each of `values`
+        :rtype: dict
+        :Worst-case Time Complexity: O(``len(self)``)
+        """
+        counts = dict.fromkeys(values, 0)
+
+        def matches(value):
+            try:
+                if value in counts:
+                    counts[value] += 1
+                    return True
+            except TypeError:
+                # An unhashable value cannot be one of the values to remove
+                pass
+            return False
+
+        if counts:
+            self.remove_if(matches)
+        return counts
+
     def remove_head(self):
         """Removes the first element of the linked list
 
@@ -191,16 +561,31 @@ class SinglyLinkedList(object):
         if self.head is None:
             return False
 
-        self.head = self.head.next
+        removed = self.head
+        self.head = removed.next
         if self.head is None:
             self.tail = self.head 
+        self._length -= 1
+        self._fingerprint = None
+
+        if self._skip:
+            # Every indexed node moves one position closer to the head
+            if self._skip_base == 0:
+                del self._skip[0]
+                self._skip_base = self._index_stride - 1 if self._skip else 0
+            else:
+                self._skip_base -= 1
+        if self._pool is not None:
+            self._pool.release(removed)
 
         return True
 
-    @mutates_length(decrements=True)
     def remove_tail(self):
         """Removes the last element of the linked list
 
+        The walk to the node before the tail stops there, and goes through the
+        sparse index if there is one.
+
         :returns: ``True`` if tail is removed, ``False`` otherwise
         :rtype: bool
         :Worst-case Time Complexity: O(``len(self)``)
@@ -208,19 +593,21 @@ class SinglyLinkedList(object):
         if self.head is None:
             return False
 
-        previous, current = None, self.head
-        while current is not None:
-            if current.next is None:
-                self.tail = previous
-                if previous is None:
-                    self.head = previous
-                else:
-                    previous.next = None
-            previous = current
-            current = current.next
+        self._invalidate_index(self._length - 1)
+        removed = self.tail
+        if self.head is removed:
+            self.head = None
+            self.tail = self.head
+        else:
+            self.tail = self._node_at(self._length - 2)
+            self.tail.next = None
+        self._length -= 1
+        if self._pool is not None:
+            self._pool.release(removed)
 
         return True
 
+    @checks_cycles
     def reverse(self):
         """Reverses the list in-place; it can then be traversed backwards
 
@@ -229,6 +616,7 @@ class SinglyLinkedList(object):
         if self.head is None:
             return
 
+        self._invalidate_index(0)
         previous, current, next = None, self.head, self.head.next
 
         while next is not None:
@@ -242,19 +630,608 @@ class SinglyLinkedList(object):
         self.tail = self.head
         self.head = current
 
+    def has_cycle(self):
+        """Return ``True`` if the chain of nodes loops back on itself
+
+        A list only becomes cyclic if the `next` attribute of its nodes is
+        assigned to from outside of the list.
+
+        :rtype: bool
+        :Worst-case Time Complexity: O(``len(self)``), in O(1) memory
+        """
+        return _find_cycle(self.head) is not None
+
+    def find_cycle(self):
+        """Finds where the chain of nodes loops back on itself
+
+        :returns: The position of the first node of the cycle and the number of
+        nodes in the cycle, or ``None`` if the chain ends
+        :rtype: tuple
+        :Worst-case Time Complexity: O(``len(self)``), in O(1) memory
+        """
+        return _find_cycle(self.head)
+
+    def _check_cycles(self):
+        """Helper to raise ``CycleError`` if the chain of nodes is cyclic"""
+        cycle = _find_cycle(self.head)
+        if cycle is not None:
+            raise CycleError('the nodes of the list loop back to position {} '
+                             'after {} nodes'.format(cycle[0], sum(cycle)))
+
+    @checks_cycles
+    def sort(self, key=None, reverse=False):
+        """Sorts the list in-place, stably, like ``list.sort()``
+
+        This is a bottom-up merge sort: every node is merged into a bin of sorted
+        runs of 1, 2, 4, ... nodes, and the bins are merged together at the end.
+        The nodes are relinked rather than copied, so no node is allocated; with
+        a `key`, each value is paired with its key for the duration of the sort.
+
+        :param callable key: Called once with each value; the values are ordered
+        by what it returns
+        :param bool reverse: If ``True``, sort in descending order; equal values
+        keep their order either way
+        :Worst-case Time Complexity: O(``len(self) * log(len(self))``)
+        """
+        if self._length < 2:
+            return
+
+        merge_key = None
+        if key is not None:
+            # Every key is computed before any node is touched, so a failing
+            # `key` leaves the list as it was
+            keys = []
+            current = self.head
+            while current is not None:
+                keys.append(key(current.value))
+                current = current.next
+            current = self.head
+            for value_key in keys:
+                current.value = (value_key, current.value)
+                current = current.next
+            del keys
+            merge_key = itemgetter(0)
+
+        self._invalidate_index(0)
+        # ``bins[i]`` is None or a sorted chain of 2 ** i nodes; the chains of
+        # higher bins hold values from earlier in the list. Every node is always
+        # in a bin, in `carry` or in the unsorted chain from `rest`.
+        bins = []
+        carry, rest, level = None, self.head, 0
+        try:
+            while rest is not None:
+                carry, rest = rest, rest.next
+                carry.next = None
+                level = 0
+                while level < len(bins) and bins[level] is not None:
+                    carry = self.__merge(bins[level], carry, merge_key, reverse)
+                    bins[level] = None
+                    level += 1
+                if level == len(bins):
+                    bins.append(None)
+                bins[level], carry = carry, None
+
+            for level in range(len(bins)):
+                if bins[level] is not None:
+                    carry = bins[level] if carry is None else \
+                            self.__merge(bins[level], carry, merge_key, reverse)
+                    bins[level] = None
+        except BaseException:
+            # A comparison failed: chain every node back together, in no
+            # particular order, so that none is lost
+            if (carry is not None) and (level < len(bins)) and (bins[level] is not None):
+                # The failed merge joined both of its chains into one
+                carry = self.__joined_head(bins[level], carry)
+                bins[level] = None
+            carry = self.__chain([carry] + bins + [rest])
+            raise
+        finally:
+            self.head = carry
+            while carry.next is not None:
+                carry = carry.next
+            self.tail = carry
+
+            if key is not None:
+                current = self.head
+                while current is not None:
+                    current.value = current.value[1]
+                    current = current.next
+
+    @checks_cycles
+    def insert_sorted(self, value, key=None, reverse=False):
+        """Insert value into the sorted list, after any equal values
+
+        :param object value: The value to insert
+        :param callable key: The key the list is sorted by, as for `sort()`
+        :param bool reverse: ``True`` if the list is sorted in descending order
+        :returns: The position `value` was inserted at
+        :rtype: int
+        :Worst-case Time Complexity: O(``len(self)``)
+        """
+        value_key = key(value) if key is not None else value
+        position = 0
+        previous, current = None, self.head
+        while current is not None:
+            current_key = key(current.value) if key is not None else current.value
+            if (current_key < value_key) if reverse else (value_key < current_key):
+                break
+            previous, current = current, current.next
+            position += 1
+
+        if previous is None:
+            self.prepend(value)
+        elif current is None:
+            self.append(value)
+        else:
+            self._invalidate_index(position)
+            node = _SinglyNode(value) if self._pool is None else self._pool.acquire(value)
+            node.next = current
+            previous.next = node
+            self._length += 1
+        return position
+
+    @checks_cycles
+    def merge_sorted(self, other, key=None, reverse=False):
+        """Move all the nodes of the sorted list `other` into this sorted list
+
+        The nodes are relinked rather than copied, so `other` is left empty. The
+        merge is stable: values of this list come before equal values of `other`.
+
+        :param SinglyLinkedList other: The list whose nodes to merge into this list
+        :param callable key: The key both lists are sorted by, as for `sort()`
+        :param bool reverse: ``True`` if both lists are sorted in descending order
+        :raises ValueError: If `other` is this list
+        :Worst-case Time Complexity: O(``len(self) + len(other)``)
+        """
+        if not isinstance(other, SinglyLinkedList):
+            raise TypeError('can only merge a SinglyLinkedList (not "{}")'.format(
+                other.__class__.__name__))
+        if other is self:
+            raise ValueError('cannot merge a list into itself')
+        if other._frozen:
+            raise TypeError('cannot move the nodes of an immutable list')
+        if other.checked:
+            other._check_cycles()
+
+        if other.head is None:
+            return
+        if self.head is None:
+            return self.splice(other)
+
+        last_key = key(self.tail.value) if key is not None else self.tail.value
+        first_key = key(other.head.value) if key is not None else other.head.value
+        if not ((last_key < first_key) if reverse else (first_key < last_key)):
+            # Every value of `other` goes after those of this list
+            return self.splice(other)
+
+        self._invalidate_index(0)
+        try:
+            self.head = self.__merge(self.head, other.head, key, reverse)
+        except BaseException:
+            # `key` or a comparison failed: every node of `other` has been
+            # chained to this list, in no particular order
+            self.head = tail = self.__joined_head(self.head, other.head)
+            while tail.next is not None:
+                tail = tail.next
+            self.tail = tail
+            self._length += other._length
+            other._detach_nodes()
+            raise
+        if self.tail.next is not None:
+            self.tail = other.tail
+        self._length += other._length
+
+        other._detach_nodes()
+
+    @staticmethod
+    def __merge(left, right, key, reverse):
+        """Helper to merge two sorted chains of nodes into one; ties go to `left`
+
+        :returns: The first node of the merged chain
+        :rtype: _SinglyNode
+        """
+        head = tail = None
+        try:
+            left_key = key(left.value) if key is not None else left.value
+            right_key = key(right.value) if key is not None else right.value
+            while True:
+                if (left_key < right_key) if reverse else (right_key < left_key):
+                    node, right = right, right.next
+                    if right is not None:
+                        right_key = key(right.value) if key is not None else right.value
+                else:
+                    node, left = left, left.next
+                    if left is not None:
+                        left_key = key(left.value) if key is not None else left.value
+
+                if tail is None:
+                    head = node
+                else:
+                    tail.next = node
+                tail = node
+
+                if left is None:
+                    tail.next = right
+                    return head
+                if right is None:
+                    tail.next = left
+                    return head
+        except BaseException:
+            # Leave every node in a single chain, which starts at the first node
+            # of one of the two chains, so that the caller can lose none
+            if tail is None:
+                tail, other = left, right
+            else:
+                # The merged nodes are still followed by the rest of the chain
+                # the last of them came from
+                other = left if tail.next is right else right
+            while tail.next is not None:
+                tail = tail.next
+            tail.next = other
+            raise
+
+    @staticmethod
+    def __joined_head(first, second):
+        """Helper to find the first node of the chain `__merge()` left behind when
+        it failed to merge the chains starting at `first` and `second`
+        """
+        current = first
+        while current is not None:
+            if current is second:
+                return first
+            current = current.next
+        return second
+
+    @staticmethod
+    def __chain(chains):
+        """Helper to link chains of nodes, skipping ``None``, one after the other
+
+        :returns: The first node of the linked chain, or ``None``
+        :rtype: _SinglyNode
+        """
+        head = tail = None
+        for chain in chains:
+            if chain is None:
+                continue
+            if tail is None:
+                head = chain
+            else:
+                tail.next = chain
+            tail = chain
+            while tail.next is not None:
+                tail = tail.next
+        return head
+
+    def view(self):
+        """Returns a lazy view of the values, e.g. ``ll.view().filter(f).map(g).take(n)``
+
+        Nothing is copied or run until the view is iterated over or materialised;
+        `materialize()` collects the values into a new list of this type.
+
+        :rtype: LinkedListView
+        """
+        return LinkedListView(self, self._like)
+
+    @checks_cycles
+    def map_inplace(self, function):
+        """Replaces every value with the result of calling `function` on it
+
+        The values are replaced in their nodes, so no node is allocated.
+
+        :param callable function: Called with each value of the list
+        :Worst-case Time Complexity: O(``len(self)``)
+        """
+        self._fingerprint = None
+        current = self.head
+        while current is not None:
+            current.value = function(current.value)
+            current = current.next
+
+    def filter_inplace(self, predicate):
+        """Keeps only the values for which `predicate` returns a true value
+
+        :param callable predicate: Called with each value of the list
+        :returns: The number of values removed
+        :rtype: int
+        :Worst-case Time Complexity: O(``len(self)``)
+        """
+        return self.remove_if(lambda value: not predicate(value))
+
+    @checks_cycles
+    def count(self, value):
+        """Return the number of occurences of `value` in the list
+
+        :param object value: The value to count occurences of
+        :rtype: int
+        :Worst-case Time Complexity: O(``len(self)``)
+        """
+        count = 0
+        current = self.head
+        while current is not None:
+            if current.value == value:
+                count += 1
+            current = current.next
+        return count
+
+    @checks_cycles
+    def fingerprint(self):
+        """Return a hash of the values, in order
+
+        Equal lists have equal fingerprints, so lists with different fingerprints
+        are unequal. The fingerprint is computed on the first call and then kept
+        up to date by `append()` and `prepend()` at the cost of hashing the new
+        value; any other change drops it until the next call. Values changed in
+        their nodes directly are not noticed.
+
+        :rtype: int
+        :raises TypeError: If a value is unhashable
+        :Worst-case Time Complexity: O(``len(self)``), O(1) once computed
+        """
+        if self._fingerprint is None:
+            fingerprint = 0
+            current = self.head
+            while current is not None:
+                fingerprint = (fingerprint * _FINGERPRINT_BASE + hash(current.value)) \
+                    % _FINGERPRINT_MODULUS
+                current = current.next
+            self._fingerprint_power = pow(
+                _FINGERPRINT_BASE, self._length, _FINGERPRINT_MODULUS)
+            self._fingerprint = fingerprint
+        return self._fingerprint
+
+    def insert(self, index, value):
+        """Insert value before position `index`, like ``list.insert()``
+
+        :param int index: The position to insert at; negative positions count from
+        the end and out of range positions insert at the nearest end
+        :param object value: The value to insert
+        :Worst-case Time Complexity: O(``index``), or O(``len(self) / index_stride
+        + index_stride``) with a sparse index
+        """
+        if index < 0:
+            index = max(index + self._length, 0)
+        if index == 0:
+            return self.prepend(value)
+        if index >= self._length:
+            return self.append(value)
+
+        self._invalidate_index(index)
+        previous = self._node_at(index - 1)
+        node = _SinglyNode(value) if self._pool is None else self._pool.acquire(value)
+        node.next = previous.next
+        previous.next = node
+        self._length += 1
+
+    def _node_at(self, index):
+        """Helper to find the node at position `index`, a valid, positive position
+
+        With a sparse index, the walk starts from the closest indexed node at or
+        before `index`; the index is extended first if it does not reach that far.
+        """
+        if index == self._length - 1:
+            return self.tail
+
+        stride = self._index_stride
+        if (stride is None) or (index < stride):
+            return self.__walk(self.head, index)
+
+        skip = self._skip
+        if not skip:
+            skip.append(self.head)
+        base = self._skip_base
+        if index < base:
+            return self.__walk(self.head, index)
+
+        slot, offset = divmod(index - base, stride)
+        if slot >= len(skip):
+            node = skip[-1]
+            for _ in repeat(None, slot + 1 - len(skip)):
+                node = self.__walk(node, stride)
+                skip.append(node)
+        return self.__walk(skip[slot], offset)
+
+    def __walk(self, node, steps):
+        """Helper to follow `steps` next pointers from `node`"""
+        for _ in repeat(None, steps):
+            node = node.next
+        return node
+
+    def _detach_nodes(self):
+        """Helper to empty the list once its nodes have been moved to another list
+
+        The nodes are left untouched, as they now belong to the other list.
+        """
+        self._invalidate_index(0)
+        self.head = None
+        self.tail = self.head
+        self._length = 0
+
+    def _invalidate_index(self, position):
+        """Helper to drop the indexed nodes at or after `position`, and the
+        fingerprint
+
+        Must be called whenever nodes at or after `position` are removed or
+        shift position, before the list is modified.
+        """
+        self._fingerprint = None
+        skip = self._skip
+        if not skip:
+            return
+
+        # The number of indexed nodes before `position`, which stay valid
+        keep = -((self._skip_base - position) // self._index_stride)
+        if keep <= 0:
+            del skip[:]
+            self._skip_base = 0
+        else:
+            del skip[keep:]
+
+    def __add_to_fingerprint(self, value, at_head):
+        """Helper to update the fingerprint for `value` added at either end"""
+        try:
+            value_hash = hash(value)
+        except TypeError:
+            self._fingerprint = None
+            return
+
+        power = self._fingerprint_power
+        if at_head:
+            self._fingerprint = (value_hash * power + self._fingerprint) % _FINGERPRINT_MODULUS
+        else:
+            self._fingerprint = (self._fingerprint * _FINGERPRINT_BASE + value_hash) \
+                % _FINGERPRINT_MODULUS
+        self._fingerprint_power = power * _FINGERPRINT_BASE % _FINGERPRINT_MODULUS
+
+    def __index(self, index):
+        """Helper to turn `index` into a valid, positive position"""
+        try:
+            position = index.__index__()
+        except AttributeError:
+            raise TypeError('list indices must be integers or slices, not {}'.format(
+                index.__class__.__name__))
+        if position < 0:
+            position += self._length
+        if not 0 <= position < self._length:
+            raise IndexError('list index out of range')
+        return position
+
+    def __slice(self, key):
+        """Helper to turn a slice into ``(start, step, count)`` with a positive step
+
+        The positions of the slice are visited in increasing order instead of in
+        the order of the slice, which does not matter for deleting or reading.
+        """
+        start, stop, step = key.indices(self._length)
+        count = len(range(start, stop, step))
+        if step < 0:
+            start, step = start + (count - 1) * step, -step
+        return start, step, count
+
+    def __getitem__(self, key):
+        """
+        Positions and slices are supported, like for ``list``; a slice returns a
+        new list.
+        """
+        if isinstance(key, slice):
+            start, step, count = self.__slice(key)
+            values = []
+            if count:
+                node = self._node_at(start)
+                values.append(node.value)
+                for _ in repeat(None, count - 1):
+                    node = self.__walk(node, step)
+                    values.append(node.value)
+            if key.step is not None and key.step < 0:
+                values.reverse()
+            return self._like(values)
+
+        return self._node_at(self.__index(key)).value
+
+    def __setitem__(self, key, value):
+        """
+        Assigning to a slice with a step replaces as many values as it covers;
+        assigning to a plain slice replaces it with any number of values.
+        """
+        if not isinstance(key, slice):
+            self._node_at(self.__index(key)).value = value
+            self._fingerprint = None
+            return
+
+        values = list(value)
+        if key.step not in (None, 1):
+            start, step, count = self.__slice(key)
+            if len(values) != count:
+                raise ValueError('attempt to assign sequence of size {} to extended '
+                                 'slice of size {}'.format(len(values), count))
+            if key.step < 0:
+                values.reverse()
+            if count:
+                self._fingerprint = None
+                node = self._node_at(start)
+                node.value = values[0]
+                for value in values[1:]:
+                    node = self.__walk(node, step)
+                    node.value = value
+            return
+
+        start, stop, _ = key.indices(self._length)
+        stop = max(start, stop)
+        del self[start:stop]
+        replacement = SinglyLinkedList(values, pool=self._pool)
+        if replacement.head is None:
+            return
+
+        self._invalidate_index(start)
+        previous = self._node_at(start - 1) if start > 0 else None
+        following = previous.next if previous is not None else self.head
+        if previous is not None:
+            previous.next = replacement.head
+        else:
+            self.head = replacement.head
+        replacement.tail.next = following
+        if following is None:
+            self.tail = replacement.tail
+        self._length += replacement._length
+
+    def __delitem__(self, key):
+        if isinstance(key, slice):
+            start, step, count = self.__slice(key)
+        else:
+            start, step, count = self.__index(key), 1, 1
+        if count == 0:
+            return
+
+        self._invalidate_index(start)
+        pool = self._pool
+        previous = self._node_at(start - 1) if start > 0 else None
+        current = previous.next if previous is not None else self.head
+        for removed in range(count):
+            if removed:
+                # The previous node stays put; the next node to remove is `step`
+                # nodes after the one just removed
+                for _ in repeat(None, step - 1):
+                    previous, current = current, current.next
+            next = current.next
+            if previous is not None:
+                previous.next = next
+            else:
+                self.head = next
+            if next is None:
+                self.tail = previous
+            if pool is not None:
+                pool.release(current)
+            current = next
+        self._length -= count
+
     def __add__(self, other):
-        shallow_self_copy = SinglyLinkedList(self)
-        shallow_self_copy.append_all(other)
-        return shallow_self_copy
+        return self.concat(other)
 
     def __bool__(self):
         return self.head is not None
 
+    @checks_cycles
+    def __contains__(self, value):
+        current = self.head
+        while current is not None:
+            if current.value == value:
+                return True
+            current = current.next
+        return False
+
+    @checks_cycles
     def __eq__(self, other):
         """
         Two linked lists are equal if they have equal values in the same order.
+        Lists of different lengths, or with different known fingerprints, are
+        unequal without walking them.
         """
         if isinstance(other, self.__class__):
+            if self._length != other._length:
+                return False
+            if (self._fingerprint is not None) and (other._fingerprint is not None) and \
+               (self._fingerprint != other._fingerprint):
+                return False
+
             self_is_empty = self.head is None
             other_is_empty = other.head is None
 
@@ -285,14 +1262,34 @@ class SinglyLinkedList(object):
         return NotImplemented
 
     def __ne__(self, other):
-        return not self.__eq__(other)
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
 
+    @checks_cycles
     def __format__(self, formatstr):
-        raise NotImplementedError()
+        """
+        A format spec of digits only limits the number of values rendered, e.g.
+        ``'{:10}'.format(ll)`` renders like ``str()`` with at most 10 values.
+        """
+        if not formatstr:
+            return str(self)
+        if formatstr.isdigit():
+            return self.__to_str(int(formatstr))
+        raise ValueError('Unknown format code "{}" for object of type "{}"'.format(
+            formatstr, self.__class__.__name__))
 
     def __iadd__(self, other):
-        raise NotImplementedError()
+        """
+        Another `SinglyLinkedList` is spliced in, leaving it empty; the values of
+        any other iterable, or of an immutable list, are appended.
+        """
+        if isinstance(other, SinglyLinkedList) and other is not self and not other._frozen:
+            self.splice(other)
+        else:
+            self.append_all(other)
+        return self
 
+    @checks_cycles
     def __iter__(self):
         current = self.head
         while current is not None:
@@ -306,18 +1303,85 @@ class SinglyLinkedList(object):
         return self.__bool__()
 
     def __radd__(self, other):
-        return self.__add__(other)
+        concatenated = self._like(other)
+        concatenated.append_all(self)
+        return concatenated
 
+    def __reduce__(self):
+        """
+        A list is pickled as a flat list of its values and rebuilt in one pass,
+        rather than as a chain of nodes, which would recurse once per node. Its
+        pool, if it has one, is not pickled.
+        """
+        return (self.__class__, (list(self), None, self._index_stride))
+
+    @checks_cycles
     def __repr__(self):
         repr_format = '{}({})'
         class_name = self.__class__.__name__
         if self.head is None:
             return repr_format.format(class_name, '')
-        else:
-            return repr_format.format(class_name, format(self.head, 'l'))
 
+        values, truncated = self.head._values(self.repr_limit)
+        if not truncated:
+            return repr_format.format(class_name, str(values))
+        strings = [repr(value) for value in values]
+        strings.append('...')
+        return repr_format.format(class_name, '[{}]'.format(', '.join(strings)))
+
+    @checks_cycles
     def __str__(self):
-        return '[{}]'.format(str(self.head))
+        return self.__to_str(self.repr_limit)
+
+    def __to_str(self, limit):
+        """Helper to render the list as a str with at most `limit` values"""
+        if self.head is None:
+            return '[{}]'.format(str(None))
+
+        values, truncated = self.head._values(limit)
+        strings = [str(value) for value in values]
+        strings.append('...' if truncated else str(None))
+        return '[{}]'.format(' -> '.join(strings))
+
+    @checks_cycles
+    def memory_usage(self, deep=False, seen=None):
+        """Return the number of bytes taken up by the list and its nodes
+
+        The chain is walked once and every object is counted only once, so
+        chains that share nodes, or values that occur several times, are not
+        double counted.
+
+        :param bool deep: If ``True``, the values (``sys.getsizeof()`` of each)
+        are included as well
+        :param set seen: The ids of objects already counted; pass the same set
+        to several calls to measure lists that share nodes or values together
+        :rtype: int
+        :Worst-case Time Complexity: O(``len(self)``)
+        """
+        if seen is None:
+            seen = set()
+
+        total = 0
+        if id(self) not in seen:
+            seen.add(id(self))
+            # The nodes are counted below, as the chain is walked
+            total += sys.getsizeof(self) - self._length * _NODE_SIZE
+
+        current = self.head
+        while (current is not None) and (id(current) not in seen):
+            seen.add(id(current))
+            total += _NODE_SIZE
+            if deep and id(current.value) not in seen:
+                seen.add(id(current.value))
+                total += sys.getsizeof(current.value)
+            current = current.next
+
+        return total
 
     def __sizeof__(self):
-        raise NotImplementedError()
+        """
+        The list object, its attributes and the ``len(self)`` nodes it owns; see
+        `memory_usage()` to include the values.
+        """
+        return object.__sizeof__(self) + sys.getsizeof(self.__dict__) + \
+               self._length * _NODE_SIZE
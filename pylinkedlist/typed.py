@@ -0,0 +1,178 @@
+"""A linked list of numbers stored unboxed in typed blocks
+
+Every node of a ``TypedSinglyLinkedList`` holds an ``array.array`` rather than
+Python objects, so a ``'d'`` list costs about 8 bytes per value instead of the
+48 bytes of a ``_SinglyNode`` plus the 24 bytes of a boxed ``float``. The blocks
+support the buffer protocol, so `buffers()` hands their contents to ``struct``
+or ``numpy.frombuffer`` without copying; `tobytes()` joins them into one copy.
+The list itself does not export a buffer, as its values are not contiguous.
+"""
+import struct
+import sys
+from array import array
+
+from unrolled import UnrolledLinkedList, _UnrolledNode
+
+#: The header written by `dump()`: a magic string, the type code, whether the
+#: values are big-endian and the number of values
+_HEADER = struct.Struct('<4scBQ')
+_MAGIC = b'PLLT'
+
+def _rebuild(cls, typecode, data, capacity):
+    """Rebuilds a pickled ``TypedSinglyLinkedList`` from its bytes"""
+    ll = cls(typecode, None, capacity)
+    ll.frombytes(data)
+    return ll
+
+class TypedSinglyLinkedList(UnrolledLinkedList):
+    """A linked list of numbers of a single ``array`` type code, e.g. ``'d'``.
+
+    It has the same API as ``SinglyLinkedList``. Storing a value that does not
+    fit the type code raises the same ``TypeError`` or ``OverflowError`` as
+    ``array.array`` does.
+    """
+
+    def __init__(self, typecode, elements=None, capacity=1024):
+        """
+        :param str typecode: The ``array`` type code of the values, e.g. ``'d'``
+        :param iterable elements: The initial values of the list
+        :param int capacity: The maximum number of values held by each node
+        """
+        self._typecode = array(typecode).typecode
+        UnrolledLinkedList.__init__(self, elements, capacity)
+
+    @property
+    def typecode(self):
+        """The ``array`` type code of the values"""
+        return self._typecode
+
+    @property
+    def itemsize(self):
+        """The size in bytes of a single value"""
+        return array(self._typecode).itemsize
+
+    def _like(self, elements=None):
+        return self.__class__(self._typecode, elements, self._capacity)
+
+    def _new_block(self, values=()):
+        return array(self._typecode, values)
+
+    def splice(self, other):
+        """Move all the nodes of `other` to the end of the list
+
+        :param TypedSinglyLinkedList other: The list whose nodes to move to this
+        list; it must have the same type code
+        :raises ValueError: If `other` is this list or has another type code
+        :Worst-case Time Complexity: O(1)
+        """
+        if isinstance(other, TypedSinglyLinkedList) and \
+           other._typecode != self._typecode:
+            raise ValueError('cannot splice a list of type code "{}" into one of '
+                             'type code "{}"'.format(other._typecode, self._typecode))
+        UnrolledLinkedList.splice(self, other)
+
+    def frombytes(self, data):
+        """Appends the values of `data`, in the machine representation of the type
+        code, as ``array.frombytes()`` does
+
+        The values are copied block by block without being converted to Python
+        objects.
+
+        :param bytes data: A bytes-like object whose length is a multiple of
+        `itemsize`
+        :raises ValueError: If the length of `data` is not a multiple of `itemsize`
+        :Worst-case Time Complexity: O(``len(data)``)
+        """
+        values = self._new_block()
+        values.frombytes(data)
+        capacity = self._capacity
+
+        start = 0
+        if self.tail is not None:
+            start = capacity - len(self.tail.values)
+            # Raises BufferError while a view of the tail block is alive
+            self.tail.values.extend(values[:start])
+            self._length += min(start, len(values))
+
+        for start in range(start, len(values), capacity):
+            node = _UnrolledNode(values[start:start + capacity])
+            if self.head is not None:
+                self.tail.next = node
+            else:
+                self.head = node
+            self.tail = node
+            self._length += len(node.values)
+
+    def dump(self, fp):
+        """Writes the list to the binary file `fp`, in a format read by `load()`
+
+        The values are written block by block in the machine representation of
+        the type code, after a small header.
+
+        :param fp: A file object opened for writing in binary mode
+        :Worst-case Time Complexity: O(``len(self)``)
+        """
+        fp.write(_HEADER.pack(_MAGIC, self._typecode.encode('ascii'),
+                              sys.byteorder == 'big', self._length))
+        for view in self.buffers():
+            fp.write(view)
+
+    @classmethod
+    def load(cls, fp, capacity=1024):
+        """Reads a list written by `dump()` from the binary file `fp`
+
+        Values written on a machine of the other byte order are byte-swapped.
+
+        :param fp: A file object opened for reading in binary mode
+        :param int capacity: The maximum number of values held by each node
+        :raises ValueError: If `fp` does not hold a list written by `dump()`
+        :rtype: TypedSinglyLinkedList
+        :Worst-case Time Complexity: O(``len(self)``)
+        """
+        header = fp.read(_HEADER.size)
+        if len(header) != _HEADER.size or header[:len(_MAGIC)] != _MAGIC:
+            raise ValueError('not a dumped TypedSinglyLinkedList')
+        _, typecode, big_endian, length = _HEADER.unpack(header)
+
+        ll = cls(typecode.decode('ascii'), None, capacity)
+        size = length * ll.itemsize
+        data = fp.read(size)
+        if len(data) != size:
+            raise ValueError('expected {} bytes of values, got {}'.format(size, len(data)))
+
+        if bool(big_endian) != (sys.byteorder == 'big'):
+            values = ll._new_block()
+            values.frombytes(data)
+            values.byteswap()
+            data = values.tobytes()
+        ll.frombytes(data)
+        return ll
+
+    def buffers(self):
+        """Iterate over a ``memoryview`` of each block, from head to tail
+
+        The views share memory with the list. While a view is alive, its block
+        cannot be resized, so appending to or removing from that block raises
+        ``BufferError``; release the views before mutating the list.
+        """
+        current = self.head
+        while current is not None:
+            yield memoryview(current.values)
+            current = current.next
+
+    def tobytes(self):
+        """Return the values as bytes, in the machine representation of the type code
+
+        :Worst-case Time Complexity: O(``len(self)``)
+        """
+        return b''.join(view.tobytes() for view in self.buffers())
+
+    def __bytes__(self):
+        return self.tobytes()
+
+    def __reduce__(self):
+        """
+        A list is pickled as its type code and the bytes of its values, which is
+        far more compact than pickling every value as a Python object.
+        """
+        return (_rebuild, (self.__class__, self._typecode, self.tobytes(), self._capacity))
@@ -0,0 +1,88 @@
+"""Lazy views over the values of a linked list
+
+A view records a pipeline of steps, such as ``map`` and ``filter``, over the
+values of a list without running it. The steps only run, one value at a time,
+when the view is iterated over or materialised, so no intermediate list is ever
+built and ``take()`` stops the walk over the list as soon as it has enough
+values.
+"""
+from itertools import chain, dropwhile, islice, takewhile
+
+class LinkedListView(object):
+    """A lazy pipeline of steps over the values of an iterable, usually a list.
+
+    Every step returns a new view and leaves this one untouched, so a view can be
+    shared and extended in several directions. A view is iterated over afresh
+    every time, and sees the values the list holds at that moment; the list must
+    not be modified while a view of it is being iterated over.
+    """
+
+    def __init__(self, source, factory=list, steps=()):
+        """
+        :param iterable source: The values to run the steps over
+        :param callable factory: Called with an iterable by `materialize()`; returns
+        the container to collect the values into
+        :param tuple steps: ``(name, function)`` pairs, where `function` takes an
+        iterator and returns the iterator of the values after the step
+        """
+        self._source = source
+        self._factory = factory
+        self._steps = steps
+
+    def map(self, function):
+        """Returns a view of the values passed through `function`"""
+        return self.__then('map', lambda values: map(function, values))
+
+    def filter(self, predicate):
+        """Returns a view of the values for which `predicate` returns a true value"""
+        return self.__then('filter', lambda values: filter(predicate, values))
+
+    def take(self, count):
+        """Returns a view of at most the first `count` values"""
+        return self.__then('take', lambda values: islice(values, count))
+
+    def skip(self, count):
+        """Returns a view of the values after the first `count` ones"""
+        return self.__then('skip', lambda values: islice(values, count, None))
+
+    def take_while(self, predicate):
+        """Returns a view of the values up to the first one failing `predicate`"""
+        return self.__then('take_while', lambda values: takewhile(predicate, values))
+
+    def skip_while(self, predicate):
+        """Returns a view of the values from the first one failing `predicate`"""
+        return self.__then('skip_while', lambda values: dropwhile(predicate, values))
+
+    def concat(self, other):
+        """Returns a view of the values followed by those of the iterable `other`
+
+        Unlike ``+`` on a list, nothing is copied until the view is iterated over.
+        """
+        return self.__then('concat', lambda values: chain(values, other))
+
+    def materialize(self):
+        """Runs the pipeline and collects the values into a new container
+
+        :returns: What `factory` returns, a list of the same type as the source
+        for views returned by ``view()``
+        """
+        return self._factory(self)
+
+    def tolist(self):
+        """Runs the pipeline and collects the values into a ``list``"""
+        return list(self)
+
+    def __then(self, name, step):
+        """Helper to return a new view with `step` appended to the pipeline"""
+        return self.__class__(self._source, self._factory, self._steps + ((name, step),))
+
+    def __iter__(self):
+        values = iter(self._source)
+        for _, step in self._steps:
+            values = step(values)
+        return values
+
+    def __repr__(self):
+        return '{}(<{}>, steps={})'.format(
+            self.__class__.__name__, self._source.__class__.__name__,
+            [name for name, _ in self._steps])
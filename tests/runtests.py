@@ -22,7 +22,11 @@ def make_and_get_suite(test_modules):
 
 def test_modules():
     """Returns a list of names of the test modules"""
-    return ['test_singly']
+    return ['test_singly', 'test_doubly', 'test_unrolled', 'test_typed',
+            'test_indexed', 'test_cache', 'test_linkedqueue',
+            'test_asyncqueue', 'test_mmapped', 'test_view',
+            'test_instrumentation', 'test_frozen', 'test_persistent',
+            'test_parallel']
 
 if __name__ == '__main__':
     suite = make_and_get_suite(test_modules())
@@ -0,0 +1,115 @@
+import asyncio
+import unittest
+from pylinkedlist.asyncqueue import AsyncLinkedQueue
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+class AsyncLinkedQueueTestCase(unittest.TestCase):
+    """Tests for the ``AsyncLinkedQueue`` class"""
+
+    def test_nowait(self):
+        """Are values put and got in order without waiting?"""
+        queue = AsyncLinkedQueue(maxsize=2)
+        self.assertTrue(queue.empty())
+        queue.put_nowait(1)
+        queue.put_nowait(2)
+        self.assertTrue(queue.full())
+        self.assertEqual(queue.qsize(), 2)
+        self.assertRaises(asyncio.QueueFull, queue.put_nowait, 3)
+        self.assertEqual(queue.get_nowait(), 1)
+        self.assertEqual(queue.get_nowait(), 2)
+        self.assertRaises(asyncio.QueueEmpty, queue.get_nowait)
+
+    def test_unbounded(self):
+        """Is a queue with no maxsize never full?"""
+        queue = AsyncLinkedQueue()
+        for value in range(1000):
+            queue.put_nowait(value)
+        self.assertFalse(queue.full())
+        self.assertEqual(len(queue), 1000)
+
+    def test_get_waits(self):
+        """Is a waiting consumer woken up by a producer?"""
+        async def scenario():
+            queue = AsyncLinkedQueue()
+            consumer = asyncio.ensure_future(queue.get())
+            await asyncio.sleep(0)
+            self.assertFalse(consumer.done())
+            await queue.put(42)
+            return await consumer
+        self.assertEqual(run(scenario()), 42)
+
+    def test_put_waits(self):
+        """Does a full queue push back on a producer until there is room?"""
+        async def scenario():
+            queue = AsyncLinkedQueue(maxsize=1)
+            await queue.put(1)
+            producer = asyncio.ensure_future(queue.put(2))
+            await asyncio.sleep(0)
+            self.assertFalse(producer.done())
+            self.assertEqual(await queue.get(), 1)
+            await producer
+            return queue.get_nowait()
+        self.assertEqual(run(scenario()), 2)
+
+    def test_get_batch(self):
+        """Are all the available values got at once, up to the limit?"""
+        async def scenario():
+            queue = AsyncLinkedQueue()
+            consumer = asyncio.ensure_future(queue.get_batch(3))
+            await asyncio.sleep(0)
+            for value in range(5):
+                queue.put_nowait(value)
+            first = await consumer
+            second = await queue.get_batch(10)
+            return first, second
+        self.assertEqual(run(scenario()), ([0, 1, 2], [3, 4]))
+
+        queue = AsyncLinkedQueue()
+        self.assertRaises(ValueError, run, queue.get_batch(0))
+
+    def test_get_batch_wakes_producers(self):
+        """Are the producers waiting for room woken up for a whole batch?"""
+        async def scenario():
+            queue = AsyncLinkedQueue(maxsize=2)
+            queue.put_nowait(0)
+            queue.put_nowait(1)
+            producers = [asyncio.ensure_future(queue.put(value)) for value in (2, 3)]
+            await asyncio.sleep(0)
+            batch = await queue.get_batch(2)
+            await asyncio.gather(*producers)
+            return batch, await queue.get_batch(2)
+        self.assertEqual(run(scenario()), ([0, 1], [2, 3]))
+
+    def test_cancelled_getter(self):
+        """Does a cancelled consumer leave the queue and pass on its wakeup?"""
+        async def scenario():
+            queue = AsyncLinkedQueue()
+            first = asyncio.ensure_future(queue.get())
+            second = asyncio.ensure_future(queue.get())
+            await asyncio.sleep(0)
+            queue.put_nowait(1)
+            first.cancel()
+            value = await second
+            self.assertTrue(first.cancelled())
+            self.assertEqual(len(queue._getters), 0)
+            return value
+        self.assertEqual(run(scenario()), 1)
+
+    def test_timeout(self):
+        """Does a consumer timing out unlink its waiter?"""
+        async def scenario():
+            queue = AsyncLinkedQueue()
+            with self.assertRaises(asyncio.TimeoutError):
+                await asyncio.wait_for(queue.get(), 0.01)
+            return len(queue._getters)
+        self.assertEqual(run(scenario()), 0)
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.TestLoader().loadTestsFromTestCase(AsyncLinkedQueueTestCase))
+    return suite
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,163 @@
+import random
+import unittest
+from pylinkedlist import LFUCache, LRUCache
+
+class LRUCacheTestCase(unittest.TestCase):
+    """Tests for the ``LRUCache`` class"""
+
+    def test_get_put(self):
+        """Are values cached and looked up, and are hits and misses counted?"""
+        cache = LRUCache(maxsize=2)
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(cache.get('a', 0), 0)
+        cache.put('a', 1)
+        cache['b'] = 2
+        self.assertEqual(cache.get('a'), 1)
+        self.assertEqual(cache['b'], 2)
+        self.assertRaises(KeyError, cache.__getitem__, 'c')
+        self.assertIn('a', cache)
+        self.assertNotIn('c', cache)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.stats(), {
+            'hits': 2, 'misses': 3, 'evictions': 0, 'size': 2, 'weight': 2})
+
+    def test_eviction_order(self):
+        """Is the least recently used entry evicted first?"""
+        evicted = []
+        cache = LRUCache(maxsize=3, on_evict=lambda key, value: evicted.append((key, value)))
+        for key in 'abc':
+            cache.put(key, key.upper())
+        cache.get('a')
+        cache.touch('b')
+        cache.put('d', 'D')
+        self.assertEqual(evicted, [('c', 'C')])
+        self.assertEqual(list(cache), ['d', 'b', 'a'])
+
+        # Replacing a value is a use of the entry, and is not an eviction
+        cache.put('a', 'A2')
+        cache.put('e', 'E')
+        self.assertEqual(evicted, [('c', 'C'), ('b', 'B')])
+        self.assertEqual(list(cache), ['e', 'a', 'd'])
+        self.assertEqual(cache.stats()['evictions'], 2)
+        self.assertFalse(cache.touch('b'))
+
+    def test_weight(self):
+        """Are entries evicted once their total weight is exceeded?"""
+        cache = LRUCache(maxsize=None, maxweight=10, weigher=lambda key, value: len(value))
+        cache.put('a', 'xxxx')
+        cache.put('b', 'xxxx')
+        self.assertEqual(cache.weight, 8)
+        cache.put('c', 'xxx')
+        self.assertEqual(list(cache), ['c', 'b'])
+        self.assertEqual(cache.weight, 7)
+
+        # A heavier value for a cached key evicts the other entries, never itself
+        cache.put('c', 'x' * 10)
+        self.assertEqual(list(cache), ['c'])
+        self.assertEqual(cache.weight, 10)
+
+        self.assertRaises(ValueError, cache.put, 'd', 'x' * 11)
+        self.assertEqual(list(cache), ['c'])
+
+    def test_pop_clear(self):
+        """Are entries removed explicitly without being reported as evicted?"""
+        evicted = []
+        cache = LRUCache(on_evict=lambda key, value: evicted.append(key))
+        cache.put('a', 1)
+        cache.put('b', 2)
+        self.assertEqual(cache.pop('a'), 1)
+        self.assertEqual(cache.pop('a', None), None)
+        self.assertRaises(KeyError, cache.pop, 'a')
+        del cache['b']
+        self.assertEqual(len(cache), 0)
+        cache.put('c', 3)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.weight, 0)
+        self.assertEqual(list(cache), [])
+        self.assertEqual(evicted, [])
+
+    def test_invalid_limits(self):
+        """Are limits that cannot hold any entry rejected?"""
+        self.assertRaises(ValueError, LRUCache, maxsize=0)
+        self.assertRaises(ValueError, LRUCache, maxweight=0)
+
+class LFUCacheTestCase(unittest.TestCase):
+    """Tests for the ``LFUCache`` class"""
+
+    def test_eviction_order(self):
+        """Is the least frequently, then least recently, used entry evicted first?"""
+        evicted = []
+        cache = LFUCache(maxsize=3, on_evict=lambda key, value: evicted.append(key))
+        for key in 'abc':
+            cache.put(key, key.upper())
+        cache.get('a')
+        cache.get('a')
+        cache.get('b')
+        self.assertEqual([cache.frequency(key) for key in 'abcz'], [3, 2, 1, 0])
+
+        cache.put('d', 'D')
+        self.assertEqual(evicted, ['c'])
+        cache.put('e', 'E')
+        self.assertEqual(evicted, ['c', 'd'])
+        self.assertEqual(list(cache), ['a', 'b', 'e'])
+
+    def test_new_entry_is_kept(self):
+        """Is a new entry kept even though it is the least frequently used?"""
+        cache = LFUCache(maxsize=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')
+        cache.get('b')
+        cache.put('c', 3)
+        self.assertIn('c', cache)
+        self.assertEqual(len(cache), 2)
+
+    def test_replace_least_frequent(self):
+        """Is a replaced entry kept when it was alone among the least frequently used?"""
+        cache = LFUCache(maxsize=None, maxweight=4, weigher=lambda key, value: value)
+        cache.put('a', 1)
+        cache.put('b', 1)
+        cache.put('c', 1)
+        for key in 'aacc':
+            cache.get(key)
+        cache.put('b', 3)
+        self.assertEqual(list(cache), ['c', 'b'])
+        self.assertEqual(cache.frequency('b'), 2)
+        self.assertEqual(cache.weight, 4)
+
+    def test_random_operations(self):
+        """Does the cache agree with a naive LFU model through random operations?"""
+        randomiser = random.Random(3)
+        cache = LFUCache(maxsize=8)
+        # key -> [value, frequency, last use]
+        model = {}
+        for step in range(3000):
+            key = randomiser.randrange(16)
+            if randomiser.random() < 0.5:
+                expected = model[key][0] if key in model else None
+                self.assertEqual(cache.get(key), expected)
+                if key in model:
+                    model[key][1] += 1
+                    model[key][2] = step
+            elif key in model:
+                cache.put(key, step)
+                model[key] = [step, model[key][1] + 1, step]
+            else:
+                if len(model) == 8:
+                    victim = min(model, key=lambda k: (model[k][1], model[k][2]))
+                    del model[victim]
+                cache.put(key, step)
+                model[key] = [step, 1, step]
+            self.assertEqual(len(cache), len(model))
+        for key in model:
+            self.assertEqual(cache.frequency(key), model[key][1])
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.TestLoader().loadTestsFromTestCase(LRUCacheTestCase))
+    suite.addTest(unittest.TestLoader().loadTestsFromTestCase(LFUCacheTestCase))
+    return suite
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,244 @@
+import pickle
+import unittest
+import warnings
+from pylinkedlist.doubly import _DoublyNode
+from pylinkedlist import DoublyLinkedList
+
+class DoublyNodeTestCase(unittest.TestCase):
+    """Tests for the ``_DoublyNode`` class"""
+
+    def test_ctor(self):
+        """Is a new node created with its value and neighbours correctly initialised?"""
+        node = _DoublyNode()
+        self.assertIsNone(node.value)
+        self.assertIsNone(node.previous)
+        self.assertIsNone(node.next)
+        self.assertFalse(node)
+
+        other = _DoublyNode(42, next=node)
+        self.assertEqual(other.value, 42)
+        self.assertIs(other.next, node)
+        self.assertTrue(other)
+
+    def test_slots(self):
+        """Are nodes restricted to their slots?"""
+        node = _DoublyNode()
+        self.assertRaises(AttributeError, setattr, node, 'other', 1)
+
+class DoublyLinkedListTestCase(unittest.TestCase):
+    """Tests for the ``DoublyLinkedList`` class"""
+
+    def setUp(self):
+        self.ll = DoublyLinkedList()
+        self.assertEqual(len(self.ll), 0)
+        assert self.ll.head is None
+        assert self.ll.tail is None
+
+    def test_ctor(self):
+        """Is a newly constructed list correcty initialised?"""
+        values = [1, 2, 3, 4, 5]
+        self.ll = DoublyLinkedList(values)
+        self.assertEqual(len(self.ll), len(values))
+        self.__compare_with_list(self.ll, values)
+
+    def test_append_all(self):
+        """Are values appended in bulk, copying the values of other lists?"""
+        values = [1, 2, 3]
+        self.ll.append_all(iter(values))
+        self.__compare_with_list(self.ll, values)
+
+        other = DoublyLinkedList([4, 5])
+        self.ll.extend(other)
+        self.__compare_with_list(self.ll, [1, 2, 3, 4, 5])
+        self.assertIsNot(self.ll.tail, other.tail)
+        self.__compare_with_list(other, [4, 5])
+
+        self.ll.append_all([])
+        self.__compare_with_list(self.ll, [1, 2, 3, 4, 5])
+
+    def test_append_prepend(self):
+        """Do append() and prepend() link in new nodes and return them?"""
+        node = self.ll.append(2)
+        self.assertIs(self.ll.head, node)
+        self.assertIs(self.ll.tail, node)
+
+        node = self.ll.append(3)
+        self.assertIs(self.ll.tail, node)
+        node = self.ll.prepend(1)
+        self.assertIs(self.ll.head, node)
+        self.assertEqual(len(self.ll), 3)
+        self.__compare_with_list(self.ll, [1, 2, 3])
+
+    def test_remove_occurences(self):
+        """Do the remove_*_occurence(s)() methods behave as expected?"""
+        self.assertFalse(self.ll.remove_first_occurence(1))
+        self.assertFalse(self.ll.remove_last_occurence(1))
+        self.assertEqual(self.ll.remove_all_occurences(1), 0)
+
+        self.ll = DoublyLinkedList([1, 2, 3, 2, 1])
+        self.assertTrue(self.ll.remove_first_occurence(2))
+        self.__compare_with_list(self.ll, [1, 3, 2, 1])
+        self.assertTrue(self.ll.remove_last_occurence(1))
+        self.__compare_with_list(self.ll, [1, 3, 2])
+        self.assertFalse(self.ll.remove_last_occurence(42))
+
+        self.ll = DoublyLinkedList([1, 2, 1, 1])
+        self.assertEqual(self.ll.remove_all_occurences(1), 3)
+        self.__compare_with_list(self.ll, [2])
+        self.assertEqual(self.ll.remove_all_occurences(2), 1)
+        self.__compare_with_list(self.ll, [])
+
+    def test_remove_node(self):
+        """Is a node removed in O(1) given its handle?"""
+        nodes = [self.ll.append(value) for value in range(5)]
+        self.ll.remove_node(nodes[2])
+        self.__compare_with_list(self.ll, [0, 1, 3, 4])
+        self.ll.remove_node(nodes[0])
+        self.ll.remove_node(nodes[4])
+        self.__compare_with_list(self.ll, [1, 3])
+        self.ll.remove_node(nodes[1])
+        self.ll.remove_node(nodes[3])
+        self.__compare_with_list(self.ll, [])
+
+        node = self.ll.append(5)
+        self.ll.append(6)
+        self.ll.remove_node(node)
+        self.assertRaises(ValueError, self.ll.remove_node, node)
+        self.assertRaises(ValueError, self.ll.remove_node, nodes[3])
+        self.__compare_with_list(self.ll, [6])
+        self.ll.remove_tail()
+        self.assertRaises(ValueError, self.ll.remove_node, node)
+        self.__compare_with_list(self.ll, [])
+
+    def test_insert_after(self):
+        """Is a value inserted right after a node?"""
+        first = self.ll.append(1)
+        last = self.ll.insert_after(first, 3)
+        self.assertIs(self.ll.tail, last)
+        self.ll.insert_after(first, 2)
+        self.__compare_with_list(self.ll, [1, 2, 3])
+
+    def test_move_to_head(self):
+        """Is a node moved to the start of the list?"""
+        nodes = [self.ll.append(value) for value in range(4)]
+        self.ll.move_to_head(nodes[0])
+        self.__compare_with_list(self.ll, [0, 1, 2, 3])
+        self.ll.move_to_head(nodes[2])
+        self.__compare_with_list(self.ll, [2, 0, 1, 3])
+        self.ll.move_to_head(nodes[3])
+        self.__compare_with_list(self.ll, [3, 2, 0, 1])
+
+    def test_remove_head_tail(self):
+        """Are both ends removed as expected?"""
+        self.assertFalse(self.ll.remove_head())
+        self.assertFalse(self.ll.remove_tail())
+
+        self.ll = DoublyLinkedList([1, 2, 3])
+        self.assertTrue(self.ll.remove_tail())
+        self.__compare_with_list(self.ll, [1, 2])
+        self.assertTrue(self.ll.remove_head())
+        self.__compare_with_list(self.ll, [2])
+        self.assertTrue(self.ll.remove_tail())
+        self.__compare_with_list(self.ll, [])
+
+    def test_pop(self):
+        """Do pop_head() and pop_tail() return the removed values?"""
+        self.assertRaises(IndexError, self.ll.pop_head)
+        self.assertRaises(IndexError, self.ll.pop_tail)
+
+        self.ll = DoublyLinkedList([1, 2, 3])
+        self.assertEqual(self.ll.pop_tail(), 3)
+        self.assertEqual(self.ll.pop_head(), 1)
+        self.assertEqual(self.ll.pop_tail(), 2)
+        self.__compare_with_list(self.ll, [])
+
+    def test_reverse(self):
+        """Is a linked list reversed as expected?"""
+        self.ll.reverse()
+        self.__compare_with_list(self.ll, [])
+
+        for values in ([1], [1, 2], [1, 2, 3], [1, None, 1, None]):
+            self.ll = DoublyLinkedList(values)
+            self.ll.reverse()
+            self.__compare_with_list(self.ll, values[::-1])
+
+    def test_reversed(self):
+        """Is a linked list iterated backwards by reversed()?"""
+        self.assertEqual(list(reversed(self.ll)), [])
+        values = [1, 2, 3]
+        self.ll = DoublyLinkedList(values)
+        self.assertEqual(list(reversed(self.ll)), values[::-1])
+
+    def test_splice_concat(self):
+        """Do splice(), concat() and the arithmetic operators behave as expected?"""
+        other = DoublyLinkedList([3, 4])
+        self.ll = DoublyLinkedList([1, 2])
+        self.ll.splice(other)
+        self.__compare_with_list(self.ll, [1, 2, 3, 4])
+        self.__compare_with_list(other, [])
+        self.assertRaises(ValueError, self.ll.splice, self.ll)
+
+        concatenated = self.ll.concat([5])
+        self.__compare_with_list(concatenated, [1, 2, 3, 4, 5])
+        self.__compare_with_list(self.ll, [1, 2, 3, 4])
+
+        self.__compare_with_list(self.ll + [5], [1, 2, 3, 4, 5])
+        self.__compare_with_list([0] + self.ll, [0, 1, 2, 3, 4])
+
+        other = DoublyLinkedList([5])
+        self.ll += other
+        self.__compare_with_list(self.ll, [1, 2, 3, 4, 5])
+        self.__compare_with_list(other, [])
+
+    def test_pickle(self):
+        """Is a long list pickled and rebuilt with all its links?"""
+        self.ll = DoublyLinkedList(range(100000))
+        unpickled = pickle.loads(pickle.dumps(self.ll, pickle.HIGHEST_PROTOCOL))
+        self.__compare_with_list(unpickled, list(range(100000)))
+
+    def test_eq_ne(self):
+        """Does __eq__ and __ne__ behave and return the expected results?"""
+        self.assertEqual(self.ll, DoublyLinkedList())
+        self.assertNotEqual(self.ll, DoublyLinkedList([1]))
+        self.assertEqual(DoublyLinkedList([1, 2]), DoublyLinkedList([1, 2]))
+        self.assertNotEqual(DoublyLinkedList([1, 2]), DoublyLinkedList([1, 3]))
+        self.assertNotEqual(DoublyLinkedList([1, 2]), DoublyLinkedList([1, 2, 2]))
+
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            self.assertTrue(DoublyLinkedList([1]) != 5)
+            self.assertFalse(DoublyLinkedList([1]) == 5)
+
+    def test_str_repr(self):
+        """Is a linked list rendered as expected, with and without a limit?"""
+        self.assertEqual(str(self.ll), '[]')
+        self.assertEqual(repr(self.ll), 'DoublyLinkedList()')
+
+        self.ll = DoublyLinkedList([1, 2, 3])
+        self.assertEqual(str(self.ll), '[1 <-> 2 <-> 3]')
+        self.assertEqual(repr(self.ll), 'DoublyLinkedList([1, 2, 3])')
+        self.assertEqual('{:1}'.format(self.ll), '[1 <-> ...]')
+
+        self.ll.repr_limit = 2
+        self.assertEqual(str(self.ll), '[1 <-> 2 <-> ...]')
+        self.assertEqual(repr(self.ll), 'DoublyLinkedList([1, 2, ...])')
+
+    def __compare_with_list(self, ll, list_):
+        """Helper to compare the links, values and size of a linked list with a list"""
+        self.assertEqual(len(ll), len(list_))
+        previous, current = None, ll.head
+        for value in list_:
+            self.assertEqual(current.value, value)
+            self.assertIs(current.previous, previous)
+            previous, current = current, current.next
+        self.assertIsNone(current)
+        self.assertIs(ll.tail, previous)
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.TestLoader().loadTestsFromTestCase(DoublyNodeTestCase))
+    suite.addTest(unittest.TestLoader().loadTestsFromTestCase(DoublyLinkedListTestCase))
+    return suite
+
+if __name__ == '__main__':
+    unittest.main()
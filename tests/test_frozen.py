@@ -0,0 +1,106 @@
+import pickle
+import unittest
+import warnings
+from pylinkedlist import FrozenSinglyLinkedList, SinglyLinkedList
+
+class FrozenSinglyLinkedListTestCase(unittest.TestCase):
+    """Tests for the ``FrozenSinglyLinkedList`` class"""
+
+    def setUp(self):
+        self.ll = FrozenSinglyLinkedList([1, 2, 3])
+
+    def test_ctor(self):
+        """Is a newly constructed list filled and then frozen?"""
+        self.assertIsInstance(self.ll, SinglyLinkedList)
+        self.assertEqual(list(self.ll), [1, 2, 3])
+        self.assertEqual(len(self.ll), 3)
+        self.assertEqual(len(FrozenSinglyLinkedList()), 0)
+        self.assertRaises(TypeError, self.ll.append, 4)
+
+    def test_mutators_raise(self):
+        """Do all the methods that would change the list raise TypeError?"""
+        mutators = [
+            lambda ll: ll.append(4),
+            lambda ll: ll.extend([4]),
+            lambda ll: ll.prepend(0),
+            lambda ll: ll.splice(SinglyLinkedList([4])),
+            lambda ll: ll.insert(0, 0),
+            lambda ll: ll.remove_first_occurence(1),
+            lambda ll: ll.remove_all_occurences(1),
+            lambda ll: ll.remove_many([1]),
+            lambda ll: ll.remove_head(),
+            lambda ll: ll.remove_tail(),
+            lambda ll: ll.reverse(),
+            lambda ll: ll.sort(),
+            lambda ll: ll.insert_sorted(2),
+            lambda ll: ll.merge_sorted(SinglyLinkedList([4])),
+            lambda ll: ll.map_inplace(str),
+            lambda ll: ll.filter_inplace(bool),
+            lambda ll: ll.__setitem__(0, 4),
+            lambda ll: ll.__delitem__(0),
+        ]
+        for mutator in mutators:
+            self.assertRaises(TypeError, mutator, self.ll)
+        self.assertEqual(list(self.ll), [1, 2, 3])
+
+    def test_nodes_are_not_moved(self):
+        """Is moving the nodes of a frozen list into another list refused?"""
+        other = SinglyLinkedList([0])
+        self.assertRaises(TypeError, other.splice, self.ll)
+        self.assertRaises(TypeError, other.merge_sorted, self.ll)
+
+        other += self.ll
+        self.assertEqual(list(other), [0, 1, 2, 3])
+        self.assertEqual(list(self.ll), [1, 2, 3])
+
+    def test_hash(self):
+        """Can equal frozen lists be used interchangeably as dict keys?"""
+        other = FrozenSinglyLinkedList(value for value in [1, 2, 3])
+        self.assertEqual(hash(self.ll), hash(other))
+        self.assertEqual({self.ll: 'a'}[other], 'a')
+        self.assertEqual(len(set([self.ll, other, FrozenSinglyLinkedList([3, 2, 1])])), 2)
+        self.assertRaises(TypeError, hash, SinglyLinkedList([1, 2, 3]))
+        self.assertRaises(TypeError, hash, FrozenSinglyLinkedList([[1]]))
+
+    def test_eq(self):
+        """Is a frozen list equal to a mutable list with the same values?"""
+        self.assertEqual(self.ll, SinglyLinkedList([1, 2, 3]))
+        self.assertEqual(SinglyLinkedList([1, 2, 3]), self.ll)
+        self.assertNotEqual(self.ll, FrozenSinglyLinkedList([1, 2, 4]))
+        self.assertNotEqual(self.ll, FrozenSinglyLinkedList([1, 2]))
+
+        # != goes through the reflected comparison of the mutable list
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            self.assertTrue(FrozenSinglyLinkedList([1]) != SinglyLinkedList([2]))
+            self.assertFalse(FrozenSinglyLinkedList([1]) != SinglyLinkedList([1]))
+            self.assertTrue(SinglyLinkedList([2]) != FrozenSinglyLinkedList([1]))
+            self.assertTrue(self.ll != [1, 2, 3])
+
+    def test_add(self):
+        """Do +, += and slicing return new frozen lists?"""
+        for result in (self.ll + [4], [0] + self.ll, self.ll[1:], self.ll.concat([4])):
+            self.assertIsInstance(result, FrozenSinglyLinkedList)
+        self.assertEqual(list([0] + self.ll), [0, 1, 2, 3])
+
+        ll = self.ll
+        ll += [4]
+        self.assertIsNot(ll, self.ll)
+        self.assertEqual(list(ll), [1, 2, 3, 4])
+        self.assertEqual(list(self.ll), [1, 2, 3])
+
+    def test_pickle(self):
+        """Does a pickled frozen list come back frozen, with the same hash?"""
+        unpickled = pickle.loads(pickle.dumps(self.ll))
+        self.assertIsInstance(unpickled, FrozenSinglyLinkedList)
+        self.assertEqual(unpickled, self.ll)
+        self.assertEqual(hash(unpickled), hash(self.ll))
+        self.assertRaises(TypeError, unpickled.append, 4)
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.TestLoader().loadTestsFromTestCase(FrozenSinglyLinkedListTestCase))
+    return suite
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,293 @@
+import pickle
+import random
+import sys
+import unittest
+import warnings
+from pylinkedlist import IndexedSinglyLinkedList, NodePool, SinglyLinkedList
+
+class IndexedSinglyLinkedListTestCase(unittest.TestCase):
+    """Tests for the ``IndexedSinglyLinkedList`` class"""
+
+    def setUp(self):
+        self.ll = IndexedSinglyLinkedList()
+        self.assertEqual(len(self.ll), 0)
+
+    def test_ctor(self):
+        """Is a newly constructed list correcty initialised and indexed?"""
+        values = [1, 2, 1, 3]
+        self.ll = IndexedSinglyLinkedList(values)
+        self.assertIsInstance(self.ll, SinglyLinkedList)
+        self.__check(self.ll, values)
+
+        self.assertRaises(TypeError, IndexedSinglyLinkedList, [[1]])
+
+    def test_contains_count(self):
+        """Are membership and counts answered from the index?"""
+        self.ll = IndexedSinglyLinkedList([1, 2, 1, 3, 1])
+        self.assertIn(1, self.ll)
+        self.assertNotIn(4, self.ll)
+        self.assertEqual(self.ll.count(1), 3)
+        self.assertEqual(self.ll.count(4), 0)
+
+    def test_append_prepend(self):
+        """Are appended and prepended values indexed in list order?"""
+        self.ll.append(1)
+        self.ll.prepend(2)
+        self.ll.append(2)
+        self.ll.prepend(1)
+        self.ll.extend([3, 1])
+        self.__check(self.ll, [1, 2, 1, 2, 3, 1])
+        self.assertRaises(TypeError, self.ll.append, {})
+        self.assertRaises(TypeError, self.ll.extend, [4, {}])
+        self.__check(self.ll, [1, 2, 1, 2, 3, 1])
+
+    def test_remove_occurences(self):
+        """Are values removed by value through the index?"""
+        values = [1, 2, 1, 3, 1, 2]
+        self.ll = IndexedSinglyLinkedList(values)
+
+        self.assertTrue(self.ll.remove_first_occurence(1))
+        self.__check(self.ll, [2, 1, 3, 1, 2])
+        self.assertTrue(self.ll.remove_last_occurence(2))
+        self.__check(self.ll, [2, 1, 3, 1])
+        self.assertTrue(self.ll.remove_last_occurence(1))
+        self.__check(self.ll, [2, 1, 3])
+        self.assertFalse(self.ll.remove_first_occurence(42))
+        self.assertFalse(self.ll.remove_last_occurence(42))
+
+        self.ll.extend([1, 1])
+        self.assertEqual(self.ll.remove_all_occurences(1), 3)
+        self.__check(self.ll, [2, 3])
+        self.assertEqual(self.ll.remove_all_occurences(1), 0)
+
+    def test_remove_head_tail(self):
+        """Are both ends removed in O(1) and dropped from the index?"""
+        self.assertFalse(self.ll.remove_head())
+        self.assertFalse(self.ll.remove_tail())
+
+        self.ll = IndexedSinglyLinkedList([1, 2, 3, 4])
+        self.assertTrue(self.ll.remove_tail())
+        self.__check(self.ll, [1, 2, 3])
+        self.assertTrue(self.ll.remove_head())
+        self.__check(self.ll, [2, 3])
+        self.assertTrue(self.ll.remove_tail())
+        self.assertTrue(self.ll.remove_tail())
+        self.__check(self.ll, [])
+
+    def test_mutations_by_position(self):
+        """Do mutations by position and reverse() keep the index right?"""
+        self.ll = IndexedSinglyLinkedList([1, 2, 3, 4], index_stride=2)
+        self.ll.reverse()
+        self.__check(self.ll, [4, 3, 2, 1])
+        self.ll.insert(2, 1)
+        self.__check(self.ll, [4, 3, 1, 2, 1])
+        self.ll[0] = 1
+        self.__check(self.ll, [1, 3, 1, 2, 1])
+        self.ll[1:3] = [5, 5, 5]
+        self.__check(self.ll, [1, 5, 5, 5, 2, 1])
+        del self.ll[::2]
+        self.__check(self.ll, [5, 5, 1])
+        self.assertEqual(self.ll[2], 1)
+
+        self.assertRaises(TypeError, self.ll.__setitem__, 0, [])
+        self.assertRaises(TypeError, self.ll.__setitem__, slice(0, 1), [6, []])
+        self.assertRaises(TypeError, self.ll.__setitem__, slice(None, None, 2), [[], 6])
+        self.__check(self.ll, [5, 5, 1])
+        self.ll.remove_tail()
+        self.__check(self.ll, [5, 5])
+
+    def test_splice_concat(self):
+        """Are spliced and concatenated lists indexed?"""
+        self.ll = IndexedSinglyLinkedList([1, 2])
+        other = IndexedSinglyLinkedList([2, 3])
+        self.ll.splice(other)
+        self.__check(self.ll, [1, 2, 2, 3])
+        self.__check(other, [])
+
+        self.ll += SinglyLinkedList([4])
+        self.__check(self.ll, [1, 2, 2, 3, 4])
+
+        concatenated = self.ll + [1]
+        self.assertIsInstance(concatenated, IndexedSinglyLinkedList)
+        self.__check(concatenated, [1, 2, 2, 3, 4, 1])
+
+        other = SinglyLinkedList([5, [6], 7])
+        with self.assertRaises(TypeError):
+            self.ll += other
+        self.assertRaises(TypeError, self.ll.splice, other)
+        self.__check(self.ll, [1, 2, 2, 3, 4])
+        self.assertEqual(list(other), [5, [6], 7])
+        self.ll.remove_tail()
+        self.__check(self.ll, [1, 2, 2, 3])
+
+        # The index of a list whose nodes move to a plain list is cleared too
+        plain = SinglyLinkedList([0])
+        plain.splice(self.ll)
+        self.__check(self.ll, [])
+        self.assertFalse(self.ll.remove_last_occurence(3))
+        self.assertEqual(list(plain), [0, 1, 2, 2, 3])
+        self.assertEqual(plain.tail.value, 3)
+
+        self.ll = IndexedSinglyLinkedList([2, 4])
+        plain += self.ll
+        self.__check(self.ll, [])
+        self.ll = IndexedSinglyLinkedList([1, 5])
+        plain = SinglyLinkedList([0, 3])
+        plain.merge_sorted(self.ll)
+        self.__check(self.ll, [])
+        self.assertEqual(list(plain), [0, 1, 3, 5])
+
+    def test_eq_ne(self):
+        """Is a list compared by value with any other singly linked list?"""
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            self.assertTrue(IndexedSinglyLinkedList([1]) != SinglyLinkedList([2]))
+            self.assertFalse(IndexedSinglyLinkedList([1]) != SinglyLinkedList([1]))
+            self.assertTrue(IndexedSinglyLinkedList([1]) == SinglyLinkedList([1]))
+            self.assertTrue(SinglyLinkedList([2]) != IndexedSinglyLinkedList([1]))
+
+    def test_remove_if_and_many(self):
+        """Is the index kept up to date by the batch removals?"""
+        self.ll = IndexedSinglyLinkedList([1, 2, 3, 4, 1, 2, 3, 4])
+        self.assertEqual(self.ll.remove_if(lambda value: value > 3), 2)
+        self.__check(self.ll, [1, 2, 3, 1, 2, 3])
+
+        self.assertEqual(self.ll.remove_many([1, 3, 5]), {1: 2, 3: 2, 5: 0})
+        self.__check(self.ll, [2, 2])
+
+        def predicate(value):
+            if value == 3:
+                raise RuntimeError('three')
+            return value == 1
+        self.ll = IndexedSinglyLinkedList([1, 2, 3, 4])
+        self.assertRaises(RuntimeError, self.ll.remove_if, predicate)
+        self.__check(self.ll, [2, 3, 4])
+
+    def test_map_filter_inplace(self):
+        """Is the index rebuilt after values are changed in place?"""
+        self.ll = IndexedSinglyLinkedList([1, 2, 3, 2])
+        self.ll.map_inplace(lambda value: value * 10)
+        self.__check(self.ll, [10, 20, 30, 20])
+        self.assertRaises(TypeError, self.ll.map_inplace,
+                          lambda value: [value] if value == 20 else value)
+        self.__check(self.ll, [10, 20, 30, 20])
+        self.assertEqual(self.ll.filter_inplace(lambda value: value != 20), 2)
+        self.__check(self.ll, [10, 30])
+
+    def test_sort(self):
+        """Is the index rebuilt after sorting and merging?"""
+        self.ll = IndexedSinglyLinkedList([3, 1, 2, 1])
+        self.ll.sort()
+        self.__check(self.ll, [1, 1, 2, 3])
+        self.assertEqual(self.ll.insert_sorted(2), 3)
+        self.__check(self.ll, [1, 1, 2, 2, 3])
+        other = IndexedSinglyLinkedList([0, 4])
+        self.ll.merge_sorted(other)
+        self.__check(self.ll, [0, 1, 1, 2, 2, 3, 4])
+        self.__check(other, [])
+
+        other = SinglyLinkedList([0, [5], 6])
+        self.assertRaises(TypeError, self.ll.merge_sorted, other)
+        self.__check(self.ll, [0, 1, 1, 2, 2, 3, 4])
+        self.assertEqual(list(other), [0, [5], 6])
+
+        self.ll = IndexedSinglyLinkedList([3, 1, 2])
+        self.ll.sort(key=lambda value: [value])
+        self.__check(self.ll, [1, 2, 3])
+
+        self.ll = IndexedSinglyLinkedList([3, 'a', 1, 2, 5])
+        self.assertRaises(TypeError, self.ll.sort)
+        self.assertEqual(sorted(self.ll, key=str), [1, 2, 3, 5, 'a'])
+        self.__check(self.ll, list(self.ll))
+
+    def test_pickle(self):
+        """Is the index rebuilt when a list is unpickled?"""
+        self.ll = IndexedSinglyLinkedList([1, 2, 1, 3])
+        unpickled = pickle.loads(pickle.dumps(self.ll))
+        self.assertIsInstance(unpickled, IndexedSinglyLinkedList)
+        self.__check(unpickled, [1, 2, 1, 3])
+
+    def test_pool(self):
+        """Are nodes recycled through a pool after leaving the index?"""
+        pool = NodePool()
+        self.ll = IndexedSinglyLinkedList([1, 2, 3], pool=pool)
+        self.ll.remove_first_occurence(2)
+        self.ll.append(4)
+        self.assertEqual(pool.stats()['hits'], 1)
+        self.__check(self.ll, [1, 3, 4])
+
+    def test_sizeof(self):
+        """Do sys.getsizeof() and memory_usage() account for the index?"""
+        values = [1, 2, 1, 3] * 25
+        self.ll = IndexedSinglyLinkedList(values)
+        plain = SinglyLinkedList(values)
+        index_size = sys.getsizeof(self.ll._occurences) + \
+                     sys.getsizeof(self.ll._previous) + \
+                     sum(sys.getsizeof(nodes) for nodes in self.ll._occurences.values())
+        self.assertGreater(sys.getsizeof(self.ll), sys.getsizeof(plain) + index_size)
+        self.assertEqual(self.ll.memory_usage(), sys.getsizeof(self.ll))
+
+        before = sys.getsizeof(self.ll)
+        self.ll.remove_all_occurences(1)
+        self.assertLess(sys.getsizeof(self.ll), before)
+
+    def test_random_operations(self):
+        """Does the index agree with the list through random operations?"""
+        randomiser = random.Random(7)
+        expected = []
+        for step in range(1000):
+            operation = randomiser.randrange(7)
+            value = randomiser.randrange(8)
+            if operation == 0:
+                self.ll.append(value)
+                expected.append(value)
+            elif operation == 1:
+                self.ll.prepend(value)
+                expected.insert(0, value)
+            elif operation == 2:
+                if self.ll.remove_first_occurence(value):
+                    expected.remove(value)
+            elif operation == 3:
+                if self.ll.remove_last_occurence(value):
+                    del expected[len(expected) - 1 - expected[::-1].index(value)]
+            elif operation == 4 and randomiser.random() < 0.3:
+                self.assertEqual(self.ll.remove_all_occurences(value),
+                                 expected.count(value))
+                expected = [v for v in expected if v != value]
+            elif operation == 5 and expected:
+                self.ll.remove_tail()
+                expected.pop()
+            elif operation == 6 and expected:
+                self.ll.remove_head()
+                expected.pop(0)
+            self.assertEqual(self.ll.count(value), expected.count(value))
+        self.__check(self.ll, expected)
+
+    def __check(self, ll, list_):
+        """Helper to compare a linked list with a list and check its index"""
+        self.assertEqual(list(ll), list_)
+        self.assertEqual(len(ll), len(list_))
+        if list_:
+            self.assertEqual(ll.tail.value, list_[-1])
+        else:
+            self.assertIsNone(ll.head)
+            self.assertIsNone(ll.tail)
+
+        for value in set(list_) | set([42]):
+            self.assertEqual(value in ll, value in list_)
+            self.assertEqual(ll.count(value), list_.count(value))
+
+        # Every node's recorded predecessor is the node before it
+        previous, current = None, ll.head
+        while current is not None:
+            self.assertIs(ll._previous[id(current)], previous)
+            previous, current = current, current.next
+        self.assertEqual(len(ll._previous), len(list_))
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.TestLoader().loadTestsFromTestCase(IndexedSinglyLinkedListTestCase))
+    return suite
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,136 @@
+import unittest
+from pylinkedlist import (DoublyLinkedList, IndexedSinglyLinkedList, Instrumentation,
+                          SinglyLinkedList, UnrolledLinkedList)
+
+# The node classes the instrumentation patches; importing them from
+# ``pylinkedlist.singly`` would give another copy of the module
+_SinglyNode = type(SinglyLinkedList([1]).head)
+_DoublyNode = type(DoublyLinkedList([1]).head)
+
+class InstrumentationTestCase(unittest.TestCase):
+    """Tests for the ``Instrumentation`` class"""
+
+    def setUp(self):
+        self.instrumentation = Instrumentation()
+
+    def tearDown(self):
+        self.instrumentation.disable()
+
+    def test_disabled(self):
+        """Are the methods untouched until the instrumentation is enabled?"""
+        append = SinglyLinkedList.__dict__['append']
+        SinglyLinkedList([1, 2]).remove_tail()
+        self.assertEqual(self.instrumentation.snapshot(), {})
+
+        self.instrumentation.enable()
+        self.assertTrue(self.instrumentation.enabled)
+        self.assertIsNot(SinglyLinkedList.__dict__['append'], append)
+        self.instrumentation.disable()
+        self.assertFalse(self.instrumentation.enabled)
+        self.assertIs(SinglyLinkedList.__dict__['append'], append)
+        self.assertNotIn('_instrumentation', SinglyLinkedList.__dict__)
+
+    def test_counters(self):
+        """Are calls, nodes traversed and time recorded per method?"""
+        ll = SinglyLinkedList(range(10))
+        with self.instrumentation:
+            ll.append(10)
+            ll.append(11)
+            ll.remove_tail()
+            ll.remove_last_occurence(3)
+            self.assertEqual(list(ll), [0, 1, 2, 4, 5, 6, 7, 8, 9, 10])
+        ll.remove_tail()
+
+        snapshot = self.instrumentation.snapshot()
+        self.assertEqual(snapshot['append']['calls'], 2)
+        self.assertEqual(snapshot['remove_tail']['calls'], 1)
+        self.assertEqual(snapshot['remove_tail']['nodes'], 10)
+        self.assertGreaterEqual(snapshot['remove_last_occurence']['nodes'], 11)
+        self.assertEqual(snapshot['__iter__']['calls'], 1)
+        self.assertEqual(snapshot['__iter__']['nodes'], 10)
+        self.assertGreaterEqual(snapshot['append']['seconds'], 0)
+        self.assertNotIn('prepend', snapshot)
+
+        self.instrumentation.reset()
+        self.assertEqual(self.instrumentation.snapshot(), {})
+
+    def test_prometheus(self):
+        """Are the counters exported in the Prometheus text format?"""
+        with Instrumentation(methods=['append']) as instrumentation:
+            SinglyLinkedList().append(1)
+        text = instrumentation.prometheus()
+        self.assertIn('# TYPE pylinkedlist_calls_total counter\n', text)
+        self.assertIn('pylinkedlist_calls_total{class="SinglyLinkedList",method="append"} 1\n',
+                      text)
+        self.assertIn('pylinkedlist_nodes_traversed_total{', text)
+        self.assertTrue(instrumentation.prometheus(prefix='ll').startswith('# HELP ll_'))
+
+    def test_subclass(self):
+        """Is a subclass instrumented without touching its base class?"""
+        append = SinglyLinkedList.__dict__['append']
+        remove_tail = IndexedSinglyLinkedList.__dict__['remove_tail']
+        with Instrumentation(IndexedSinglyLinkedList, ['append', 'remove_tail']) as instrumentation:
+            self.instrumentation.enable()
+            ll = IndexedSinglyLinkedList([1, 2])
+            ll.append(3)
+            ll.remove_tail()
+        self.assertEqual(instrumentation.snapshot()['remove_tail']['calls'], 1)
+        self.assertEqual(self.instrumentation.snapshot()['append']['calls'], 1)
+        self.instrumentation.disable()
+        self.assertIs(SinglyLinkedList.__dict__['append'], append)
+        self.assertIs(IndexedSinglyLinkedList.__dict__['remove_tail'], remove_tail)
+
+    def test_other_class(self):
+        """Are the default methods another class does not have skipped?"""
+        next_slot = _SinglyNode.__dict__['next']
+        doubly_next_slot = _DoublyNode.__dict__['next']
+        doubly_methods = dict(DoublyLinkedList.__dict__)
+        instrumentation = Instrumentation(DoublyLinkedList)
+        with instrumentation:
+            self.assertIsNot(_SinglyNode.__dict__['next'], next_slot)
+            ll = DoublyLinkedList([1, 2])
+            ll.append(3)
+            self.assertEqual(list(ll), [1, 2, 3])
+            self.assertTrue(ll.remove_last_occurence(1))
+        snapshot = instrumentation.snapshot()
+        self.assertEqual(snapshot['append']['calls'], 1)
+        self.assertEqual(snapshot['__iter__']['nodes'], 3)
+        # Walking backwards through `previous` is not counted, only the read of
+        # the removed node's `next`
+        self.assertEqual(snapshot['remove_last_occurence']['nodes'], 1)
+        self.assertNotIn('insert', snapshot)
+        self.assertEqual(dict(DoublyLinkedList.__dict__), doubly_methods)
+        self.assertIs(_SinglyNode.__dict__['next'], next_slot)
+        self.assertIs(_DoublyNode.__dict__['next'], doubly_next_slot)
+
+        ll = UnrolledLinkedList(range(10), capacity=4)
+        with Instrumentation(UnrolledLinkedList, ['remove_last_occurence']) as instrumentation:
+            self.assertFalse(ll.remove_last_occurence(42))
+        # Every node is a block of values
+        self.assertEqual(instrumentation.snapshot()['remove_last_occurence']['nodes'], 3)
+
+    def test_enable_failure(self):
+        """Does a failure to wrap a method leave the class and nodes untouched?"""
+        next_slot = _SinglyNode.__dict__['next']
+        append = SinglyLinkedList.__dict__['append']
+        instrumentation = Instrumentation(methods=['append', 'index_stride'])
+        self.assertRaises(AttributeError, instrumentation.enable)
+        self.assertFalse(instrumentation.enabled)
+        self.assertIs(SinglyLinkedList.__dict__['append'], append)
+        self.assertNotIn('_instrumentation', SinglyLinkedList.__dict__)
+        self.assertIs(_SinglyNode.__dict__['next'], next_slot)
+        instrumentation.disable()
+
+    def test_enable_twice(self):
+        """Is a class instrumented at most once at a time?"""
+        self.instrumentation.enable()
+        self.assertRaises(RuntimeError, self.instrumentation.enable)
+        self.assertRaises(RuntimeError, Instrumentation().enable)
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.TestLoader().loadTestsFromTestCase(InstrumentationTestCase))
+    return suite
+
+if __name__ == '__main__':
+    unittest.main()
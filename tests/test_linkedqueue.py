@@ -0,0 +1,89 @@
+import threading
+import time
+import unittest
+from queue import Empty
+from pylinkedlist.linkedqueue import LinkedQueue
+
+class LinkedQueueTestCase(unittest.TestCase):
+    """Tests for the ``LinkedQueue`` class"""
+
+    def setUp(self):
+        self.queue = LinkedQueue()
+
+    def test_fifo(self):
+        """Are values got in the order they were put?"""
+        self.assertTrue(self.queue.empty())
+        self.queue = LinkedQueue([1, 2])
+        self.queue.put(3)
+        self.queue.put_nowait(4)
+        self.assertEqual(self.queue.qsize(), 4)
+        self.assertEqual(len(self.queue), 4)
+        self.assertFalse(self.queue.empty())
+        self.assertEqual([self.queue.get() for _ in range(4)], [1, 2, 3, 4])
+        self.assertTrue(self.queue.empty())
+        self.assertEqual(self.queue.qsize(), 0)
+
+    def test_get_nowait(self):
+        """Is Empty raised rather than waiting?"""
+        self.assertRaises(Empty, self.queue.get_nowait)
+        self.assertRaises(Empty, self.queue.get, False)
+        self.queue.put(None)
+        self.assertIsNone(self.queue.get_nowait())
+
+    def test_timeout(self):
+        """Does get() give up once its timeout runs out?"""
+        started = time.time()
+        self.assertRaises(Empty, self.queue.get, timeout=0.05)
+        self.assertGreaterEqual(time.time() - started, 0.04)
+        self.assertRaises(ValueError, self.queue.get, timeout=-1)
+        self.assertEqual(self.queue._waiters, 0)
+
+    def test_blocking_get(self):
+        """Is a blocked consumer woken up by a producer?"""
+        got = []
+        consumer = threading.Thread(target=lambda: got.append(self.queue.get(timeout=5)))
+        consumer.start()
+        time.sleep(0.05)
+        self.queue.put(42)
+        consumer.join()
+        self.assertEqual(got, [42])
+
+    def test_dummy_node_releases_value(self):
+        """Is a value no longer referenced by the queue once it is got?"""
+        self.queue.put(object())
+        self.queue.get()
+        self.assertIsNone(self.queue._head.value)
+
+    def test_producers_consumers(self):
+        """Is every value got exactly once with several producers and consumers?"""
+        producers, consumers, count = 4, 4, 2000
+        got = []
+        lock = threading.Lock()
+
+        def produce(start):
+            for value in range(start, start + count):
+                self.queue.put(value)
+
+        def consume():
+            values = [self.queue.get(timeout=5) for _ in range(count)]
+            with lock:
+                got.extend(values)
+
+        threads = [threading.Thread(target=consume) for _ in range(consumers)]
+        threads += [threading.Thread(target=produce, args=(i * count,))
+                    for i in range(producers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(sorted(got), list(range(producers * count)))
+        self.assertTrue(self.queue.empty())
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.TestLoader().loadTestsFromTestCase(LinkedQueueTestCase))
+    return suite
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+import os
+import shutil
+import struct
+import tempfile
+import unittest
+from pylinkedlist import MappedSinglyLinkedList
+
+class MappedSinglyLinkedListTestCase(unittest.TestCase):
+    """Tests for the ``MappedSinglyLinkedList`` class"""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'list.pll')
+        self.ll = MappedSinglyLinkedList(self.path)
+        self.assertEqual(len(self.ll), 0)
+
+    def tearDown(self):
+        self.ll.close()
+        shutil.rmtree(self.directory)
+
+    def test_append_prepend(self):
+        """Are values inserted at both ends?"""
+        self.ll.append(2)
+        self.ll.append(3)
+        self.ll.prepend(1)
+        self.ll.append_all([4, 5])
+        self.assertEqual(list(self.ll), [1, 2, 3, 4, 5])
+        self.assertEqual(len(self.ll), 5)
+        self.assertTrue(self.ll)
+
+    def test_remove_head_tail(self):
+        """Are both ends removed as expected?"""
+        self.assertFalse(self.ll.remove_head())
+        self.assertFalse(self.ll.remove_tail())
+
+        self.ll.append_all([1, 2, 3])
+        self.assertTrue(self.ll.remove_tail())
+        self.assertEqual(list(self.ll), [1, 2])
+        self.assertTrue(self.ll.remove_head())
+        self.assertEqual(list(self.ll), [2])
+        self.assertTrue(self.ll.remove_tail())
+        self.assertEqual(list(self.ll), [])
+        self.assertFalse(self.ll)
+
+        self.ll.append(4)
+        self.assertEqual(list(self.ll), [4])
+
+    def test_free_list(self):
+        """Are the records of removed values reused before the file grows?"""
+        self.ll.append_all(range(100))
+        end = self.ll._end
+        for _ in range(50):
+            self.ll.remove_head()
+        self.ll.append_all(range(100, 150))
+        self.assertEqual(self.ll._end, end)
+        self.assertEqual(list(self.ll), list(range(50, 150)))
+
+    def test_bad_values(self):
+        """Do values that do not fit the format leave the file as it was?"""
+        self.ll.append(1)
+        end = self.ll._end
+        for value in ('x', 2**64, None):
+            self.assertRaises(struct.error, self.ll.append, value)
+            self.assertRaises(struct.error, self.ll.prepend, value)
+        self.ll.remove_head()
+        self.ll.append(2)
+        self.assertRaises(struct.error, self.ll.append, 'x')
+        self.assertEqual(self.ll._end, end)
+        self.assertEqual(list(self.ll), [2])
+        self.assertEqual(len(self.ll), 1)
+
+        self.ll.close()
+        self.ll = MappedSinglyLinkedList(self.path)
+        self.assertEqual(self.ll._end, end)
+        self.assertEqual(list(self.ll), [2])
+
+    def test_growth(self):
+        """Does the file grow as the list outgrows it?"""
+        size = os.path.getsize(self.path)
+        count = size // 16 * 3
+        self.ll.append_all(range(count))
+        self.assertGreater(os.path.getsize(self.path), size)
+        self.assertEqual(len(self.ll), count)
+        self.assertEqual(sum(self.ll), sum(range(count)))
+
+    def test_reverse(self):
+        """Is a list reversed as expected?"""
+        self.ll.reverse()
+        self.assertEqual(list(self.ll), [])
+        self.ll.append_all([1, 2, 3])
+        self.ll.reverse()
+        self.assertEqual(list(self.ll), [3, 2, 1])
+        self.ll.append(0)
+        self.assertEqual(list(self.ll), [3, 2, 1, 0])
+
+    def test_reopen(self):
+        """Is a list found as it was left when its file is opened again?"""
+        self.ll.append_all(range(10))
+        self.ll.remove_head()
+        self.ll.close()
+        self.assertTrue(self.ll.closed)
+        self.ll.close()
+        self.assertRaises(ValueError, self.ll.append, 1)
+        self.assertRaises(ValueError, self.ll.remove_head)
+        self.assertRaises(ValueError, self.ll.remove_tail)
+        self.assertRaises(ValueError, self.ll.reverse)
+        self.assertRaises(ValueError, list, self.ll)
+
+        with MappedSinglyLinkedList(self.path) as reopened:
+            self.assertEqual(list(reopened), list(range(1, 10)))
+            self.assertEqual(reopened.record_format, 'q')
+            reopened.append(10)
+        self.ll = MappedSinglyLinkedList(self.path, 'q')
+        self.assertEqual(list(self.ll), list(range(1, 11)))
+
+    def test_formats(self):
+        """Are values of other formats, including several fields, stored?"""
+        path = os.path.join(self.directory, 'pairs.pll')
+        with MappedSinglyLinkedList(path, 'q8s') as pairs:
+            pairs.append((1, b'one'))
+            pairs.prepend((0, b'zero'))
+            self.assertEqual(list(pairs), [(0, b'zero\0\0\0\0'), (1, b'one\0\0\0\0\0')])
+
+        self.assertRaises(ValueError, MappedSinglyLinkedList, path, 'd')
+
+        other = os.path.join(self.directory, 'other')
+        with open(other, 'wb') as handle:
+            handle.write(b'not a list' * 10)
+        self.assertRaises(ValueError, MappedSinglyLinkedList, other)
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.TestLoader().loadTestsFromTestCase(MappedSinglyLinkedListTestCase))
+    return suite
+
+if __name__ == '__main__':
+    unittest.main()
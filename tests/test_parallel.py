@@ -0,0 +1,135 @@
+import operator
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pylinkedlist import (DoublyLinkedList, FrozenSinglyLinkedList,
+                          IndexedSinglyLinkedList, NodePool, SinglyLinkedList,
+                          TypedSinglyLinkedList, UnrolledLinkedList)
+from pylinkedlist.parallel import parallel_map, parallel_reduce
+
+def _fail_on_five(value):
+    if value == 5:
+        raise RuntimeError('five')
+    return value
+
+class ParallelTestCase(unittest.TestCase):
+    """Tests for ``parallel_map()`` and ``parallel_reduce()``"""
+
+    def setUp(self):
+        self.ll = SinglyLinkedList(range(100))
+
+    def test_map(self):
+        """Are the results returned in order in a new list of the same type?"""
+        for chunk_size in [1, 7, 100, 1000]:
+            mapped = parallel_map(operator.neg, self.ll, chunk_size=chunk_size,
+                                  executor='thread', max_workers=4)
+            self.assertIsInstance(mapped, SinglyLinkedList)
+            self.assertEqual(list(mapped), [-value for value in range(100)])
+        self.assertEqual(list(self.ll), list(range(100)))
+
+        mapped = parallel_map(str, FrozenSinglyLinkedList([1, 2]), executor='thread')
+        self.assertIsInstance(mapped, FrozenSinglyLinkedList)
+        self.assertEqual(list(mapped), ['1', '2'])
+        self.assertEqual(len(parallel_map(str, SinglyLinkedList(), executor='thread')), 0)
+
+    def test_map_other_lists(self):
+        """Are the results of other lists collected into lists configured alike?"""
+        typed = TypedSinglyLinkedList('d', [1.5, 2.5], capacity=8)
+        mapped = parallel_map(operator.neg, typed, executor='thread')
+        self.assertIsInstance(mapped, TypedSinglyLinkedList)
+        self.assertEqual(mapped.typecode, 'd')
+        self.assertEqual(mapped.capacity, 8)
+        self.assertEqual(list(mapped), [-1.5, -2.5])
+
+        unrolled = UnrolledLinkedList([1, 2, 3], capacity=8)
+        mapped = parallel_map(operator.neg, unrolled, executor='thread')
+        self.assertIsInstance(mapped, UnrolledLinkedList)
+        self.assertEqual(mapped.capacity, 8)
+        self.assertEqual(list(mapped), [-1, -2, -3])
+
+        mapped = parallel_map(operator.neg, DoublyLinkedList([1, 2]), executor='thread')
+        self.assertEqual(list(mapped), [-1, -2])
+
+        pool = NodePool()
+        mapped = parallel_map(operator.neg, SinglyLinkedList([1, 2], pool=pool,
+                                                             index_stride=4),
+                              executor='thread')
+        self.assertIs(mapped.pool, pool)
+        self.assertEqual(mapped.index_stride, 4)
+
+    def test_map_inplace_unsupported(self):
+        """Is mapping a list without map_inplace() in place refused before any work?"""
+        calls = []
+        for ll in (DoublyLinkedList([1]), UnrolledLinkedList([1]),
+                   TypedSinglyLinkedList('q', [1])):
+            self.assertRaises(TypeError, parallel_map, calls.append, ll,
+                              executor='thread', inplace=True)
+            self.assertEqual(list(ll), [1])
+        self.assertEqual(calls, [])
+
+    def test_map_processes(self):
+        """Are chunks mapped on a process pool?"""
+        mapped = parallel_map(operator.neg, self.ll, chunk_size=30, max_workers=2)
+        self.assertEqual(list(mapped), [-value for value in range(100)])
+
+    def test_map_inplace(self):
+        """Are the values replaced in the nodes, keeping an index up to date?"""
+        head = self.ll.head
+        self.assertIsNone(parallel_map(str, self.ll, chunk_size=9,
+                                       executor='thread', inplace=True))
+        self.assertIs(self.ll.head, head)
+        self.assertEqual(list(self.ll), [str(value) for value in range(100)])
+
+        ll = IndexedSinglyLinkedList([1, 2, 1])
+        parallel_map(operator.neg, ll, executor='thread', inplace=True)
+        self.assertEqual(ll.count(-1), 2)
+        self.assertNotIn(1, ll)
+
+        self.assertRaises(TypeError, parallel_map, lambda value: [value], ll,
+                          executor='thread', inplace=True)
+        self.assertEqual(list(ll), [-1, -2, -1])
+        self.assertEqual(ll.count(-1), 2)
+
+    def test_map_failure(self):
+        """Does an exception in a worker propagate and leave the list untouched?"""
+        self.assertRaises(RuntimeError, parallel_map, _fail_on_five, self.ll,
+                          chunk_size=3, executor='thread', inplace=True)
+        self.assertEqual(list(self.ll), list(range(100)))
+
+    def test_reduce(self):
+        """Are the chunks reduced and then combined in order?"""
+        for chunk_size in [1, 7, 100, 1000]:
+            self.assertEqual(parallel_reduce(operator.add, self.ll, chunk_size=chunk_size,
+                                             executor='thread'), sum(range(100)))
+        self.assertEqual(parallel_reduce(operator.add, self.ll, 1000, executor='thread'),
+                         1000 + sum(range(100)))
+
+        words = SinglyLinkedList('abcdefghij')
+        self.assertEqual(parallel_reduce(operator.add, words, chunk_size=3,
+                                         executor='thread'), 'abcdefghij')
+        self.assertEqual(parallel_reduce(max, self.ll, chunk_size=10, max_workers=2), 99)
+
+    def test_reduce_empty(self):
+        """Does an empty list reduce to the initial value, or raise without one?"""
+        empty = SinglyLinkedList()
+        self.assertRaises(TypeError, parallel_reduce, operator.add, empty, executor='thread')
+        self.assertIsNone(parallel_reduce(operator.add, empty, None, executor='thread'))
+        self.assertEqual(parallel_reduce(operator.add, empty, 0, executor='thread'), 0)
+
+    def test_executor(self):
+        """Is a given executor used and left running, and are bad arguments refused?"""
+        with ThreadPoolExecutor(2) as executor:
+            mapped = parallel_map(operator.neg, self.ll, chunk_size=10, executor=executor)
+            self.assertEqual(list(mapped), [-value for value in range(100)])
+            self.assertEqual(executor.submit(operator.neg, 1).result(), -1)
+
+        self.assertRaises(ValueError, parallel_map, str, self.ll, executor='gpu')
+        self.assertRaises(ValueError, parallel_reduce, max, self.ll, chunk_size=0,
+                          executor='thread')
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.TestLoader().loadTestsFromTestCase(ParallelTestCase))
+    return suite
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+import pickle
+import threading
+import unittest
+from pylinkedlist import PersistentSinglyLinkedList
+
+class PersistentSinglyLinkedListTestCase(unittest.TestCase):
+    """Tests for the ``PersistentSinglyLinkedList`` class"""
+
+    def setUp(self):
+        self.ll = PersistentSinglyLinkedList([1, 2, 3])
+
+    def test_ctor(self):
+        """Is a newly constructed list correctly initialised?"""
+        self.assertEqual(list(self.ll), [1, 2, 3])
+        self.assertEqual(len(self.ll), 3)
+        self.assertEqual(self.ll.head.value, 1)
+        self.assertEqual(list(PersistentSinglyLinkedList(iter([1, 2]))), [1, 2])
+
+        empty = PersistentSinglyLinkedList()
+        self.assertEqual(len(empty), 0)
+        self.assertIsNone(empty.head)
+        self.assertFalse(empty)
+        self.assertTrue(self.ll)
+
+    def test_immutable(self):
+        """Are the list and its nodes impossible to modify?"""
+        self.assertRaises(AttributeError, setattr, self.ll, '_head', None)
+        self.assertRaises(AttributeError, setattr, self.ll, 'other', None)
+        self.assertRaises(AttributeError, setattr, self.ll.head, 'value', 0)
+        self.assertRaises(AttributeError, setattr, self.ll.head, 'next', None)
+        self.assertRaises(AttributeError, delattr, self.ll.head, 'value')
+        self.assertRaises(AttributeError, setattr, self.ll.head, 'other', None)
+        self.assertEqual(list(self.ll), [1, 2, 3])
+
+    def test_prepend(self):
+        """Does prepend() return a new version sharing every node of the old one?"""
+        prepended = self.ll.prepend(0)
+        self.assertEqual(list(prepended), [0, 1, 2, 3])
+        self.assertEqual(len(prepended), 4)
+        self.assertIs(prepended.head.next, self.ll.head)
+        self.assertEqual(list(self.ll), [1, 2, 3])
+
+        forks = [self.ll.prepend(value) for value in range(3)]
+        for value, fork in enumerate(forks):
+            self.assertEqual(list(fork), [value, 1, 2, 3])
+
+    def test_rest(self):
+        """Does rest() return the version made of all the nodes but the first?"""
+        rest = self.ll.rest()
+        self.assertEqual(list(rest), [2, 3])
+        self.assertIs(rest.head, self.ll.head.next)
+        self.assertEqual(list(rest.rest().rest()), [])
+        self.assertRaises(IndexError, PersistentSinglyLinkedList().rest)
+
+    def test_concat(self):
+        """Does concat() copy this list and share the nodes of the other?"""
+        other = PersistentSinglyLinkedList([4, 5])
+        concatenated = self.ll.concat(other)
+        self.assertEqual(list(concatenated), [1, 2, 3, 4, 5])
+        self.assertEqual(len(concatenated), 5)
+        self.assertIs(concatenated.rest().rest().rest().head, other.head)
+        self.assertEqual(list(self.ll), [1, 2, 3])
+
+        self.assertEqual(list(self.ll.concat([4])), [1, 2, 3, 4])
+        self.assertIs(PersistentSinglyLinkedList().concat(other).head, other.head)
+        self.assertIs(self.ll.concat([]).head.next.next.next, None)
+
+    def test_add(self):
+        """Do + and += return new versions?"""
+        self.assertEqual(list(self.ll + [4]), [1, 2, 3, 4])
+        self.assertEqual(list([0] + self.ll), [0, 1, 2, 3])
+        self.assertIs(([0] + self.ll).head.next, self.ll.head)
+
+        ll = self.ll
+        ll += [4]
+        self.assertEqual(list(ll), [1, 2, 3, 4])
+        self.assertEqual(list(self.ll), [1, 2, 3])
+
+    def test_eq_hash(self):
+        """Are lists with equal values equal and hashed equally?"""
+        other = PersistentSinglyLinkedList([1, 2, 3])
+        self.assertEqual(self.ll, other)
+        self.assertEqual(hash(self.ll), hash(other))
+        self.assertEqual({self.ll: 'a'}[other], 'a')
+        self.assertEqual(self.ll.rest().prepend(1), self.ll)
+        self.assertNotEqual(self.ll, self.ll.rest())
+        self.assertNotEqual(self.ll, PersistentSinglyLinkedList([1, 2, 4]))
+        self.assertNotEqual(self.ll, [1, 2, 3])
+        self.assertEqual(PersistentSinglyLinkedList(), PersistentSinglyLinkedList())
+
+    def test_str_repr(self):
+        """Are lists rendered like other lists?"""
+        self.assertEqual(str(self.ll), '[1 -> 2 -> 3 -> None]')
+        self.assertEqual(str(PersistentSinglyLinkedList()), '[None]')
+        self.assertEqual(repr(self.ll), 'PersistentSinglyLinkedList([1, 2, 3])')
+        self.assertEqual(repr(PersistentSinglyLinkedList()), 'PersistentSinglyLinkedList()')
+
+    def test_pickle(self):
+        """Can a long list be pickled without recursing once per node?"""
+        ll = PersistentSinglyLinkedList(range(100000))
+        self.assertEqual(pickle.loads(pickle.dumps(ll)), ll)
+
+    def test_threads(self):
+        """Can threads fork a shared list concurrently?"""
+        results = {}
+
+        def fork(thread):
+            version = self.ll
+            for value in range(1000):
+                version = version.prepend((thread, value))
+            results[thread] = version
+
+        threads = [threading.Thread(target=fork, args=(thread,)) for thread in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for thread, version in results.items():
+            self.assertEqual(len(version), 1003)
+            self.assertEqual(list(version)[-4:], [(thread, 0), 1, 2, 3])
+        self.assertEqual(list(self.ll), [1, 2, 3])
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.TestLoader().loadTestsFromTestCase(PersistentSinglyLinkedListTestCase))
+    return suite
+
+if __name__ == '__main__':
+    unittest.main()
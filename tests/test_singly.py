@@ -1,6 +1,9 @@
+import pickle
+import random
+import sys
 import unittest
 from pylinkedlist.singly import _SinglyNode
-from pylinkedlist import SinglyLinkedList
+from pylinkedlist import CycleError, NodePool, SinglyLinkedList
 
 class SinglyNodeTestCase(unittest.TestCase):
     """Tests for the ``_SinglyNode`` class"""
@@ -91,6 +94,55 @@ class SinglyNodeTestCase(unittest.TestCase):
         EXPECTED_REPR = '_SinglyNode(value=1, next=_SinglyNode(value=2, next=None))'
         self.assertEqual(repr(self.node), EXPECTED_REPR)
 
+    def test_cyclic_str_repr(self):
+        """Is a cyclic chain rejected rather than rendered forever?"""
+        for length in range(1, 6):
+            nodes = [_SinglyNode(i) for i in range(length)]
+            for node, next in zip(nodes, nodes[1:]):
+                node.next = next
+            nodes[-1].next = nodes[length // 2]
+            # ``CycleError`` is a ``ValueError``
+            self.assertRaisesRegex(ValueError, 'cyclic', str, nodes[0])
+            self.assertRaisesRegex(ValueError, 'cyclic', repr, nodes[0])
+            self.assertRaisesRegex(ValueError, 'cyclic', format, nodes[0], 'l')
+            self.assertEqual(nodes[0]._values(3)[1], True)
+
+    def test_cyclic_eq(self):
+        """Is comparing two cyclic chains rejected rather than looping forever?"""
+        self.node.value = 0
+        self.node.next = self.node
+        other = _SinglyNode(0, _SinglyNode(0))
+        other.next.next = other
+        self.assertRaisesRegex(ValueError, 'cyclic', self.node.__eq__, other)
+        self.assertRaisesRegex(ValueError, 'cyclic', other.__eq__, self.node)
+        self.assertEqual(self.node, self.node)
+
+        # A chain that ends is unequal to a cyclic one
+        self.assertNotEqual(self.node, _SinglyNode(0, _SinglyNode(0)))
+        self.assertNotEqual(_SinglyNode(0, _SinglyNode(0)), other)
+        other.next.value = 1
+        self.assertNotEqual(self.node, other)
+
+    def test_long_chain(self):
+        """Are long chains compared and rendered without hitting the recursion limit?"""
+        length = 100000
+        self.node = _SinglyNode(0)
+        other = _SinglyNode(0)
+        current, other_current = self.node, other
+        for i in range(1, length):
+            current.next = _SinglyNode(i)
+            other_current.next = _SinglyNode(i)
+            current, other_current = current.next, other_current.next
+
+        self.assertEqual(self.node, other)
+        other_current.value = -1
+        self.assertNotEqual(self.node, other)
+
+        self.assertTrue(str(self.node).endswith('{} -> None'.format(length - 1)))
+        self.assertTrue(repr(self.node).startswith('_SinglyNode(value=0, next=_SinglyNode('))
+        self.assertTrue(repr(self.node).endswith('next=None' + ')' * length))
+        self.assertEqual(format(self.node, 'l'), str(list(range(length))))
+
 class SinglyLinkedListTestCase(unittest.TestCase):
     """Tests for the LinkedList class in `linkedlist.py`."""
 
@@ -121,6 +173,48 @@ class SinglyLinkedListTestCase(unittest.TestCase):
         self.__compare_with_list(self.ll, [0] + list(other))
         self.assertEqual(self.ll.head.value, 0)
         self.assertEqual(self.ll.tail.value, values[-1])
+        self.assertEqual(len(self.ll), len(values) + 1)
+
+        # The values are copied, so the two lists do not share any nodes
+        self.assertIsNot(self.ll.tail, other.tail)
+        other.append(6)
+        self.assertEqual(len(self.ll), len(values) + 1)
+        self.__compare_with_list(self.ll, [0] + values)
+
+    def test_append_all_iterables(self):
+        """Are values appended in bulk from any kind of iterable?"""
+        class LengthHinted(object):
+            def __init__(self, values):
+                self.values = values
+            def __iter__(self):
+                return iter(self.values)
+            def __length_hint__(self):
+                return len(self.values)
+
+        values = [1, 2, 3, 4, 5]
+        iterables = [
+            (value for value in values),
+            iter(values),
+            LengthHinted(values),
+            tuple(values),
+        ]
+        for iterable in iterables:
+            self.ll = SinglyLinkedList([0])
+            self.ll.append_all(iterable)
+            self.assertEqual(len(self.ll), len(values) + 1)
+            self.assertEqual(self.ll.tail.value, values[-1])
+            self.assertIsNone(self.ll.tail.next)
+            self.__compare_with_list(self.ll, [0] + values)
+
+        self.ll = SinglyLinkedList()
+        self.ll.extend(iter([]))
+        self.assertIsNone(self.ll.head)
+        self.assertIsNone(self.ll.tail)
+        self.assertEqual(len(self.ll), 0)
+
+        self.ll.extend(values)
+        self.assertEqual(len(self.ll), len(values))
+        self.__compare_with_list(self.ll, values)
 
     def test_append(self):
         """Does appending a value to the end of a list have the expected effect?"""
@@ -226,6 +320,216 @@ class SinglyLinkedListTestCase(unittest.TestCase):
         self.assertIsNone(self.ll.head)
         self.assertIsNone(self.ll.tail)
 
+    def test_remove_if(self):
+        """Are all the values matching a predicate removed in one call?"""
+        self.assertEqual(self.ll.remove_if(bool), 0)
+
+        values = [1, 2, 3, 4, 5, 6, 7]
+        self.ll = SinglyLinkedList(values, index_stride=2)
+        self.assertEqual(self.ll.remove_if(lambda value: value % 2), 4)
+        self.__compare_with_list(self.ll, [2, 4, 6])
+        self.assertEqual(self.ll.tail.value, 6)
+        self.assertEqual(self.ll[1], 4)
+
+        self.assertEqual(self.ll.remove_if(lambda value: True), 3)
+        self.assertEqual(len(self.ll), 0)
+        self.assertIsNone(self.ll.head)
+        self.assertIsNone(self.ll.tail)
+
+    def test_remove_if_failure(self):
+        """Are the values removed before the predicate raised counted off?"""
+        def predicate(value):
+            if value == 3:
+                raise RuntimeError('three')
+            return value == 1
+
+        self.ll = SinglyLinkedList([1, 2, 3, 4])
+        self.assertRaises(RuntimeError, self.ll.remove_if, predicate)
+        self.__compare_with_list(self.ll, [2, 3, 4])
+        self.assertEqual(len(self.ll), 3)
+
+        self.ll = SinglyLinkedList([1, 2, 3, 4])
+        self.assertRaises(RuntimeError, self.ll.filter_inplace,
+                          lambda value: not predicate(value))
+        self.__compare_with_list(self.ll, [2, 3, 4])
+        self.assertEqual(len(self.ll), 3)
+
+    def test_remove_many(self):
+        """Are all the occurences of several values removed and counted?"""
+        values = [1, 2, [3], 1, 4, 2, 1]
+        self.ll = SinglyLinkedList(values)
+        counts = self.ll.remove_many([1, 2, 5])
+        self.assertEqual(counts, {1: 3, 2: 2, 5: 0})
+        self.__compare_with_list(self.ll, [[3], 4])
+        self.assertEqual(len(self.ll), 2)
+        self.assertEqual(self.ll.tail.value, 4)
+
+        self.assertEqual(self.ll.remove_many([]), {})
+        self.assertEqual(len(self.ll), 2)
+
+    def test_sort(self):
+        """Is a list sorted in place, stably, like list.sort()?"""
+        self.ll.sort()
+        self.__compare_with_list(self.ll, [])
+        self.ll = SinglyLinkedList([1])
+        self.ll.sort()
+        self.__compare_with_list(self.ll, [1])
+
+        randomiser = random.Random(11)
+        for length in (2, 3, 7, 64, 100, 1000):
+            values = [(randomiser.randrange(10), i) for i in range(length)]
+            for key in (None, lambda value: value[0]):
+                for reverse in (False, True):
+                    self.ll = SinglyLinkedList(values, index_stride=8)
+                    self.ll[length // 2]
+                    nodes = set(id(node) for node in self.__nodes(self.ll))
+                    self.ll.sort(key=key, reverse=reverse)
+                    expected = sorted(values, key=key, reverse=reverse)
+                    self.__compare_with_list(self.ll, expected)
+                    self.assertEqual(self.ll.tail.value, expected[-1])
+                    self.assertIsNone(self.ll.tail.next)
+                    self.assertEqual(self.ll[length // 2], expected[length // 2])
+                    self.assertEqual(set(id(node) for node in self.__nodes(self.ll)), nodes)
+
+    def test_sort_failure(self):
+        """Does a failed sort keep every node and value in the list?"""
+        values = [3, 'a', 1, 2, 5]
+        self.ll = SinglyLinkedList(values)
+        nodes = set(id(node) for node in self.__nodes(self.ll))
+        self.assertRaises(TypeError, self.ll.sort)
+        self.assertEqual(sorted(self.ll, key=str), sorted(values, key=str))
+        self.assertEqual(len(self.ll), len(values))
+        self.assertEqual(set(id(node) for node in self.__nodes(self.ll)), nodes)
+        self.assertIsNone(self.ll.tail.next)
+
+        randomiser = random.Random(13)
+        for length in (2, 3, 7, 64, 100):
+            values = list(range(length))
+            randomiser.shuffle(values)
+            values[randomiser.randrange(length)] = 'a'
+            for reverse in (False, True):
+                self.ll = SinglyLinkedList(values)
+                self.assertRaises(TypeError, self.ll.sort, key=lambda value: value,
+                                  reverse=reverse)
+                self.assertEqual(sorted(self.ll, key=str), sorted(values, key=str))
+                self.assertEqual(len(self.ll), length)
+                self.assertIs(self.__nodes(self.ll)[-1], self.ll.tail)
+
+        self.ll = SinglyLinkedList([1, 2, 'x'])
+        self.assertRaises(TypeError, self.ll.sort, key=lambda value: value + 1)
+        self.__compare_with_list(self.ll, [1, 2, 'x'])
+
+    def test_insert_sorted(self):
+        """Is a value inserted after the values it does not sort before?"""
+        self.assertEqual(self.ll.insert_sorted(2), 0)
+        self.assertEqual(self.ll.insert_sorted(1), 0)
+        self.assertEqual(self.ll.insert_sorted(3), 2)
+        self.assertEqual(self.ll.insert_sorted(2), 2)
+        self.__compare_with_list(self.ll, [1, 2, 2, 3])
+        self.assertEqual(self.ll.tail.value, 3)
+
+        self.ll = SinglyLinkedList(['a', 'ccc', 'bb'])
+        self.ll.sort(key=len, reverse=True)
+        self.assertEqual(self.ll.insert_sorted('xx', key=len, reverse=True), 2)
+        self.__compare_with_list(self.ll, ['ccc', 'bb', 'xx', 'a'])
+
+    def test_merge_sorted(self):
+        """Are the nodes of two sorted lists merged, stably, into one?"""
+        self.ll = SinglyLinkedList([(1, 'a'), (3, 'a'), (5, 'a')])
+        other = SinglyLinkedList([(0, 'b'), (3, 'b'), (6, 'b'), (7, 'b')], index_stride=2)
+        other[3]
+        other_nodes = set(id(node) for node in self.__nodes(other))
+        self.ll.merge_sorted(other, key=lambda value: value[0])
+        self.__compare_with_list(self.ll, [
+            (0, 'b'), (1, 'a'), (3, 'a'), (3, 'b'), (5, 'a'), (6, 'b'), (7, 'b')])
+        self.assertEqual(self.ll.tail.value, (7, 'b'))
+        self.assertTrue(other_nodes <= set(id(node) for node in self.__nodes(self.ll)))
+        self.__compare_with_list(other, [])
+        other.append((8, 'b'))
+        self.assertEqual(other[0], (8, 'b'))
+
+        self.ll = SinglyLinkedList([1, 2])
+        self.ll.merge_sorted(SinglyLinkedList([3, 4]))
+        self.__compare_with_list(self.ll, [1, 2, 3, 4])
+        self.ll.merge_sorted(SinglyLinkedList([0]))
+        self.__compare_with_list(self.ll, [0, 1, 2, 3, 4])
+        self.ll.merge_sorted(SinglyLinkedList())
+        self.assertEqual(self.ll.tail.value, 4)
+        empty = SinglyLinkedList()
+        empty.merge_sorted(self.ll)
+        self.__compare_with_list(empty, [0, 1, 2, 3, 4])
+
+        self.ll = SinglyLinkedList([5, 3, 1])
+        self.ll.merge_sorted(SinglyLinkedList([4, 2]), reverse=True)
+        self.__compare_with_list(self.ll, [5, 4, 3, 2, 1])
+
+        self.assertRaises(ValueError, self.ll.merge_sorted, self.ll)
+        self.assertRaises(TypeError, self.ll.merge_sorted, [1])
+
+        # A failed merge moves every node of `other` over all the same
+        self.ll = SinglyLinkedList([1, 3, 5])
+        other = SinglyLinkedList([2, 'a', 4])
+        self.assertRaises(TypeError, self.ll.merge_sorted, other)
+        self.assertEqual(sorted(self.ll, key=str), [1, 2, 3, 4, 5, 'a'])
+        self.assertEqual(len(self.ll), 6)
+        self.assertIs(self.__nodes(self.ll)[-1], self.ll.tail)
+        self.__compare_with_list(other, [])
+
+    def test_find_cycle(self):
+        """Are cycles found, with where they start and how long they are?"""
+        self.assertFalse(self.ll.has_cycle())
+        self.assertIsNone(self.ll.find_cycle())
+
+        for length in range(1, 12):
+            for start in range(length):
+                self.ll = SinglyLinkedList(range(length))
+                self.assertFalse(self.ll.has_cycle())
+                self.ll.tail.next = self.ll._node_at(start)
+                self.assertTrue(self.ll.has_cycle())
+                self.assertEqual(self.ll.find_cycle(), (start, length - start))
+
+    def test_checked(self):
+        """Do checked lists raise CycleError instead of looping forever?"""
+        self.ll = SinglyLinkedList(range(5))
+        self.ll.checked = True
+        self.assertEqual(list(self.ll), [0, 1, 2, 3, 4])
+        self.ll.tail.next = self.ll.head.next
+
+        self.assertRaises(CycleError, iter, self.ll)
+        self.assertRaises(CycleError, self.ll.reverse)
+        self.assertRaises(CycleError, self.ll.count, 0)
+        self.assertRaises(CycleError, self.ll.__contains__, -1)
+        self.assertRaises(CycleError, self.ll.remove_last_occurence, 0)
+        self.assertRaises(CycleError, self.ll.sort)
+        self.assertRaises(CycleError, self.ll.merge_sorted, SinglyLinkedList([2]))
+        self.assertRaises(CycleError, SinglyLinkedList([2]).merge_sorted, self.ll)
+        self.assertRaises(CycleError, self.ll.__eq__, SinglyLinkedList(range(5)))
+        self.assertRaises(CycleError, str, self.ll)
+        self.assertRaises(CycleError, format, self.ll, '3')
+        self.assertRaises(CycleError, self.ll.fingerprint)
+        self.assertEqual(len(self.ll), 5)
+        self.assertTrue(issubclass(CycleError, ValueError))
+
+        # Without checks, rendering still stops once the cycle is found
+        self.ll.checked = False
+        self.assertRaises(CycleError, str, self.ll)
+        self.assertEqual(self.ll.head.value, 0)
+
+    def test_map_inplace(self):
+        """Are the values replaced without replacing their nodes?"""
+        self.ll = SinglyLinkedList([1, 2, 3])
+        head = self.ll.head
+        self.ll.map_inplace(lambda value: value * 2)
+        self.__compare_with_list(self.ll, [2, 4, 6])
+        self.assertIs(self.ll.head, head)
+
+    def test_filter_inplace(self):
+        """Are only the values passing the predicate kept?"""
+        self.ll = SinglyLinkedList(range(6))
+        self.assertEqual(self.ll.filter_inplace(lambda value: value % 3), 2)
+        self.__compare_with_list(self.ll, [1, 2, 4, 5])
+        self.assertEqual(len(self.ll), 4)
+
     def test_remove_head(self):
         """Does remove_head() behave as expected?"""
         self.assertFalse(self.ll.remove_head())
@@ -262,6 +566,14 @@ class SinglyLinkedListTestCase(unittest.TestCase):
         self.assertIsNone(self.ll.tail.next)
         self.assertEqual(self.ll.tail, self.ll.head)
 
+        self.ll = SinglyLinkedList(range(10), index_stride=3)
+        for length in range(9, -1, -1):
+            self.assertTrue(self.ll.remove_tail())
+            self.__compare_with_list(self.ll, list(range(length)))
+            if length:
+                self.assertEqual(self.ll.tail.value, length - 1)
+                self.assertIsNone(self.ll.tail.next)
+
     def test_reverse(self):
         """Is a linked list reversed as expected?"""
         self.ll.reverse()
@@ -280,6 +592,59 @@ class SinglyLinkedListTestCase(unittest.TestCase):
             self.ll.reverse()
             self.__compare_with_list(self.ll, values[::-1])
 
+    def test_splice(self):
+        """Are the nodes of another list moved over by splice()?"""
+        values = [1, 2, 3]
+        other = SinglyLinkedList(values)
+        other_tail = other.tail
+        self.ll.splice(other)
+        self.assertEqual(len(self.ll), len(values))
+        self.assertIs(self.ll.tail, other_tail)
+        self.__compare_with_list(self.ll, values)
+        self.assertIsNone(other.head)
+        self.assertIsNone(other.tail)
+        self.assertEqual(len(other), 0)
+
+        self.ll.splice(SinglyLinkedList())
+        self.__compare_with_list(self.ll, values)
+
+        other = SinglyLinkedList([4, 5])
+        self.ll.splice(other)
+        self.assertEqual(len(self.ll), 5)
+        self.__compare_with_list(self.ll, [1, 2, 3, 4, 5])
+        self.ll.append(6)
+        self.assertIsNone(other.head)
+        self.assertEqual(len(other), 0)
+
+        self.assertRaises(ValueError, self.ll.splice, self.ll)
+        self.assertRaises(TypeError, self.ll.splice, [7])
+        self.assertEqual(len(self.ll), 6)
+
+    def test_concat(self):
+        """Does concat() return a new list, leaving both operands untouched?"""
+        self.ll = SinglyLinkedList([1, 2])
+        other = SinglyLinkedList([3, 4])
+        concatenated = self.ll.concat(other)
+        self.assertEqual(len(concatenated), 4)
+        self.__compare_with_list(concatenated, [1, 2, 3, 4])
+        self.__compare_with_list(self.ll, [1, 2])
+        self.__compare_with_list(other, [3, 4])
+        self.assertIsNot(concatenated.head, self.ll.head)
+        self.assertIsNot(concatenated.tail, other.tail)
+
+        concatenated.remove_tail()
+        self.__compare_with_list(other, [3, 4])
+
+    def test_copies_configured_alike(self):
+        """Do the copying methods keep the pool and index stride of the list?"""
+        pool = NodePool()
+        self.ll = SinglyLinkedList([1, 2, 3], pool=pool, index_stride=2)
+        copies = [self.ll.concat([4]), self.ll + [4], [0] + self.ll, self.ll[::2],
+                  self.ll.view().map(str).materialize()]
+        for copy in copies:
+            self.assertIs(copy.pool, pool)
+            self.assertEqual(copy.index_stride, 2)
+
     def test_add(self):
         """Does the __add__() operator return the expected output?"""
         values = [1, 2, 3, 4, 5]
@@ -289,8 +654,17 @@ class SinglyLinkedListTestCase(unittest.TestCase):
         self.assertEqual(self_length_before, self_length_after)
         self.assertEqual(len(new_ll), self_length_before + len(values))
 
-    def test_iadd(self):
-        """Does the __iadd__() special method return the expected output?"""
+        self.ll = SinglyLinkedList([0])
+        other = SinglyLinkedList(values)
+        new_ll = self.ll + other
+        self.__compare_with_list(new_ll, [0] + values)
+        self.assertEqual(len(new_ll), len(values) + 1)
+        new_ll.append(6)
+        self.__compare_with_list(self.ll, [0])
+        self.__compare_with_list(other, values)
+
+    def test_radd(self):
+        """Does the __radd__() operator keep the left operand's values first?"""
         values = [1, 2, 3, 4, 5]
         self_length_before = len(self.ll)
         new_ll = values + self.ll
@@ -298,6 +672,31 @@ class SinglyLinkedListTestCase(unittest.TestCase):
         self.assertEqual(self_length_before, self_length_after)
         self.assertEqual(len(new_ll), self_length_before + len(values))
 
+        self.ll = SinglyLinkedList([6])
+        new_ll = values + self.ll
+        self.__compare_with_list(new_ll, values + [6])
+        self.__compare_with_list(self.ll, [6])
+
+    def test_iadd(self):
+        """Does the __iadd__() special method extend the list in place?"""
+        values = [1, 2, 3]
+        ll = self.ll
+        self.ll += values
+        self.assertIs(self.ll, ll)
+        self.assertEqual(len(self.ll), len(values))
+        self.__compare_with_list(self.ll, values)
+
+        other = SinglyLinkedList([4, 5])
+        self.ll += other
+        self.assertEqual(len(self.ll), 5)
+        self.__compare_with_list(self.ll, [1, 2, 3, 4, 5])
+        self.assertIsNone(other.head)
+        self.assertEqual(len(other), 0)
+
+        self.ll += self.ll
+        self.assertEqual(len(self.ll), 10)
+        self.__compare_with_list(self.ll, [1, 2, 3, 4, 5] * 2)
+
     def test_eq_ne(self):
         """Does the __eq__ and __ne__ behave and return the expected results?"""
         other = SinglyLinkedList()
@@ -335,6 +734,76 @@ class SinglyLinkedListTestCase(unittest.TestCase):
         other = SinglyLinkedList([1, 2, 3, 4])
         self.assertNotEqual(self.ll, other)
 
+    def test_eq_short_circuits(self):
+        """Are lists of different lengths or fingerprints unequal without a walk?"""
+        compared = []
+
+        class Value(object):
+            def __init__(self, value):
+                self.value = value
+            def __eq__(self, other):
+                compared.append(self)
+                return self.value == other.value
+            def __ne__(self, other):
+                return not self == other
+            def __hash__(self):
+                return hash(self.value)
+
+        self.ll = SinglyLinkedList(Value(value) for value in [1, 2, 3])
+        other = SinglyLinkedList(Value(value) for value in [1, 2, 3, 1])
+        self.assertNotEqual(self.ll, other)
+        self.assertEqual(compared, [])
+
+        other.remove_tail()
+        other[1] = Value(4)
+        self.ll.fingerprint()
+        other.fingerprint()
+        self.assertNotEqual(self.ll, other)
+        self.assertEqual(compared, [])
+
+        other[1] = Value(2)
+        other.fingerprint()
+        self.assertEqual(self.ll, other)
+        self.assertTrue(compared)
+
+    def test_fingerprint(self):
+        """Is the fingerprint kept up to date at the ends and dropped otherwise?"""
+        self.assertEqual(self.ll.fingerprint(), SinglyLinkedList().fingerprint())
+
+        self.ll.append(2)
+        self.ll.prepend(1)
+        self.ll.append(3)
+        self.assertIsNotNone(self.ll._fingerprint)
+        self.assertEqual(self.ll.fingerprint(), SinglyLinkedList([1, 2, 3]).fingerprint())
+        self.assertNotEqual(self.ll.fingerprint(), SinglyLinkedList([3, 2, 1]).fingerprint())
+        self.assertNotEqual(self.ll.fingerprint(), SinglyLinkedList([1, 2]).fingerprint())
+
+        mutators = [
+            lambda ll: ll.extend([4]),
+            lambda ll: ll.splice(SinglyLinkedList([4])),
+            lambda ll: ll.insert(1, 4),
+            lambda ll: ll.remove_first_occurence(2),
+            lambda ll: ll.remove_if(lambda value: value == 2),
+            lambda ll: ll.remove_head(),
+            lambda ll: ll.remove_tail(),
+            lambda ll: ll.reverse(),
+            lambda ll: ll.sort(reverse=True),
+            lambda ll: ll.map_inplace(str),
+            lambda ll: ll.__setitem__(0, 4),
+            lambda ll: ll.__setitem__(slice(None, None, 2), [4, 5]),
+            lambda ll: ll.__delitem__(0),
+        ]
+        for mutator in mutators:
+            self.ll = SinglyLinkedList([1, 2, 3])
+            self.ll.fingerprint()
+            mutator(self.ll)
+            self.assertIsNone(self.ll._fingerprint)
+            self.assertEqual(self.ll.fingerprint(), SinglyLinkedList(self.ll).fingerprint())
+
+        self.ll.append([])
+        self.assertIsNone(self.ll._fingerprint)
+        self.assertRaises(TypeError, self.ll.fingerprint)
+
     def test_iter(self):
         """Does the iteration protocol work correctly?"""
         for value in self.ll:
@@ -389,6 +858,227 @@ class SinglyLinkedListTestCase(unittest.TestCase):
             self.ll = SinglyLinkedList(values)
             self.assertEqual(repr(self.ll), expected)
 
+    def test_str(self):
+        """Is a linked list rendered correctly by __str__(), with and without a limit?"""
+        self.assertEqual(str(self.ll), '[None]')
+
+        self.ll = SinglyLinkedList([1, 2, 3])
+        self.assertEqual(str(self.ll), '[1 -> 2 -> 3 -> None]')
+
+        self.ll.repr_limit = 2
+        self.assertEqual(str(self.ll), '[1 -> 2 -> ...]')
+        self.assertEqual(repr(self.ll), 'SinglyLinkedList([1, 2, ...])')
+
+        self.ll.repr_limit = 3
+        self.assertEqual(str(self.ll), '[1 -> 2 -> 3 -> None]')
+        self.assertEqual(repr(self.ll), 'SinglyLinkedList([1, 2, 3])')
+
+    def test_format(self):
+        """Does __format__() limit the number of values rendered?"""
+        self.ll = SinglyLinkedList(range(1000))
+        self.assertEqual(format(self.ll), str(self.ll))
+        self.assertEqual('{:2}'.format(self.ll), '[0 -> 1 -> ...]')
+        self.assertEqual(format(self.ll, '0'), '[...]')
+        self.assertRaises(ValueError, format, self.ll, 'x')
+
+    def test_contains_count(self):
+        """Are membership and counts answered by scanning the list?"""
+        self.assertNotIn(1, self.ll)
+        self.assertEqual(self.ll.count(1), 0)
+
+        self.ll = SinglyLinkedList([1, 2, 1, None])
+        self.assertIn(1, self.ll)
+        self.assertIn(None, self.ll)
+        self.assertNotIn(3, self.ll)
+        self.assertEqual(self.ll.count(1), 2)
+        self.assertEqual(self.ll.count(2), 1)
+        self.assertEqual(self.ll.count(3), 0)
+
+    def test_pickle(self):
+        """Is a list pickled as a flat sequence of values, however long?"""
+        self.ll = SinglyLinkedList(range(100000), index_stride=16)
+        unpickled = pickle.loads(pickle.dumps(self.ll, pickle.HIGHEST_PROTOCOL))
+        self.assertIsInstance(unpickled, SinglyLinkedList)
+        self.assertEqual(unpickled, self.ll)
+        self.assertEqual(len(unpickled), len(self.ll))
+        self.assertEqual(unpickled.tail.value, 99999)
+        self.assertEqual(unpickled.index_stride, 16)
+
+        self.ll = SinglyLinkedList([1, 2], pool=NodePool())
+        unpickled = pickle.loads(pickle.dumps(self.ll))
+        self.__compare_with_list(unpickled, [1, 2])
+        self.assertIsNone(unpickled.pool)
+
+        self.assertEqual(len(pickle.loads(pickle.dumps(SinglyLinkedList()))), 0)
+
+    def test_sizeof(self):
+        """Does sys.getsizeof() account for the list and its nodes?"""
+        empty_size = sys.getsizeof(self.ll)
+        node_size = sys.getsizeof(_SinglyNode())
+
+        self.ll = SinglyLinkedList(range(100))
+        self.assertEqual(sys.getsizeof(self.ll), empty_size + 100 * node_size)
+        self.ll.remove_head()
+        self.assertEqual(sys.getsizeof(self.ll), empty_size + 99 * node_size)
+
+    def test_memory_usage(self):
+        """Does memory_usage() count every object once?"""
+        self.assertEqual(self.ll.memory_usage(), sys.getsizeof(self.ll))
+
+        values = ['a' * 100, 'b' * 100]
+        self.ll = SinglyLinkedList(values * 3)
+        shallow = self.ll.memory_usage()
+        self.assertEqual(shallow, sys.getsizeof(self.ll))
+        self.assertEqual(self.ll.memory_usage(deep=True),
+                         shallow + sum(sys.getsizeof(value) for value in values))
+
+        # Two lists sharing a suffix of nodes are counted together only once
+        other = SinglyLinkedList([0])
+        other.head.next = self.ll.head.next
+        seen = set()
+        total = self.ll.memory_usage(seen=seen) + other.memory_usage(seen=seen)
+        self.assertEqual(total, shallow + sys.getsizeof(other))
+        self.assertGreater(other.memory_usage(), sys.getsizeof(other))
+
+        # A cycle does not make it loop forever
+        self.ll.tail.next = self.ll.head
+        self.assertEqual(self.ll.memory_usage(), shallow)
+
+    def test_getitem(self):
+        """Are values read by position and slice like for a list?"""
+        self.assertRaises(IndexError, self.ll.__getitem__, 0)
+
+        values = list(range(20))
+        for index_stride in (None, 1, 3):
+            self.ll = SinglyLinkedList(values, index_stride=index_stride)
+            for index in range(-len(values), len(values)):
+                self.assertEqual(self.ll[index], values[index])
+            self.assertRaises(IndexError, self.ll.__getitem__, len(values))
+            self.assertRaises(IndexError, self.ll.__getitem__, -len(values) - 1)
+            self.assertRaises(TypeError, self.ll.__getitem__, 'a')
+
+            for key in (slice(None), slice(2, 9), slice(None, None, 3),
+                        slice(15, 2, -4), slice(None, None, -1), slice(5, 5),
+                        slice(-3, None), slice(100, 200)):
+                sliced = self.ll[key]
+                self.assertIsInstance(sliced, SinglyLinkedList)
+                self.__compare_with_list(sliced, values[key])
+                self.assertEqual(len(sliced), len(values[key]))
+
+        self.assertRaises(ValueError, SinglyLinkedList, index_stride=0)
+
+    def test_setitem(self):
+        """Are values replaced by position and slice like for a list?"""
+        values = list(range(10))
+        for index_stride in (None, 2):
+            self.ll = SinglyLinkedList(values, index_stride=index_stride)
+            expected = list(values)
+            for index, value in ((0, 'a'), (-1, 'b'), (4, 'c')):
+                self.ll[index] = value
+                expected[index] = value
+            self.__compare_with_list(self.ll, expected)
+            self.assertRaises(IndexError, self.ll.__setitem__, 10, 'x')
+
+            for key, replacement in ((slice(1, 3), ['x', 'y', 'z']),
+                                     (slice(0, 4), []),
+                                     (slice(None, None, 2), list('abcd')),
+                                     (slice(None, None, -3), list('123')),
+                                     (slice(len(expected), None), ['end']),
+                                     (slice(0, 0), ['start']),
+                                     (slice(None), list(range(5)))):
+                self.ll[key] = replacement
+                expected[key] = replacement
+                self.__compare_with_list(self.ll, expected)
+                self.assertEqual(len(self.ll), len(expected))
+
+            self.assertRaises(ValueError, self.ll.__setitem__, slice(None, None, 2), [1])
+
+    def test_delitem(self):
+        """Are values deleted by position and slice like from a list?"""
+        values = list(range(20))
+        for index_stride in (None, 4):
+            for key in (0, -1, 7, slice(None), slice(3, 8), slice(None, None, 3),
+                        slice(18, 1, -5), slice(-4, None), slice(5, 5)):
+                self.ll = SinglyLinkedList(values, index_stride=index_stride)
+                self.ll[15]  # build the sparse index
+                expected = list(values)
+                del self.ll[key]
+                del expected[key]
+                self.__compare_with_list(self.ll, expected)
+                self.assertEqual(len(self.ll), len(expected))
+                if expected:
+                    self.assertEqual(self.ll.tail.value, expected[-1])
+                    self.assertEqual(self.ll[-1], expected[-1])
+                else:
+                    self.assertIsNone(self.ll.tail)
+
+        self.assertRaises(IndexError, SinglyLinkedList().__delitem__, 0)
+
+    def test_insert(self):
+        """Are values inserted by position like into a list?"""
+        expected = []
+        for index, value in ((0, 1), (5, 2), (-1, 3), (1, 4), (-10, 5), (2, 6)):
+            self.ll.insert(index, value)
+            expected.insert(index, value)
+            self.__compare_with_list(self.ll, expected)
+            self.assertEqual(len(self.ll), len(expected))
+            self.assertEqual(self.ll.tail.value, expected[-1])
+
+    def test_sparse_index(self):
+        """Does the sparse index stay right through every kind of mutation?"""
+        randomiser = random.Random(42)
+        for index_stride in (1, 2, 5):
+            self.ll = SinglyLinkedList(range(50), index_stride=index_stride)
+            self.assertEqual(self.ll.index_stride, index_stride)
+            expected = list(range(50))
+            for step in range(500):
+                operation = randomiser.randrange(9)
+                value = randomiser.randrange(10)
+                if operation == 0:
+                    self.ll.append(value)
+                    expected.append(value)
+                elif operation == 1:
+                    self.ll.prepend(value)
+                    expected.insert(0, value)
+                elif operation == 2 and expected:
+                    self.ll.remove_head()
+                    expected.pop(0)
+                elif operation == 3 and expected:
+                    self.ll.remove_tail()
+                    expected.pop()
+                elif operation == 4:
+                    if self.ll.remove_first_occurence(value):
+                        expected.remove(value)
+                elif operation == 5:
+                    if self.ll.remove_last_occurence(value):
+                        del expected[len(expected) - 1 - expected[::-1].index(value)]
+                elif operation == 6 and randomiser.random() < 0.2:
+                    self.ll.remove_all_occurences(value)
+                    expected = [v for v in expected if v != value]
+                elif operation == 7:
+                    index = randomiser.randrange(len(expected) + 1)
+                    self.ll.insert(index, value)
+                    expected.insert(index, value)
+                elif operation == 8 and randomiser.random() < 0.1:
+                    self.ll.reverse()
+                    expected.reverse()
+
+                self.assertEqual(len(self.ll), len(expected))
+                if expected:
+                    index = randomiser.randrange(len(expected))
+                    self.assertEqual(self.ll[index], expected[index])
+            self.__compare_with_list(self.ll, expected)
+            self.assertEqual([self.ll[i] for i in range(len(expected))], expected)
+
+    def __nodes(self, ll):
+        """Helper to collect the nodes of a linked list"""
+        nodes = []
+        current = ll.head
+        while current is not None:
+            nodes.append(current)
+            current = current.next
+        return nodes
+
     def __compare_with_list(self, ll, list_):
         """Helper to compare the values, order and size of a linked list with a list"""
         current = ll.head
@@ -397,10 +1087,74 @@ class SinglyLinkedListTestCase(unittest.TestCase):
             current = current.next
         self.assertIsNone(current)
 
+class NodePoolTestCase(unittest.TestCase):
+    """Tests for the ``NodePool`` class and lists that use one"""
+
+    def setUp(self):
+        self.pool = NodePool(max_size=2)
+        self.ll = SinglyLinkedList(pool=self.pool)
+        self.assertIs(self.ll.pool, self.pool)
+
+    def test_acquire_release(self):
+        """Are released nodes reset and handed out again?"""
+        node = self.pool.acquire(1)
+        self.assertEqual(node.value, 1)
+        self.assertEqual(self.pool.stats()['misses'], 1)
+
+        node.next = self.pool.acquire(2)
+        self.pool.release(node)
+        self.assertIsNone(node.value)
+        self.assertIsNone(node.next)
+        self.assertEqual(len(self.pool), 1)
+
+        self.assertIs(self.pool.acquire(3), node)
+        self.assertEqual(node.value, 3)
+        self.assertEqual(self.pool.stats()['hits'], 1)
+
+    def test_max_size(self):
+        """Are nodes beyond the maximum size discarded?"""
+        for _ in range(3):
+            self.pool.release(self.pool.acquire())
+            self.pool.release(self.pool.acquire())
+        for node in [self.pool.acquire() for _ in range(3)]:
+            self.pool.release(node)
+        self.assertEqual(len(self.pool), 2)
+        self.assertEqual(self.pool.stats()['discarded'], 1)
+
+        self.pool.clear()
+        self.assertEqual(len(self.pool), 0)
+
+    def test_list_recycles_nodes(self):
+        """Does a list give removed nodes back to its pool and reuse them?"""
+        self.ll.extend([1, 2, 3, 2, 4])
+        self.assertEqual(self.pool.stats()['misses'], 5)
+
+        head, tail = self.ll.head, self.ll.tail
+        self.assertTrue(self.ll.remove_tail())
+        self.assertTrue(self.ll.remove_head())
+        self.assertEqual(len(self.pool), 2)
+        self.assertIsNone(tail.value)
+
+        self.ll.append(5)
+        self.assertIs(self.ll.tail, head)
+        self.ll.prepend(0)
+        self.assertIs(self.ll.head, tail)
+        self.assertEqual(self.pool.stats()['hits'], 2)
+        self.assertEqual(list(self.ll), [0, 2, 3, 2, 5])
+
+        self.assertTrue(self.ll.remove_all_occurences(2))
+        self.assertTrue(self.ll.remove_last_occurence(5))
+        self.assertTrue(self.ll.remove_first_occurence(0))
+        self.assertEqual(list(self.ll), [3])
+        self.assertEqual(len(self.ll), 1)
+        self.assertEqual(len(self.pool), 2)
+        self.assertEqual(self.pool.stats()['discarded'], 2)
+
 def suite():
     suite = unittest.TestSuite()
     suite.addTest(unittest.TestLoader().loadTestsFromTestCase(SinglyNodeTestCase))
     suite.addTest(unittest.TestLoader().loadTestsFromTestCase(SinglyLinkedListTestCase))
+    suite.addTest(unittest.TestLoader().loadTestsFromTestCase(NodePoolTestCase))
     return suite
 
 if __name__ == '__main__':
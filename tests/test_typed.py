@@ -0,0 +1,165 @@
+import io
+import pickle
+import struct
+import sys
+import unittest
+from array import array
+from pylinkedlist import TypedSinglyLinkedList
+
+class TypedSinglyLinkedListTestCase(unittest.TestCase):
+    """Tests for the ``TypedSinglyLinkedList`` class"""
+
+    def setUp(self):
+        self.ll = TypedSinglyLinkedList('d', capacity=4)
+        self.assertEqual(len(self.ll), 0)
+
+    def test_ctor(self):
+        """Is a newly constructed list correcty initialised?"""
+        values = [1.0, 2.5, 3.0, 4.0, 5.5]
+        self.ll = TypedSinglyLinkedList('d', values, capacity=4)
+        self.assertEqual(self.ll.typecode, 'd')
+        self.assertEqual(self.ll.itemsize, array('d').itemsize)
+        self.assertEqual(list(self.ll), values)
+        self.assertEqual(len(self.ll), len(values))
+        self.assertIsInstance(self.ll.head.values, array)
+
+        self.assertRaises(ValueError, TypedSinglyLinkedList, 'x')
+        self.assertRaises(TypeError, TypedSinglyLinkedList, 'i', ['a'])
+
+    def test_operations(self):
+        """Do the list operations keep the values in typed blocks?"""
+        self.ll = TypedSinglyLinkedList('i', range(10), capacity=4)
+        self.ll.prepend(-1)
+        self.ll.append(10)
+        self.assertTrue(self.ll.remove_first_occurence(5))
+        self.assertTrue(self.ll.remove_last_occurence(10))
+        self.assertEqual(self.ll.remove_all_occurences(3), 1)
+        self.assertTrue(self.ll.remove_head())
+        self.assertTrue(self.ll.remove_tail())
+        self.ll.reverse()
+        self.assertEqual(list(self.ll), [8, 7, 6, 4, 2, 1, 0])
+        self.assertEqual(len(self.ll), 7)
+
+        current = self.ll.head
+        while current is not None:
+            self.assertIsInstance(current.values, array)
+            self.assertEqual(current.values.typecode, 'i')
+            current = current.next
+
+        # A value the blocks refuse leaves the list as it was
+        self.ll = TypedSinglyLinkedList('i', [1], capacity=4)
+        self.assertRaises(TypeError, self.ll.append_all, [2, 3, 'a'])
+        self.assertEqual(list(self.ll), [1])
+        self.assertEqual(len(self.ll), 1)
+
+    def test_concat_splice(self):
+        """Do the copying and moving methods keep the type code?"""
+        self.ll = TypedSinglyLinkedList('i', [1, 2])
+        concatenated = self.ll + [3]
+        self.assertEqual(concatenated.typecode, 'i')
+        self.assertEqual(list(concatenated), [1, 2, 3])
+        self.assertEqual(list([0] + self.ll), [0, 1, 2])
+
+        other = TypedSinglyLinkedList('i', [3, 4])
+        self.ll.splice(other)
+        self.assertEqual(list(self.ll), [1, 2, 3, 4])
+        self.assertEqual(len(other), 0)
+
+        self.assertRaises(ValueError, self.ll.splice, TypedSinglyLinkedList('d', [1.0]))
+
+    def test_aggregates(self):
+        """Do sum(), min() and max() work over the typed values?"""
+        values = [3.0, -1.5, 7.25, 0.0, 2.0]
+        self.ll.extend(values)
+        self.assertEqual(sum(self.ll), sum(values))
+        self.assertEqual(min(self.ll), min(values))
+        self.assertEqual(max(self.ll), max(values))
+
+    def test_bytes(self):
+        """Are the values exported as bytes in their machine representation?"""
+        self.assertEqual(bytes(self.ll), b'')
+
+        values = [1.0, 2.0, 3.0, 4.0, 5.0, 6.0]
+        self.ll.extend(values)
+        self.assertEqual(bytes(self.ll), struct.pack('{}d'.format(len(values)), *values))
+        self.assertEqual(self.ll.tobytes(), bytes(self.ll))
+
+    def test_frombytes(self):
+        """Are values appended from their machine representation?"""
+        self.ll.append_all([1.0, 2.0, 3.0])
+        self.ll.frombytes(array('d', range(4, 11)).tobytes())
+        self.assertEqual(list(self.ll), [float(value) for value in range(1, 11)])
+        self.assertEqual(len(self.ll), 10)
+        self.assertEqual([len(block) for block in self.ll.buffers()], [4, 4, 2])
+        self.assertRaises(ValueError, self.ll.frombytes, b'123')
+
+        # The tail block cannot grow while a view of it is alive
+        data = array('d', [11.0, 12.0, 13.0]).tobytes()
+        with list(self.ll.buffers())[-1]:
+            self.assertRaises(BufferError, self.ll.frombytes, data)
+            self.assertRaises(BufferError, self.ll.append_all, [11.0])
+        self.assertEqual(len(self.ll), 10)
+        self.assertEqual(list(self.ll), [float(value) for value in range(1, 11)])
+
+    def test_pickle(self):
+        """Is a list pickled as the bytes of its values?"""
+        self.ll = TypedSinglyLinkedList('i', range(5000), capacity=64)
+        data = pickle.dumps(self.ll, pickle.HIGHEST_PROTOCOL)
+        self.assertLess(len(data), 5000 * self.ll.itemsize + 200)
+        unpickled = pickle.loads(data)
+        self.assertEqual(unpickled, self.ll)
+        self.assertEqual(unpickled.typecode, 'i')
+        self.assertEqual(unpickled.capacity, 64)
+
+    def test_dump_load(self):
+        """Is a list read back as it was written?"""
+        self.ll.append_all([0.5, -1.5, 2.25, 1e300, 7.0])
+        stream = io.BytesIO()
+        self.ll.dump(stream)
+        stream.seek(0)
+        loaded = TypedSinglyLinkedList.load(stream, capacity=2)
+        self.assertEqual(list(loaded), [0.5, -1.5, 2.25, 1e300, 7.0])
+        self.assertEqual(loaded.typecode, 'd')
+        self.assertEqual(loaded.capacity, 2)
+
+        self.assertRaises(ValueError, TypedSinglyLinkedList.load, io.BytesIO(b'nope'))
+        stream.seek(0)
+        truncated = io.BytesIO(stream.read()[:-1])
+        self.assertRaises(ValueError, TypedSinglyLinkedList.load, truncated)
+
+    def test_load_other_byte_order(self):
+        """Are values written on a machine of the other byte order swapped?"""
+        values = array('h', [1, 256, -2])
+        swapped = array('h', values)
+        swapped.byteswap()
+        other_order = sys.byteorder != 'big'
+        stream = io.BytesIO(struct.pack('<4scBQ', b'PLLT', b'h', other_order, 3) +
+                            swapped.tobytes())
+        self.assertEqual(list(TypedSinglyLinkedList.load(stream)), [1, 256, -2])
+
+    def test_buffers(self):
+        """Do the block views share memory with the list?"""
+        self.ll.extend([1.0, 2.0, 3.0, 4.0, 5.0])
+        views = list(self.ll.buffers())
+        self.assertEqual([len(view) for view in views], [4, 1])
+        self.assertEqual(views[0].format, 'd')
+
+        views[0][0] = 42.0
+        self.assertEqual(self.ll.head.values[0], 42.0)
+        self.assertRaises(BufferError, self.ll.append, 6.0)
+
+        for view in views:
+            view.release()
+        self.ll.append(6.0)
+        self.assertEqual(list(self.ll), [42.0, 2.0, 3.0, 4.0, 5.0, 6.0])
+
+        # The values are not contiguous, so only the blocks export buffers
+        self.assertRaises(TypeError, memoryview, self.ll)
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.TestLoader().loadTestsFromTestCase(TypedSinglyLinkedListTestCase))
+    return suite
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,220 @@
+import pickle
+import unittest
+import warnings
+from pylinkedlist import TypedSinglyLinkedList, UnrolledLinkedList
+
+class UnrolledLinkedListTestCase(unittest.TestCase):
+    """Tests for the ``UnrolledLinkedList`` class"""
+
+    CAPACITY = 4
+
+    def setUp(self):
+        self.ll = UnrolledLinkedList(capacity=self.CAPACITY)
+        self.assertEqual(len(self.ll), 0)
+        assert self.ll.head is None
+        assert self.ll.tail is None
+
+    def test_ctor(self):
+        """Is a newly constructed list correcty initialised?"""
+        values = list(range(10))
+        self.ll = UnrolledLinkedList(values, capacity=self.CAPACITY)
+        self.assertEqual(self.ll.capacity, self.CAPACITY)
+        self.__check(self.ll, values)
+        self.assertEqual([len(block) for block in self.__blocks(self.ll)], [4, 4, 2])
+
+        self.assertRaises(ValueError, UnrolledLinkedList, capacity=1)
+
+    def test_append_all(self):
+        """Is the tail block topped up before new blocks are added?"""
+        self.ll.append_all([1, 2])
+        self.ll.append_all(iter(range(3, 8)))
+        self.__check(self.ll, list(range(1, 8)))
+        self.assertEqual([len(block) for block in self.__blocks(self.ll)], [4, 3])
+
+        self.ll.extend([])
+        self.__check(self.ll, list(range(1, 8)))
+
+        def failing(count):
+            for value in range(count):
+                yield value
+            raise RuntimeError('failing')
+
+        # Values taken from an iterable that raises are kept or dropped by block,
+        # and the length always agrees with the values kept
+        self.assertRaises(RuntimeError, self.ll.append_all, failing(1))
+        self.__check(self.ll, list(range(1, 8)) + [0])
+        self.assertRaises(RuntimeError, self.ll.append_all, failing(6))
+        self.__check(self.ll, list(range(1, 8)) + [0, 0, 1, 2, 3])
+        self.ll.append(9)
+        self.assertRaises(RuntimeError, self.ll.append_all, failing(2))
+        self.__check(self.ll, list(range(1, 8)) + [0, 0, 1, 2, 3, 9])
+
+    def test_append_prepend(self):
+        """Do append() and prepend() fill blocks up to their capacity?"""
+        for value in range(5):
+            self.ll.append(value)
+        self.__check(self.ll, [0, 1, 2, 3, 4])
+
+        for value in range(-1, -5, -1):
+            self.ll.prepend(value)
+        self.__check(self.ll, [-4, -3, -2, -1, 0, 1, 2, 3, 4])
+
+    def test_remove_first_occurence(self):
+        """Does remove_first_occurence() behave as expected?"""
+        self.assertFalse(self.ll.remove_first_occurence(1))
+
+        values = [1, 2, 3, 4, 5, 1, 2, 3]
+        self.ll = UnrolledLinkedList(values, capacity=self.CAPACITY)
+        self.assertTrue(self.ll.remove_first_occurence(2))
+        values.remove(2)
+        self.__check(self.ll, values)
+
+        for value in list(values):
+            self.assertTrue(self.ll.remove_first_occurence(value))
+            values.remove(value)
+            self.__check(self.ll, values)
+        self.assertIsNone(self.ll.head)
+        self.assertIsNone(self.ll.tail)
+
+    def test_remove_last_occurence(self):
+        """Does remove_last_occurence() behave as expected?"""
+        self.assertFalse(self.ll.remove_last_occurence(1))
+
+        values = [1, 2, 3, 4, 5, 1, 2, 3]
+        self.ll = UnrolledLinkedList(values, capacity=self.CAPACITY)
+        self.assertTrue(self.ll.remove_last_occurence(1))
+        self.__check(self.ll, [1, 2, 3, 4, 5, 2, 3])
+        self.assertTrue(self.ll.remove_last_occurence(3))
+        self.__check(self.ll, [1, 2, 3, 4, 5, 2])
+        self.assertFalse(self.ll.remove_last_occurence(42))
+
+    def test_remove_all_occurences(self):
+        """Does remove_all_occurences() behave as expected?"""
+        values = [1, 2, 1, 1, 1, 3, 1, 1, 1, 1, 4, 1]
+        self.ll = UnrolledLinkedList(values, capacity=self.CAPACITY)
+        self.assertEqual(self.ll.remove_all_occurences(1), values.count(1))
+        self.__check(self.ll, [2, 3, 4])
+        self.assertEqual(self.ll.remove_all_occurences(1), 0)
+        self.assertEqual(self.ll.remove_all_occurences(2), 1)
+        self.assertEqual(self.ll.remove_all_occurences(3), 1)
+        self.assertEqual(self.ll.remove_all_occurences(4), 1)
+        self.__check(self.ll, [])
+
+    def test_remove_head_tail(self):
+        """Are both ends removed as expected?"""
+        self.assertFalse(self.ll.remove_head())
+        self.assertFalse(self.ll.remove_tail())
+
+        values = list(range(10))
+        self.ll = UnrolledLinkedList(values, capacity=self.CAPACITY)
+        while values:
+            self.assertTrue(self.ll.remove_tail())
+            values.pop()
+            self.__check(self.ll, values)
+            if values:
+                self.assertTrue(self.ll.remove_head())
+                values.pop(0)
+                self.__check(self.ll, values)
+        self.assertIsNone(self.ll.head)
+        self.assertIsNone(self.ll.tail)
+
+    def test_reverse(self):
+        """Is a linked list reversed as expected?"""
+        self.ll.reverse()
+        self.__check(self.ll, [])
+
+        for length in (1, 2, 4, 5, 9):
+            values = list(range(length))
+            self.ll = UnrolledLinkedList(values, capacity=self.CAPACITY)
+            self.ll.reverse()
+            self.__check(self.ll, values[::-1])
+
+    def test_splice_concat(self):
+        """Do splice(), concat() and the arithmetic operators behave as expected?"""
+        self.ll = UnrolledLinkedList([1, 2], capacity=self.CAPACITY)
+        other = UnrolledLinkedList([3, 4, 5, 6, 7], capacity=self.CAPACITY)
+        self.ll.splice(other)
+        self.__check(self.ll, [1, 2, 3, 4, 5, 6, 7])
+        self.__check(other, [])
+        self.assertRaises(ValueError, self.ll.splice, self.ll)
+
+        self.__check(self.ll + [8], [1, 2, 3, 4, 5, 6, 7, 8])
+        self.__check([0] + self.ll, [0, 1, 2, 3, 4, 5, 6, 7])
+        self.__check(self.ll, [1, 2, 3, 4, 5, 6, 7])
+
+        self.ll += [8]
+        self.__check(self.ll, [1, 2, 3, 4, 5, 6, 7, 8])
+
+        # The array blocks of a typed list would only take numbers
+        typed = TypedSinglyLinkedList('d', [1.5])
+        self.assertRaises(TypeError, self.ll.splice, typed)
+        self.ll += typed
+        self.ll.append('x')
+        self.__check(self.ll, [1, 2, 3, 4, 5, 6, 7, 8, 1.5, 'x'])
+        self.assertEqual(list(typed), [1.5])
+
+    def test_pickle(self):
+        """Is a list pickled with its capacity?"""
+        self.ll.append_all(range(10))
+        unpickled = pickle.loads(pickle.dumps(self.ll))
+        self.assertEqual(unpickled, self.ll)
+        self.assertEqual(unpickled.capacity, self.CAPACITY)
+
+    def test_eq_ne(self):
+        """Does __eq__ and __ne__ compare values irrespective of block layout?"""
+        self.assertEqual(self.ll, UnrolledLinkedList())
+        self.assertNotEqual(self.ll, UnrolledLinkedList([1]))
+
+        values = list(range(10))
+        self.ll = UnrolledLinkedList(values, capacity=self.CAPACITY)
+        self.assertEqual(self.ll, UnrolledLinkedList(values, capacity=3))
+        self.assertNotEqual(self.ll, UnrolledLinkedList(values[::-1]))
+
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            self.assertTrue(UnrolledLinkedList([1, 2]) != 5)
+            self.assertFalse(UnrolledLinkedList([1, 2]) == 5)
+
+    def test_str_repr(self):
+        """Is a linked list rendered as expected, with and without a limit?"""
+        self.assertEqual(str(self.ll), '[]')
+        self.assertEqual(repr(self.ll), 'UnrolledLinkedList()')
+
+        self.ll = UnrolledLinkedList([1, 2, 3])
+        self.assertEqual(str(self.ll), '[1, 2, 3]')
+        self.assertEqual(repr(self.ll), 'UnrolledLinkedList([1, 2, 3])')
+        self.assertEqual('{:2}'.format(self.ll), '[1, 2, ...]')
+
+        self.ll.repr_limit = 1
+        self.assertEqual(repr(self.ll), 'UnrolledLinkedList([1, ...])')
+
+    def __blocks(self, ll):
+        """Helper to collect the blocks of a linked list"""
+        blocks = []
+        current = ll.head
+        while current is not None:
+            blocks.append(list(current.values))
+            current = current.next
+        return blocks
+
+    def __check(self, ll, list_):
+        """Helper to compare a linked list with a list and check its invariants"""
+        self.assertEqual(list(ll), list_)
+        self.assertEqual(len(ll), len(list_))
+
+        blocks = self.__blocks(ll)
+        for block in blocks:
+            self.assertTrue(0 < len(block) <= ll.capacity)
+        if blocks:
+            self.assertEqual(list(ll.tail.values), blocks[-1])
+            self.assertIsNone(ll.tail.next)
+        else:
+            self.assertIsNone(ll.tail)
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.TestLoader().loadTestsFromTestCase(UnrolledLinkedListTestCase))
+    return suite
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+import unittest
+from pylinkedlist import (DoublyLinkedList, LinkedListView, SinglyLinkedList,
+                          TypedSinglyLinkedList)
+
+class LinkedListViewTestCase(unittest.TestCase):
+    """Tests for the ``LinkedListView`` class and the ``view()`` methods"""
+
+    def setUp(self):
+        self.ll = SinglyLinkedList(range(10))
+
+    def test_pipeline(self):
+        """Are the steps run in order over the values?"""
+        view = self.ll.view().filter(lambda value: value % 2).map(lambda value: value * 10)
+        self.assertIsInstance(view, LinkedListView)
+        self.assertEqual(list(view), [10, 30, 50, 70, 90])
+        self.assertEqual(view.take(2).tolist(), [10, 30])
+        self.assertEqual(view.skip(3).tolist(), [70, 90])
+        self.assertEqual(self.ll.view().take_while(lambda value: value < 3).tolist(), [0, 1, 2])
+        self.assertEqual(self.ll.view().skip_while(lambda value: value < 8).tolist(), [8, 9])
+        self.assertEqual(self.ll.view().skip(8).concat([10]).tolist(), [8, 9, 10])
+
+    def test_lazy(self):
+        """Are values only computed when they are needed?"""
+        seen = []
+        def record(value):
+            seen.append(value)
+            return value
+        view = self.ll.view().map(record)
+        self.assertEqual(seen, [])
+        self.assertEqual(view.take(3).tolist(), [0, 1, 2])
+        self.assertEqual(seen, [0, 1, 2])
+
+    def test_views_are_independent(self):
+        """Does extending a view leave it untouched, and does it see later changes?"""
+        view = self.ll.view().take(2)
+        mapped = view.map(str)
+        self.assertEqual(view.tolist(), [0, 1])
+        self.assertEqual(mapped.tolist(), ['0', '1'])
+        self.ll.prepend(-1)
+        self.assertEqual(view.tolist(), [-1, 0])
+
+    def test_materialize(self):
+        """Is a view materialised into a list of the type of its source?"""
+        materialized = self.ll.view().take(3).materialize()
+        self.assertIsInstance(materialized, SinglyLinkedList)
+        self.assertEqual(list(materialized), [0, 1, 2])
+        self.assertEqual(len(materialized), 3)
+
+        doubly = DoublyLinkedList([1, 2]).view().map(lambda value: -value).materialize()
+        self.assertIsInstance(doubly, DoublyLinkedList)
+        self.assertEqual(list(reversed(doubly)), [-2, -1])
+
+        typed = TypedSinglyLinkedList('d', [1.0, 2.0], capacity=8).view().materialize()
+        self.assertEqual(typed.typecode, 'd')
+        self.assertEqual(typed.capacity, 8)
+
+        self.assertEqual(LinkedListView(range(3)).materialize(), [0, 1, 2])
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.TestLoader().loadTestsFromTestCase(LinkedListViewTestCase))
+    return suite
+
+if __name__ == '__main__':
+    unittest.main()